@@ -4,3 +4,6 @@ import typing
 class Committer(typing.Protocol):
     async def commit(self) -> None:
         raise NotImplementedError
+
+    async def rollback(self) -> None:
+        raise NotImplementedError
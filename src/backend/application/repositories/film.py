@@ -1,4 +1,6 @@
+import datetime
 import typing
+from collections.abc import Sequence
 
 from backend.domain.film import Film
 from backend.domain.film_id import FilmId
@@ -12,8 +14,22 @@ class FilmRepository(typing.Protocol):
     async def get_by_id(self, film_id: FilmId) -> Film:
         raise NotImplementedError
 
+    async def get_by_ids(self, films_ids: Sequence[FilmId]) -> list[Film]:
+        raise NotImplementedError
+
+    async def get_catalog_changes(
+        self, after: tuple[datetime.datetime, FilmId] | None, limit: int
+    ) -> list[tuple[Film, datetime.datetime]]:
+        raise NotImplementedError
+
+    async def upsert_many(self, films: Sequence[Film], update_existing: bool = True) -> list[Film]:
+        raise NotImplementedError
+
     async def update(self, updated_film: Film) -> Film:
         raise NotImplementedError
 
     async def update_genres(self, film_id: FilmId, genres_ids: list[GenreId]) -> None:
         raise NotImplementedError
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Sequence[Film]:
+        raise NotImplementedError
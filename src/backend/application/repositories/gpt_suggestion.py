@@ -0,0 +1,15 @@
+import datetime
+import typing
+from collections.abc import Sequence
+
+from backend.domain.cached_suggestions import CachedSuggestions
+
+
+class GPTSuggestionRepository(typing.Protocol):
+    async def find_candidates(
+        self, fingerprint: str, band_keys: Sequence[int], created_after: datetime.datetime, limit: int
+    ) -> list[CachedSuggestions]:
+        raise NotImplementedError
+
+    async def save(self, entry: CachedSuggestions) -> None:
+        raise NotImplementedError
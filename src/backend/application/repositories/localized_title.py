@@ -0,0 +1,10 @@
+import typing
+from collections.abc import Mapping, Sequence
+
+
+class LocalizedTitleRepository(typing.Protocol):
+    async def get_many(self, tmdb_ids: Sequence[int]) -> Mapping[int, str]:
+        raise NotImplementedError
+
+    async def save_many(self, titles: Mapping[int, str]) -> None:
+        raise NotImplementedError
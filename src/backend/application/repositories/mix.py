@@ -2,6 +2,8 @@ import typing
 from collections.abc import Sequence
 
 from backend.domain.film_id import FilmId
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
 from backend.domain.mix import Mix
 from backend.domain.mix_id import MixId
 from backend.domain.mix_item import MixItem
@@ -17,6 +19,11 @@ class MixRepository(typing.Protocol):
     async def get_items_for_mix(self, mix_id: MixId) -> Sequence[MixItem]:
         raise NotImplementedError
 
+    async def get_films_for_mix(
+        self, mix_id: MixId, limit: int | None = None, cursor: ItemCursor | None = None
+    ) -> FilmsPage:
+        raise NotImplementedError
+
     async def add_item(self, item: MixItem) -> None:
         raise NotImplementedError
 
@@ -12,3 +12,8 @@ class RecommendedFilmRepository(typing.Protocol):
 
     async def get_recent_by_user(self, user_id: UserId, time_threshold: datetime.datetime) -> Sequence[RecommendedFilm]:
         raise NotImplementedError
+
+    async def get_recent_tmdb_ids(
+        self, user_id: UserId, time_threshold: datetime.datetime, limit: int
+    ) -> Sequence[int]:
+        raise NotImplementedError
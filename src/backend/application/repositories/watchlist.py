@@ -1,7 +1,11 @@
+import datetime
 import typing
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
+from backend.domain.film import Film
 from backend.domain.film_id import FilmId
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
 from backend.domain.user_id import UserId
 from backend.domain.watchlist import Watchlist
 from backend.domain.watchlist_id import WatchlistId
@@ -19,6 +23,11 @@ class WatchlistRepository(typing.Protocol):
     async def get_items_for_watchlist(self, watchlist_id: WatchlistId) -> Sequence[WatchlistItem]:
         raise NotImplementedError
 
+    async def get_films_for_watchlist(
+        self, watchlist_id: WatchlistId, limit: int | None = None, cursor: ItemCursor | None = None
+    ) -> FilmsPage:
+        raise NotImplementedError
+
     async def get_by_type(self, watchlist_type: WatchlistType) -> Sequence[WatchlistItem]:
         raise NotImplementedError
 
@@ -37,5 +46,15 @@ class WatchlistRepository(typing.Protocol):
     async def get_all_for_user(self, user_id: UserId) -> Sequence[Watchlist]:
         raise NotImplementedError
 
+    async def get_random_film_not_recommended_since(
+        self, watchlist_type: WatchlistType, user_id: UserId, since: datetime.datetime
+    ) -> Film | None:
+        raise NotImplementedError
+
+    async def get_common_types_for_films(
+        self, user_id: UserId, films_ids: Sequence[FilmId]
+    ) -> Mapping[FilmId, set[WatchlistType]]:
+        raise NotImplementedError
+
     async def delete_watchlist(self, watchlist_id: WatchlistId) -> None:
         raise NotImplementedError
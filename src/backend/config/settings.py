@@ -22,4 +22,65 @@ class Settings(BaseSettings):
 
     FILES_BASE_URL: str
 
+    LIBRARY_CACHE_MAXSIZE: int = 10_000
+    LIBRARY_CACHE_TTL: float = 300.0
+
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_CONNECT_TIMEOUT: float = 5.0
+    HTTP_RETRIES: int = 1
+    HTTP2_ENABLED: bool = False
+
+    TMDB_RATE_LIMIT: float = 40.0
+    TMDB_MAX_CONCURRENCY: int = 20
+    KINOPOISK_DEV_RATE_LIMIT: float = 10.0
+    KINOPOISK_DEV_MAX_CONCURRENCY: int = 5
+    KINOPOISK_UNOFFICIAL_RATE_LIMIT: float = 5.0
+    KINOPOISK_UNOFFICIAL_MAX_CONCURRENCY: int = 5
+    GPT_RATE_LIMIT: float = 5.0
+    GPT_MAX_CONCURRENCY: int = 10
+    GPT_TIMEOUT: float = 60.0
+
+    CIRCUIT_BREAKER_WINDOW: int = 50
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10
+    CIRCUIT_BREAKER_MAX_ERROR_RATE: float = 0.5
+    CIRCUIT_BREAKER_MAX_P95_LATENCY: float = 5.0
+    CIRCUIT_BREAKER_OPEN_DURATION: float = 30.0
+    SEARCH_HEDGE_DELAY: float | None = 1.0
+
+    LOCALIZED_TITLE_CACHE_MAXSIZE: int = 50_000
+    LOCALIZED_TITLE_CACHE_TTL: float = 86_400.0
+
+    CANDIDATE_POOL_CAPACITY: int = 20
+    CANDIDATE_POOL_LOW_WATER: int = 5
+
+    DETAIL_CACHE_MAXSIZE: int = 5_000
+    DETAIL_CACHE_TTL: float = 86_400.0
+    DETAIL_CACHE_PATH: str | None = None
+
+    GENRE_MAPS_REFRESH_INTERVAL: float = 6 * 60 * 60
+
+    SEARCH_CACHE_MAXSIZE: int = 10_000
+    SEARCH_CACHE_TTL: float = 600.0
+    SEARCH_CACHE_NEGATIVE_TTL: float = 60.0
+    SEARCH_DEADLINE: float = 8.0
+
+    GPT_SUGGESTION_CACHE_MAXSIZE: int = 5_000
+    GPT_SUGGESTION_CACHE_TTL: float = 7 * 86_400.0
+    GPT_SUGGESTION_MIN_SIMILARITY: float = 0.8
+
+    FILM_INDEX_PATH: str | None = None
+    FILM_INDEX_REFRESH_INTERVAL: float = 60.0
+    FILM_INDEX_MIN_SCORE: float = 0.2
+    FILM_INDEX_CONFIDENT_SCORE: float = 0.45
+
+    PALETTE_GPT_ENRICHMENT: bool = False
+    PALETTE_CACHE_MAXSIZE: int = 1_024
+    PALETTE_CACHE_TTL: float = 7 * 86_400.0
+    PALETTE_GPT_TIMEOUT: float = 3.0
+
+    CATALOG_REFRESH_INTERVAL: float = 60.0
+
     model_config = SettingsConfigDict(extra="allow", case_sensitive=False)
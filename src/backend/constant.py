@@ -1,23 +1,92 @@
 GRADIENTS = (
     ("#B2FEFA", "#0ED2F7", "#00C3FF"),
-    ("#31B4EA", "#6F97EB", "#B577ECF"),
-    ("#F197FF", "#3ED4D9", "#5BFF9F0"),
-    ("#57D7E6", "#7CED61", "#DCF2DAF"),
-    ("#69D3D0", "#9DE1A4", "#E3F75F5"),
-    ("#D1F746", "#3ED4D9", "#5BFF9F0"),
-    ("#B66EE7", "#FDC500", "#FFF20F0"),
-    ("#FFD500", "#C2E59C", "#FFFF2F4"),
-    ("#FF65B3", "#FBE300", "#FFD50F0"),
-    ("#EE0979", "#FF6A00", "#FFF64F7"),
-    ("#FFA62B", "#FF49C5", "#00C0EF9"),
-    ("#FE5B4F", "#FFAB28", "#FAD02F7"),
-    ("#FF0000", "#FF006F", "#DC00CF9"),
-    ("#A11692", "#FF0000", "#F4000F0"),
-    ("#A33AEA", "#FD1D1D", "#FE8C0F0"),
-    ("#FF72A2", "#FFB292", "#FCFBEFA"),
-    ("#FFA3A5", "#F686BD", "#BDE0FFE"),
-    ("#FF36AB", "#FF74D4", "#ED5C8F6"),
-    ("#2A4EC1", "#9532C7", "#09003F3"),
-    ("#13AFCE", "#9D44EC", "#E34B9F0"),
-    ("#59C173", "#A17FE0", "#5D26CF1"),
+    ("#31B4EA", "#6F97EB", "#B577EC"),
+    ("#F197FF", "#3ED4D9", "#5BFF9F"),
+    ("#57D7E6", "#7CED61", "#DCF2DA"),
+    ("#69D3D0", "#9DE1A4", "#E3F75F"),
+    ("#D1F746", "#3ED4D9", "#5BFF9F"),
+    ("#B66EE7", "#FDC500", "#FFF20F"),
+    ("#FFD500", "#C2E59C", "#FFFF2F"),
+    ("#FF65B3", "#FBE300", "#FFD50F"),
+    ("#EE0979", "#FF6A00", "#FFF64F"),
+    ("#FFA62B", "#FF49C5", "#00C0EF"),
+    ("#FE5B4F", "#FFAB28", "#FAD02F"),
+    ("#FF0000", "#FF006F", "#DC00CF"),
+    ("#A11692", "#FF0000", "#F4000F"),
+    ("#A33AEA", "#FD1D1D", "#FE8C0F"),
+    ("#FF72A2", "#FFB292", "#FCFBEF"),
+    ("#FFA3A5", "#F686BD", "#BDE0FF"),
+    ("#FF36AB", "#FF74D4", "#ED5C8F"),
+    ("#2A4EC1", "#9532C7", "#09003F"),
+    ("#13AFCE", "#9D44EC", "#E34B9F"),
+    ("#59C173", "#A17FE0", "#5D26CF"),
 )
+
+THEMED_GRADIENTS = {
+    "horror": (
+        ("#0F0C29", "#302B63", "#24243E"),
+        ("#200122", "#6F0000", "#A11692"),
+        ("#141E30", "#243B55", "#13AFCE"),
+    ),
+    "comedy": (
+        ("#FFD500", "#C2E59C", "#FFFF2F"),
+        ("#FF65B3", "#FBE300", "#FFD50F"),
+        ("#FFA62B", "#FF49C5", "#00C0EF"),
+    ),
+    "romance": (
+        ("#FF72A2", "#FFB292", "#FCFBEF"),
+        ("#FFA3A5", "#F686BD", "#BDE0FF"),
+        ("#FF36AB", "#FF74D4", "#ED5C8F"),
+    ),
+    "sci-fi": (
+        ("#2A4EC1", "#9532C7", "#09003F"),
+        ("#13AFCE", "#9D44EC", "#E34B9F"),
+        ("#B2FEFA", "#0ED2F7", "#00C3FF"),
+    ),
+    "drama": (
+        ("#31B4EA", "#6F97EB", "#B577EC"),
+        ("#59C173", "#A17FE0", "#5D26CF"),
+        ("#69D3D0", "#9DE1A4", "#E3F75F"),
+    ),
+    "action": (
+        ("#EE0979", "#FF6A00", "#FFF64F"),
+        ("#FF0000", "#FF006F", "#DC00CF"),
+        ("#A33AEA", "#FD1D1D", "#FE8C0F"),
+    ),
+    "crime": (
+        ("#A11692", "#FF0000", "#F4000F"),
+        ("#232526", "#414345", "#FE5B4F"),
+        ("#141E30", "#243B55", "#FFA62B"),
+    ),
+    "family": (
+        ("#B66EE7", "#FDC500", "#FFF20F"),
+        ("#F197FF", "#3ED4D9", "#5BFF9F"),
+        ("#D1F746", "#3ED4D9", "#5BFF9F"),
+    ),
+    "nature": (
+        ("#57D7E6", "#7CED61", "#DCF2DA"),
+        ("#69D3D0", "#9DE1A4", "#E3F75F"),
+        ("#59C173", "#13AFCE", "#B2FEFA"),
+    ),
+    "holiday": (
+        ("#FE5B4F", "#FFAB28", "#FAD02F"),
+        ("#B2FEFA", "#0ED2F7", "#FFFFFF"),
+        ("#EE0979", "#59C173", "#FFD500"),
+    ),
+}
+
+# Title words are matched by prefix, so stems cover the different forms of a Russian word.
+THEME_KEYWORDS = {
+    "horror": ("ужас", "страх", "страш", "хоррор", "зомби", "вампир", "призрак", "кошмар", "horror", "zombie", "ghost"),
+    "comedy": ("комед", "смеш", "юмор", "весел", "ржак", "comedy", "funny"),
+    "romance": ("любов", "романт", "свидан", "сердц", "поцелу", "love", "romance", "romantic"),
+    "sci-fi": (
+        "космо", "фантаст", "будущ", "робот", "галакт", "киберпанк", "sci", "space", "robot", "future",
+    ),
+    "drama": ("драм", "грус", "слез", "печал", "жизн", "drama", "sad", "life"),
+    "action": ("боевик", "экшн", "экшен", "погон", "взрыв", "супергер", "марвел", "action", "hero", "marvel"),
+    "crime": ("детектив", "криминал", "преступ", "мафи", "триллер", "убийств", "crime", "thriller", "mystery", "noir"),
+    "family": ("мульт", "детск", "семей", "аниме", "малыш", "сказк", "cartoon", "family", "kids", "anime", "disney"),
+    "nature": ("природ", "документ", "океан", "животн", "путешеств", "nature", "documentary", "ocean", "travel"),
+    "holiday": ("новогод", "рождеств", "праздн", "зимн", "зима", "christmas", "holiday", "winter"),
+}
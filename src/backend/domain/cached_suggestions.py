@@ -0,0 +1,11 @@
+import dataclasses
+import datetime
+
+
+@dataclasses.dataclass
+class CachedSuggestions:
+    fingerprint: str
+    signature: list[int]
+    band_keys: list[int]
+    suggestions: list[tuple[str, float]]
+    created_at: datetime.datetime
@@ -0,0 +1,10 @@
+import dataclasses
+
+from backend.domain.film import Film
+from backend.domain.item_cursor import ItemCursor
+
+
+@dataclasses.dataclass
+class FilmsPage:
+    films: list[Film]
+    next_cursor: ItemCursor | None = None
@@ -0,0 +1,10 @@
+import dataclasses
+import datetime
+
+from backend.domain.film_id import FilmId
+
+
+@dataclasses.dataclass(frozen=True)
+class ItemCursor:
+    added_at: datetime.datetime
+    film_id: FilmId
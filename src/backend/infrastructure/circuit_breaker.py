@@ -0,0 +1,96 @@
+import time
+from collections import deque
+from collections.abc import Callable
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        window: int = 50,
+        min_calls: int = 10,
+        max_error_rate: float = 0.5,
+        max_p95_latency: float = 5.0,
+        open_duration: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.min_calls = min_calls
+        self.max_error_rate = max_error_rate
+        self.max_p95_latency = max_p95_latency
+        self.open_duration = open_duration
+        self.opened = 0
+        self._clock = clock
+        self._calls: deque[tuple[bool, float]] = deque(maxlen=window)
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.open_duration:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record(self, success: bool, latency: float) -> None:
+        if self._opened_at is not None:
+            # Only the half-open probe reaches this point; its outcome decides whether to close again.
+            if success and latency <= self.max_p95_latency:
+                self._close()
+            else:
+                self._open()
+            return
+
+        self._calls.append((success, latency))
+        if len(self._calls) >= self.min_calls and (
+            self.error_rate() > self.max_error_rate or self.p95_latency() > self.max_p95_latency
+        ):
+            self._open()
+
+    def release(self) -> None:
+        # A call abandoned before the provider answered says nothing about its health, so it is not recorded
+        # and, if it was the half-open probe, the next call may probe instead.
+        self._probing = False
+
+    def error_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(1 for success, _ in self._calls if not success) / len(self._calls)
+
+    def p95_latency(self) -> float:
+        if not self._calls:
+            return 0.0
+        latencies = sorted(latency for _, latency in self._calls)
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    def stats(self) -> dict[str, float | str]:
+        return {
+            "state": self.state,
+            "calls": len(self._calls),
+            "error_rate": self.error_rate(),
+            "p95_latency": self.p95_latency(),
+            "opened": self.opened,
+        }
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._probing = False
+        self._calls.clear()
+        self.opened += 1
+
+    def _close(self) -> None:
+        self._opened_at = None
+        self._probing = False
+        self._calls.clear()
@@ -0,0 +1,105 @@
+from dataclasses import dataclass, field
+
+import httpx
+
+from backend.config.settings import Settings
+from backend.infrastructure.rate_limiter import RateLimitedTransport, RateLimiter
+
+
+@dataclass
+class UpstreamStats:
+    requests: int = 0
+    responses: int = 0
+    errors: int = 0
+
+
+@dataclass
+class HTTPClients:
+    tmdb: httpx.AsyncClient
+    kinopoisk_dev: httpx.AsyncClient
+    kinopoisk_unofficial: httpx.AsyncClient
+    gpt: httpx.AsyncClient
+    stats_by_upstream: dict[str, UpstreamStats] = field(default_factory=dict)
+    limiters: dict[str, RateLimiter] = field(default_factory=dict)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "HTTPClients":
+        limiters = {
+            "tmdb": RateLimiter(settings.TMDB_RATE_LIMIT, settings.TMDB_MAX_CONCURRENCY),
+            "kinopoisk_dev": RateLimiter(settings.KINOPOISK_DEV_RATE_LIMIT, settings.KINOPOISK_DEV_MAX_CONCURRENCY),
+            "kinopoisk_unofficial": RateLimiter(
+                settings.KINOPOISK_UNOFFICIAL_RATE_LIMIT, settings.KINOPOISK_UNOFFICIAL_MAX_CONCURRENCY
+            ),
+            "gpt": RateLimiter(settings.GPT_RATE_LIMIT, settings.GPT_MAX_CONCURRENCY),
+        }
+        stats_by_upstream = {name: UpstreamStats() for name in limiters}
+        clients = {
+            name: _create_client(
+                settings,
+                stats_by_upstream[name],
+                limiters[name],
+                timeout=settings.GPT_TIMEOUT if name == "gpt" else settings.HTTP_TIMEOUT,
+            )
+            for name in limiters
+        }
+        return cls(**clients, stats_by_upstream=stats_by_upstream, limiters=limiters)
+
+    def _clients(self) -> dict[str, httpx.AsyncClient]:
+        return {
+            "tmdb": self.tmdb,
+            "kinopoisk_dev": self.kinopoisk_dev,
+            "kinopoisk_unofficial": self.kinopoisk_unofficial,
+            "gpt": self.gpt,
+        }
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        result = {}
+        for name, client in self._clients().items():
+            upstream_stats = self.stats_by_upstream.get(name, UpstreamStats())
+            connections = _pool_connections(client)
+            result[name] = {
+                "requests": upstream_stats.requests,
+                "responses": upstream_stats.responses,
+                "errors": upstream_stats.errors,
+                "connections": len(connections),
+                "idle_connections": sum(1 for connection in connections if connection.is_idle()),
+            }
+            if limiter := self.limiters.get(name):
+                result[name].update(limiter.stats())
+        return result
+
+    async def close(self) -> None:
+        for client in self._clients().values():
+            await client.aclose()
+
+
+def _create_client(
+    settings: Settings, upstream_stats: UpstreamStats, limiter: RateLimiter, timeout: float
+) -> httpx.AsyncClient:
+    async def on_request(_: httpx.Request) -> None:
+        upstream_stats.requests += 1
+
+    async def on_response(response: httpx.Response) -> None:
+        upstream_stats.responses += 1
+        if response.is_error:
+            upstream_stats.errors += 1
+
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+    transport = httpx.AsyncHTTPTransport(limits=limits, http2=settings.HTTP2_ENABLED, retries=settings.HTTP_RETRIES)
+    return httpx.AsyncClient(
+        transport=RateLimitedTransport(transport, limiter),
+        timeout=httpx.Timeout(timeout, connect=settings.HTTP_CONNECT_TIMEOUT),
+        event_hooks={"request": [on_request], "response": [on_response]},
+    )
+
+
+def _pool_connections(client: httpx.AsyncClient) -> list:
+    # httpx does not expose pool state publicly, so read it from the httpcore pool when available.
+    transport = getattr(client, "_transport", None)
+    transport = getattr(transport, "transport", transport)
+    pool = getattr(transport, "_pool", None)
+    return list(getattr(pool, "connections", []))
@@ -1,5 +1,5 @@
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 
 import dishka
 from dishka import Provider, Scope, provide
@@ -15,8 +15,13 @@ from backend.application.repositories.mood import MoodRepository
 from backend.application.repositories.recommended_film import RecommendedFilmRepository
 from backend.application.repositories.user import UserRepository
 from backend.application.repositories.watchlist import WatchlistRepository
+from backend.config.settings import Settings
 from backend.infrastructure.argon2_password_hasher import Argon2PasswordHasher
+from backend.infrastructure.circuit_breaker import CircuitBreaker
+from backend.infrastructure.http_clients import HTTPClients
+from backend.infrastructure.persistence.genre_mood_catalog import GenreMoodCatalog
 from backend.infrastructure.persistence.committer import SQLAlchemyCommitter
+from backend.infrastructure.persistence.library_cache import LibraryCache
 from backend.infrastructure.persistence.repositories.auth_token import SQLAlchemyAuthTokenRepository
 from backend.infrastructure.persistence.repositories.film import SQLAlchemyFilmRepository
 from backend.infrastructure.persistence.repositories.genre import SQLAlchemyGenreRepository
@@ -25,9 +30,17 @@ from backend.infrastructure.persistence.repositories.mood import SQLAlchemyMoodR
 from backend.infrastructure.persistence.repositories.recommended_film import SQLAlchemyRecommendedFilmRepository
 from backend.infrastructure.persistence.repositories.user import SQLAlchemyUserRepository
 from backend.infrastructure.persistence.repositories.watchlist import SQLAlchemyWatchlistRepository
+from backend.infrastructure.services.candidate_pool import CandidatePool
+from backend.infrastructure.services.detail_cache import DetailCache, DiskStore
+from backend.infrastructure.services.film_index import FilmIndex
 from backend.infrastructure.services.gpt import GPTService
+from backend.infrastructure.services.palette import PaletteService
 from backend.infrastructure.services.s3 import S3Service
+from backend.infrastructure.services.search_cache import SearchCache
+from backend.infrastructure.services.suggestion_cache import SuggestionCache
+from backend.infrastructure.services.title_localizer import TitleLocalizer
 from backend.infrastructure.services.tmdb import TMDBService
+from backend.presentation.film_enricher import FilmEnricher
 
 
 class MainProvider(Provider):
@@ -47,28 +60,153 @@ class MainProvider(Provider):
             yield session
 
     @provide(scope=Scope.APP)
-    def get_gpt_service(self) -> GPTService:
-        return GPTService()
+    def get_suggestion_cache(self, sessionmaker: async_sessionmaker[AsyncSession]) -> SuggestionCache:
+        settings = Settings()
+        return SuggestionCache(
+            sessionmaker,
+            maxsize=settings.GPT_SUGGESTION_CACHE_MAXSIZE,
+            ttl=settings.GPT_SUGGESTION_CACHE_TTL,
+            min_similarity=settings.GPT_SUGGESTION_MIN_SIMILARITY,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_gpt_service(self, http_clients: HTTPClients, suggestion_cache: SuggestionCache) -> GPTService:
+        return GPTService(http_client=http_clients.gpt, suggestion_cache=suggestion_cache)
+
+    @provide(scope=Scope.APP)
+    def get_palette_service(self, gpt_service: GPTService) -> PaletteService:
+        settings = Settings()
+        return PaletteService(
+            gpt_service=gpt_service if settings.PALETTE_GPT_ENRICHMENT else None,
+            maxsize=settings.PALETTE_CACHE_MAXSIZE,
+            ttl=settings.PALETTE_CACHE_TTL,
+            timeout=settings.PALETTE_GPT_TIMEOUT,
+        )
 
     @provide(scope=Scope.APP)
     def get_s3_service(self) -> S3Service:
         return S3Service()
 
     @provide(scope=Scope.APP)
-    async def get_tmdb_service(self) -> AsyncGenerator[TMDBService]:
-        service = TMDBService()
+    async def get_http_clients(self) -> AsyncGenerator[HTTPClients]:
+        http_clients = HTTPClients.from_settings(Settings())
+        yield http_clients
+        await http_clients.close()
+
+    @provide(scope=Scope.APP)
+    def get_detail_cache(self) -> Iterator[DetailCache]:
+        settings = Settings()
+        disk_store = DiskStore(settings.DETAIL_CACHE_PATH) if settings.DETAIL_CACHE_PATH else None
+        detail_cache = DetailCache(
+            maxsize=settings.DETAIL_CACHE_MAXSIZE, ttl=settings.DETAIL_CACHE_TTL, disk_store=disk_store
+        )
+        yield detail_cache
+        detail_cache.close()
+
+    @provide(scope=Scope.APP)
+    def get_title_localizer(self, sessionmaker: async_sessionmaker[AsyncSession]) -> TitleLocalizer:
+        settings = Settings()
+        return TitleLocalizer(
+            sessionmaker, maxsize=settings.LOCALIZED_TITLE_CACHE_MAXSIZE, ttl=settings.LOCALIZED_TITLE_CACHE_TTL
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_tmdb_service(
+        self, http_clients: HTTPClients, detail_cache: DetailCache, title_localizer: TitleLocalizer
+    ) -> AsyncGenerator[TMDBService]:
+        service = TMDBService(
+            client=http_clients.tmdb,
+            kinopoisk_unofficial_client=http_clients.kinopoisk_unofficial,
+            kinopoisk_dev_client=http_clients.kinopoisk_dev,
+            detail_cache=detail_cache,
+            kinopoisk_breaker=self._create_circuit_breaker(),
+            tmdb_breaker=self._create_circuit_breaker(),
+            title_localizer=title_localizer,
+        )
+        service.start_genre_maps_refresh()
+        title_localizer.start(service.resolve_localized_title)
         yield service
-        await service.close()
+        await title_localizer.stop()
+        await service.stop_genre_maps_refresh()
+
+    def _create_circuit_breaker(self) -> CircuitBreaker:
+        settings = Settings()
+        return CircuitBreaker(
+            window=settings.CIRCUIT_BREAKER_WINDOW,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            max_error_rate=settings.CIRCUIT_BREAKER_MAX_ERROR_RATE,
+            max_p95_latency=settings.CIRCUIT_BREAKER_MAX_P95_LATENCY,
+            open_duration=settings.CIRCUIT_BREAKER_OPEN_DURATION,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_candidate_pool(self, tmdb_service: TMDBService) -> AsyncGenerator[CandidatePool]:
+        settings = Settings()
+        candidate_pool = CandidatePool(
+            tmdb_service.get_random_tmdb_movie,
+            capacity=settings.CANDIDATE_POOL_CAPACITY,
+            low_water=settings.CANDIDATE_POOL_LOW_WATER,
+        )
+        yield candidate_pool
+        await candidate_pool.close()
+
+    @provide(scope=Scope.APP)
+    def get_search_cache(self) -> SearchCache:
+        settings = Settings()
+        return SearchCache(
+            maxsize=settings.SEARCH_CACHE_MAXSIZE,
+            ttl=settings.SEARCH_CACHE_TTL,
+            negative_ttl=settings.SEARCH_CACHE_NEGATIVE_TTL,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_film_index(self, sessionmaker: async_sessionmaker[AsyncSession]) -> AsyncGenerator[FilmIndex]:
+        settings = Settings()
+        film_index = FilmIndex(
+            sessionmaker,
+            path=settings.FILM_INDEX_PATH,
+            refresh_interval=settings.FILM_INDEX_REFRESH_INTERVAL,
+            min_score=settings.FILM_INDEX_MIN_SCORE,
+            confident_score=settings.FILM_INDEX_CONFIDENT_SCORE,
+        )
+        film_index.start()
+        yield film_index
+        await film_index.stop()
+
+    @provide(scope=Scope.APP)
+    def get_library_cache(self) -> LibraryCache:
+        settings = Settings()
+        return LibraryCache(maxsize=settings.LIBRARY_CACHE_MAXSIZE, ttl=settings.LIBRARY_CACHE_TTL)
+
+    @provide(scope=Scope.APP)
+    async def get_genre_mood_catalog(
+        self, sessionmaker: async_sessionmaker[AsyncSession]
+    ) -> AsyncGenerator[GenreMoodCatalog]:
+        catalog = GenreMoodCatalog(sessionmaker, refresh_interval=Settings().CATALOG_REFRESH_INTERVAL)
+        await catalog.refresh()
+        catalog.start()
+        yield catalog
+        await catalog.stop()
+
+    @provide(scope=Scope.REQUEST)
+    def get_genre_repo(self, session: AsyncSession, catalog: GenreMoodCatalog) -> GenreRepository:
+        return SQLAlchemyGenreRepository(session=session, catalog=catalog)
+
+    @provide(scope=Scope.REQUEST)
+    def get_mood_repo(self, session: AsyncSession, catalog: GenreMoodCatalog) -> MoodRepository:
+        return SQLAlchemyMoodRepository(session=session, catalog=catalog)
+
+    @provide(scope=Scope.REQUEST)
+    def get_watchlist_repo(self, session: AsyncSession, library_cache: LibraryCache) -> WatchlistRepository:
+        return SQLAlchemyWatchlistRepository(session=session, library_cache=library_cache)
 
     committer = dishka.provide(SQLAlchemyCommitter, provides=Committer, scope=Scope.REQUEST)
     user_repo = dishka.provide(SQLAlchemyUserRepository, provides=UserRepository, scope=Scope.REQUEST)
     film_repo = dishka.provide(SQLAlchemyFilmRepository, provides=FilmRepository, scope=Scope.REQUEST)
     mix_repo = dishka.provide(SQLAlchemyMixRepository, provides=MixRepository, scope=Scope.REQUEST)
-    watchlist_repo = dishka.provide(SQLAlchemyWatchlistRepository, provides=WatchlistRepository, scope=Scope.REQUEST)
-    mood_repo = dishka.provide(SQLAlchemyMoodRepository, provides=MoodRepository, scope=Scope.REQUEST)
-    genre_repo = dishka.provide(SQLAlchemyGenreRepository, provides=GenreRepository, scope=Scope.REQUEST)
     auth_token_repo = dishka.provide(SQLAlchemyAuthTokenRepository, provides=AuthTokenRepository, scope=Scope.REQUEST)
     recommended_film_repo = dishka.provide(
         SQLAlchemyRecommendedFilmRepository, provides=RecommendedFilmRepository, scope=Scope.REQUEST
     )
     password_hasher = dishka.provide(Argon2PasswordHasher, provides=PasswordHasher, scope=Scope.REQUEST)
+    film_enricher = dishka.provide(FilmEnricher, scope=Scope.REQUEST)
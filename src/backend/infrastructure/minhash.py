@@ -0,0 +1,61 @@
+import hashlib
+import random
+import re
+from collections.abc import Sequence
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.casefold().replace("ё", "е"))
+
+
+def fingerprint(text: str) -> str:
+    return hashlib.sha256(" ".join(normalize_words(text)).encode()).hexdigest()
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class MinHasher:
+    def __init__(self, num_perm: int = 64, bands: int = 16, shingle_size: int = 2, seed: int = 1) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        # The permutations have to be stable across processes because signatures are persisted.
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> set[str]:
+        words = normalize_words(text)
+        if len(words) <= self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i : i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> list[int]:
+        hashes = [_hash(shingle) for shingle in self.shingles(text)]
+        if not hashes:
+            return [_MERSENNE_PRIME] * self.num_perm
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._permutations]
+
+    def band_keys(self, signature: Sequence[int]) -> list[int]:
+        rows = self.num_perm // self.bands
+        keys = []
+        for band in range(self.bands):
+            chunk = ",".join(map(str, signature[band * rows : (band + 1) * rows]))
+            digest = hashlib.blake2b(f"{band}:{chunk}".encode(), digest_size=8).digest()
+            # Keys are stored in a BIGINT column, so they are read as signed 64-bit integers.
+            keys.append(int.from_bytes(digest, "big", signed=True))
+        return keys
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        if not first or len(first) != len(second):
+            return 0.0
+        return sum(1 for a, b in zip(first, second) if a == b) / len(first)
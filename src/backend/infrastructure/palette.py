@@ -0,0 +1,55 @@
+import re
+import zlib
+from collections.abc import Iterable
+
+from backend.constant import GRADIENTS, THEME_KEYWORDS, THEMED_GRADIENTS
+from backend.infrastructure.minhash import normalize_words
+
+Gradient = tuple[str, str, str]
+
+HEX_COLOR_RE = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+def is_hex_color(value: object) -> bool:
+    return isinstance(value, str) and HEX_COLOR_RE.fullmatch(value) is not None
+
+
+def _validate_gradients(name: str, gradients: Iterable[Gradient]) -> tuple[Gradient, ...]:
+    gradients = tuple(gradients)
+    if not gradients:
+        raise ValueError(f"{name} has no gradients")
+    for gradient in gradients:
+        if len(gradient) != 3 or not all(is_hex_color(color) for color in gradient):
+            raise ValueError(f"{name} contains an invalid gradient: {gradient!r}")
+    return gradients
+
+
+# Palettes are validated once at import time, so a typo in the table fails on startup instead of reaching users.
+_DEFAULT_GRADIENTS = _validate_gradients("GRADIENTS", GRADIENTS)
+_THEMED_GRADIENTS = {
+    theme: _validate_gradients(f"THEMED_GRADIENTS[{theme!r}]", gradients)
+    for theme, gradients in THEMED_GRADIENTS.items()
+}
+if unknown := set(THEME_KEYWORDS) - set(_THEMED_GRADIENTS):
+    raise ValueError(f"THEME_KEYWORDS refers to themes without gradients: {sorted(unknown)}")
+
+
+def normalize_title(title: str) -> str:
+    return " ".join(normalize_words(title))
+
+
+def detect_theme(title: str) -> str | None:
+    words = normalize_words(title)
+    best_theme, best_matches = None, 0
+    for theme, stems in THEME_KEYWORDS.items():
+        matches = sum(1 for word in words if word.startswith(stems))
+        if matches > best_matches:
+            best_theme, best_matches = theme, matches
+    return best_theme
+
+
+def pick_gradient(title: str) -> Gradient:
+    theme = detect_theme(title)
+    gradients = _THEMED_GRADIENTS[theme] if theme is not None else _DEFAULT_GRADIENTS
+    # crc32 rather than hash() so the same title gets the same gradient in every process.
+    return gradients[zlib.crc32(normalize_title(title).encode()) % len(gradients)]
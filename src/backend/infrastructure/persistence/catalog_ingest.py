@@ -0,0 +1,60 @@
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.film_genre import FilmGenre
+from backend.infrastructure.persistence.models.genre import GenreORM
+
+
+async def load_genre_ids(session: AsyncSession) -> dict[str, uuid.UUID]:
+    result = await session.execute(select(func.lower(GenreORM.name), GenreORM.id))
+    return dict(result.tuples().all())
+
+
+async def ingest_films(
+    session: AsyncSession, items: Sequence[Mapping[str, Any]], genre_ids: Mapping[str, uuid.UUID]
+) -> int:
+    items_by_tmdb_id: dict[int, Mapping[str, Any]] = {}
+    for item in items:
+        if item.get("tmdb_id") and item.get("title"):
+            items_by_tmdb_id.setdefault(item["tmdb_id"], item)
+    if not items_by_tmdb_id:
+        return 0
+
+    films = []
+    film_genre_ids = {}
+    for tmdb_id, item in items_by_tmdb_id.items():
+        film_id = uuid.uuid4()
+        films.append(
+            {
+                "id": film_id,
+                "title": item["title"],
+                "description": item.get("description"),
+                "country": item.get("country"),
+                "release_year": item.get("release_year"),
+                "poster_url": item.get("poster_url"),
+                "tmdb_id": tmdb_id,
+                "owner_id": None,
+            }
+        )
+        film_genre_ids[film_id] = {
+            genre_ids[name.lower()]
+            for genre in item.get("genres", [])
+            if (name := genre.get("name")) and name.lower() in genre_ids
+        }
+
+    # Films saved meanwhile by search (or an earlier run of this batch) are skipped by the unique tmdb_id index.
+    stmt = pg_insert(FilmORM).values(films).on_conflict_do_nothing(index_elements=[FilmORM.tmdb_id])
+    inserted_ids = list(await session.scalars(stmt.returning(FilmORM.id)))
+
+    film_genres = [
+        {"film_id": film_id, "genre_id": genre_id} for film_id in inserted_ids for genre_id in film_genre_ids[film_id]
+    ]
+    if film_genres:
+        await session.execute(pg_insert(FilmGenre).on_conflict_do_nothing(), film_genres)
+    return len(inserted_ids)
@@ -9,3 +9,6 @@ class SQLAlchemyCommitter(Committer):
 
     async def commit(self) -> None:
         await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
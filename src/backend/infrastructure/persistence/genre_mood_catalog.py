@@ -0,0 +1,116 @@
+import asyncio
+import contextlib
+import dataclasses
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.domain.genre import Genre
+from backend.domain.genre_id import GenreId
+from backend.domain.mood import Mood
+from backend.domain.mood_id import MoodId
+from backend.infrastructure.persistence.mappers.genre import orm_to_genre
+from backend.infrastructure.persistence.mappers.mood import orm_to_mood
+from backend.infrastructure.persistence.models.catalog_version import CatalogVersionORM
+from backend.infrastructure.persistence.models.genre import GenreORM
+from backend.infrastructure.persistence.models.genre_mood import GenreMoodORM
+from backend.infrastructure.persistence.models.mood import MoodORM
+
+
+def _empty() -> Mapping:
+    return MappingProxyType({})
+
+
+@dataclasses.dataclass(frozen=True)
+class CatalogSnapshot:
+    version: int | None = None
+    genres: Mapping[GenreId, Genre] = dataclasses.field(default_factory=_empty)
+    moods: Mapping[MoodId, Mood] = dataclasses.field(default_factory=_empty)
+    genres_ids_by_mood: Mapping[MoodId, frozenset[GenreId]] = dataclasses.field(default_factory=_empty)
+    genres_ids_by_name: Mapping[str, GenreId] = dataclasses.field(default_factory=_empty)
+
+
+class GenreMoodCatalog:
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession], refresh_interval: float = 60.0) -> None:
+        self.refresh_interval = refresh_interval
+        self._sessionmaker = sessionmaker
+        # Readers only ever see a complete snapshot: a reload builds a new one and swaps the reference.
+        self._snapshot = CatalogSnapshot()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def version(self) -> int | None:
+        return self._snapshot.version
+
+    def list_genres(self, moods_ids: Iterable[MoodId] | None = None) -> list[Genre]:
+        snapshot = self._snapshot
+        if not moods_ids:
+            return list(snapshot.genres.values())
+        genres_ids = self.expand_moods(moods_ids)
+        return [genre for genre_id, genre in snapshot.genres.items() if genre_id in genres_ids]
+
+    def get_genre(self, genre_id: GenreId) -> Genre | None:
+        return self._snapshot.genres.get(genre_id)
+
+    def list_moods(self) -> list[Mood]:
+        return list(self._snapshot.moods.values())
+
+    def get_mood(self, mood_id: MoodId) -> Mood | None:
+        return self._snapshot.moods.get(mood_id)
+
+    def expand_moods(self, moods_ids: Iterable[MoodId]) -> frozenset[GenreId]:
+        genres_ids_by_mood = self._snapshot.genres_ids_by_mood
+        return frozenset().union(*(genres_ids_by_mood.get(mood_id, ()) for mood_id in moods_ids))
+
+    def get_genre_id_by_name(self, name: str) -> GenreId | None:
+        return self._snapshot.genres_ids_by_name.get(name.lower())
+
+    async def refresh(self) -> bool:
+        async with self._sessionmaker() as session:
+            version = await session.scalar(select(CatalogVersionORM.version).where(CatalogVersionORM.id == 1))
+            if self._snapshot.version is not None and version == self._snapshot.version:
+                return False
+
+            genres = [orm_to_genre(orm_genre) for orm_genre in await session.scalars(select(GenreORM))]
+            moods = [orm_to_mood(orm_mood) for orm_mood in await session.scalars(select(MoodORM))]
+            genre_moods = (await session.execute(select(GenreMoodORM.mood_id, GenreMoodORM.genre_id))).all()
+
+        genres_ids_by_mood: dict[MoodId, set[GenreId]] = {}
+        for mood_id, genre_id in genre_moods:
+            genres_ids_by_mood.setdefault(MoodId(mood_id), set()).add(GenreId(genre_id))
+
+        self._snapshot = CatalogSnapshot(
+            version=version or 0,
+            genres=MappingProxyType({genre.id: genre for genre in genres}),
+            moods=MappingProxyType({mood.id: mood for mood in moods}),
+            genres_ids_by_mood=MappingProxyType(
+                {mood_id: frozenset(genres_ids) for mood_id, genres_ids in genres_ids_by_mood.items()}
+            ),
+            genres_ids_by_name=MappingProxyType({genre.name.lower(): genre.id for genre in genres}),
+        )
+        return True
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int]:
+        snapshot = self._snapshot
+        return {"version": snapshot.version or 0, "genres": len(snapshot.genres), "moods": len(snapshot.moods)}
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Error refreshing genre catalog: {e}")
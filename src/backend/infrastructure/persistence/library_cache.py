@@ -0,0 +1,67 @@
+from collections.abc import Iterable, Mapping, Sequence
+
+from backend.domain.film_id import FilmId
+from backend.domain.user_id import UserId
+from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.cache import TTLCache
+
+# Film ids are kept as plain ints (UUID.int) to keep per-user sets small.
+_Library = dict[WatchlistType, set[int]]
+
+
+class LibraryCache:
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0) -> None:
+        self._cache: TTLCache[UserId, _Library] = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Every write gets a number, so a library loaded before the latest write of its user can be told apart.
+        self._writes = 0
+        self._last_writes: TTLCache[UserId, int] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get_types_for_films(
+        self, user_id: UserId, films_ids: Sequence[FilmId]
+    ) -> Mapping[FilmId, set[WatchlistType]] | None:
+        library = self._cache.get(user_id)
+        if library is None:
+            return None
+        types_by_film: dict[FilmId, set[WatchlistType]] = {}
+        for film_id in films_ids:
+            types = {watchlist_type for watchlist_type, ids in library.items() if film_id.int in ids}
+            if types:
+                types_by_film[film_id] = types
+        return types_by_film
+
+    def generation(self) -> int:
+        return self._writes
+
+    def put(
+        self, user_id: UserId, entries: Iterable[tuple[FilmId, WatchlistType]], generation: int | None = None
+    ) -> None:
+        # A library read before a concurrent write was applied would overwrite that write, so it is dropped.
+        if generation is not None and (self._last_writes.peek(user_id) or 0) > generation:
+            return
+        library: _Library = {}
+        for film_id, watchlist_type in entries:
+            library.setdefault(watchlist_type, set()).add(film_id.int)
+        self._cache.set(user_id, library)
+
+    def add(self, user_id: UserId, watchlist_type: WatchlistType, film_id: FilmId) -> None:
+        self._record_write(user_id)
+        library = self._cache.peek(user_id)
+        if library is not None:
+            library.setdefault(watchlist_type, set()).add(film_id.int)
+
+    def discard(self, user_id: UserId, watchlist_type: WatchlistType, film_id: FilmId) -> None:
+        self._record_write(user_id)
+        library = self._cache.peek(user_id)
+        if library is not None and watchlist_type in library:
+            library[watchlist_type].discard(film_id.int)
+
+    def invalidate(self, user_id: UserId) -> None:
+        self._record_write(user_id)
+        self._cache.pop(user_id)
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+    def _record_write(self, user_id: UserId) -> None:
+        self._writes += 1
+        self._last_writes.set(user_id, self._writes)
@@ -0,0 +1,56 @@
+"""catalog version
+
+Revision ID: b6e3f0a8c514
+Revises: 8f2c6a1d4e93
+Create Date: 2026-10-18 20:21:36.842190
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b6e3f0a8c514"
+down_revision: str | None = "8f2c6a1d4e93"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+CATALOG_TABLES = ("genre", "mood", "genre_mood")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 1)")
+    # Every change to genres, moods or their mapping bumps the version, so running apps know to reload the catalog.
+    op.execute(
+        """
+        CREATE FUNCTION bump_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE catalog_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"""
+            CREATE TRIGGER {table}_catalog_version
+            AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version()
+            """
+        )
+
+
+def downgrade() -> None:
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER {table}_catalog_version ON {table}")
+    op.execute("DROP FUNCTION bump_catalog_version()")
+    op.drop_table("catalog_version")
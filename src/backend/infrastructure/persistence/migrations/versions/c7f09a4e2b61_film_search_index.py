@@ -0,0 +1,52 @@
+"""film search index
+
+Revision ID: c7f09a4e2b61
+Revises: 8e41c3b9a0f5
+Create Date: 2026-10-18 16:02:44.871230
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "c7f09a4e2b61"
+down_revision: str | None = "8e41c3b9a0f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "film",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('russian', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index("ix_film_search_vector", "film", ["search_vector"], unique=False, postgresql_using="gin")
+    op.create_index(
+        "ix_film_title_trgm",
+        "film",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_film_title_trgm", table_name="film")
+    op.drop_index("ix_film_search_vector", table_name="film")
+    op.drop_column("film", "search_vector")
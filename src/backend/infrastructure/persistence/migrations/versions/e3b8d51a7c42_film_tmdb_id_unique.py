@@ -0,0 +1,82 @@
+"""film tmdb_id unique
+
+Revision ID: e3b8d51a7c42
+Revises: c7f09a4e2b61
+Create Date: 2026-10-18 17:12:37.204518
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e3b8d51a7c42"
+down_revision: str | None = "c7f09a4e2b61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Concurrent searches could store the same TMDB film several times. Every duplicate is merged
+    # into one row per tmdb_id before the unique index is created, moving its references along.
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE film_duplicate ON COMMIT DROP AS
+        SELECT id, keep_id
+        FROM (
+            SELECT id, first_value(id) OVER (PARTITION BY tmdb_id ORDER BY id) AS keep_id
+            FROM film
+            WHERE tmdb_id IS NOT NULL
+        ) AS films
+        WHERE id != keep_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO watchlist_item (watchlist_id, film_id, added_at)
+        SELECT item.watchlist_id, duplicate.keep_id, min(item.added_at)
+        FROM watchlist_item AS item
+        JOIN film_duplicate AS duplicate ON duplicate.id = item.film_id
+        GROUP BY item.watchlist_id, duplicate.keep_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO mix_item (mix_id, film_id, added_at)
+        SELECT item.mix_id, duplicate.keep_id, min(item.added_at)
+        FROM mix_item AS item
+        JOIN film_duplicate AS duplicate ON duplicate.id = item.film_id
+        GROUP BY item.mix_id, duplicate.keep_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO film_genre (film_id, genre_id)
+        SELECT DISTINCT duplicate.keep_id, film_genre.genre_id
+        FROM film_genre
+        JOIN film_duplicate AS duplicate ON duplicate.id = film_genre.film_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        UPDATE recommended_film
+        SET film_id = duplicate.keep_id
+        FROM film_duplicate AS duplicate
+        WHERE duplicate.id = recommended_film.film_id
+        """
+    )
+    for table in ("watchlist_item", "mix_item", "film_genre"):
+        op.execute(f"DELETE FROM {table} USING film_duplicate WHERE film_duplicate.id = {table}.film_id")
+    op.execute("DELETE FROM film USING film_duplicate WHERE film_duplicate.id = film.id")
+
+    op.drop_index(op.f("ix_film_tmdb_id"), table_name="film")
+    op.create_index(op.f("ix_film_tmdb_id"), "film", ["tmdb_id"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_film_tmdb_id"), table_name="film")
+    op.create_index(op.f("ix_film_tmdb_id"), "film", ["tmdb_id"], unique=False)
@@ -8,10 +8,13 @@ class BaseORM(CommonTableAttributes, DeclarativeBase):
 
 def register_orm() -> None:
     from backend.infrastructure.persistence.models.auth_token import AuthTokenORM  # noqa: F401
+    from backend.infrastructure.persistence.models.catalog_version import CatalogVersionORM  # noqa: F401
     from backend.infrastructure.persistence.models.film import FilmORM  # noqa: F401
     from backend.infrastructure.persistence.models.film_genre import FilmGenre  # noqa: F401
     from backend.infrastructure.persistence.models.genre import GenreORM  # noqa: F401
     from backend.infrastructure.persistence.models.genre_mood import GenreMoodORM  # noqa: F401
+    from backend.infrastructure.persistence.models.gpt_suggestion import GPTSuggestionORM  # noqa: F401
+    from backend.infrastructure.persistence.models.localized_title import LocalizedTitleORM  # noqa: F401
     from backend.infrastructure.persistence.models.mix import MixORM  # noqa: F401
     from backend.infrastructure.persistence.models.mix_item import MixItemORM  # noqa: F401
     from backend.infrastructure.persistence.models.mood import MoodORM  # noqa: F401
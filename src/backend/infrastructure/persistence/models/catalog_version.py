@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.infrastructure.persistence.models.base import BaseORM
+
+
+class CatalogVersionORM(BaseORM):
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger)
@@ -1,14 +1,28 @@
+import datetime
 import uuid
 
-from sqlalchemy import ForeignKey
+from advanced_alchemy.types import DateTimeUTC
+from sqlalchemy import Computed, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.infrastructure.persistence.models.base import BaseORM
 from backend.infrastructure.persistence.models.user import UserORM
 
+FILM_SEARCH_VECTOR = (
+    "setweight(to_tsvector('russian', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description, '')), 'B')"
+)
+
 
 class FilmORM(BaseORM):
     __tablename__ = "film"
+    __table_args__ = (
+        Index("ix_film_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_film_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_film_updated_at_id", "updated_at", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
 
@@ -18,6 +32,14 @@ class FilmORM(BaseORM):
     release_year: Mapped[int | None]
     poster_url: Mapped[str | None]
 
-    tmdb_id: Mapped[int | None]
+    tmdb_id: Mapped[int | None] = mapped_column(index=True, unique=True)
 
     owner_id: Mapped[uuid.UUID | None] = mapped_column(ForeignKey(UserORM.id))
+
+    updated_at: Mapped[datetime.datetime] = mapped_column(
+        DateTimeUTC, server_default=func.now(), onupdate=func.now()
+    )
+
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(FILM_SEARCH_VECTOR, persisted=True), deferred=True
+    )
@@ -0,0 +1,20 @@
+import datetime
+from typing import Any
+
+from advanced_alchemy.types import DateTimeUTC
+from sqlalchemy import BigInteger, Index
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.infrastructure.persistence.models.base import BaseORM
+
+
+class GPTSuggestionORM(BaseORM):
+    __tablename__ = "gpt_suggestion"
+    __table_args__ = (Index("ix_gpt_suggestion_band_keys", "band_keys", postgresql_using="gin"),)
+
+    fingerprint: Mapped[str] = mapped_column(primary_key=True)
+    signature: Mapped[list[int]] = mapped_column(ARRAY(BigInteger))
+    band_keys: Mapped[list[int]] = mapped_column(ARRAY(BigInteger))
+    suggestions: Mapped[list[dict[str, Any]]] = mapped_column(JSONB)
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTimeUTC, index=True)
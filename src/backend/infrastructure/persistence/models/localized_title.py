@@ -0,0 +1,14 @@
+import datetime
+
+from advanced_alchemy.types import DateTimeUTC
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.infrastructure.persistence.models.base import BaseORM
+
+
+class LocalizedTitleORM(BaseORM):
+    __tablename__ = "localized_title"
+
+    tmdb_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    title: Mapped[str]
+    resolved_at: Mapped[datetime.datetime] = mapped_column(DateTimeUTC)
@@ -2,7 +2,7 @@ import datetime
 import uuid
 
 from advanced_alchemy.types import DateTimeUTC
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.infrastructure.persistence.models.base import BaseORM
@@ -12,6 +12,7 @@ from backend.infrastructure.persistence.models.mix import MixORM
 
 class MixItemORM(BaseORM):
     __tablename__ = "mix_item"
+    __table_args__ = (Index("ix_mix_item_mix_id_added_at_film_id", "mix_id", "added_at", "film_id"),)
 
     mix_id: Mapped[uuid.UUID] = mapped_column(ForeignKey(MixORM.id), primary_key=True)
     film_id: Mapped[uuid.UUID] = mapped_column(ForeignKey(FilmORM.id), primary_key=True)
@@ -2,7 +2,7 @@ import datetime
 import uuid
 
 from advanced_alchemy.types import DateTimeUTC
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.infrastructure.persistence.models.base import BaseORM
@@ -12,6 +12,9 @@ from backend.infrastructure.persistence.models.user import UserORM
 
 class RecommendedFilmORM(BaseORM):
     __tablename__ = "recommended_film"
+    __table_args__ = (
+        Index("ix_recommended_film_user_id_recommended_at_film_id", "user_id", "recommended_at", "film_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(primary_key=True)
     user_id: Mapped[uuid.UUID] = mapped_column(ForeignKey(UserORM.id))
@@ -1,8 +1,9 @@
 import datetime
+import random
 import uuid
 
 from advanced_alchemy.types import DateTimeUTC
-from sqlalchemy import ForeignKey
+from sqlalchemy import Double, ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from backend.infrastructure.persistence.models.base import BaseORM
@@ -12,7 +13,13 @@ from backend.infrastructure.persistence.models.watchlist import WatchlistORM
 
 class WatchlistItemORM(BaseORM):
     __tablename__ = "watchlist_item"
+    __table_args__ = (
+        Index("ix_watchlist_item_watchlist_id_added_at_film_id", "watchlist_id", "added_at", "film_id"),
+        Index("ix_watchlist_item_watchlist_id_sort_key", "watchlist_id", "sort_key"),
+    )
 
     watchlist_id: Mapped[uuid.UUID] = mapped_column(ForeignKey(WatchlistORM.id), primary_key=True)
     film_id: Mapped[uuid.UUID] = mapped_column(ForeignKey(FilmORM.id), primary_key=True)
     added_at: Mapped[datetime.datetime] = mapped_column(DateTimeUTC)
+    # Uniformly distributed key used to pick a random item through the index instead of ORDER BY random().
+    sort_key: Mapped[float] = mapped_column(Double, default=random.random, server_default=text("random()"))
@@ -0,0 +1,42 @@
+import datetime
+import uuid
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
+from backend.infrastructure.persistence.mappers.film import orm_to_film
+from backend.infrastructure.persistence.models.film import FilmORM
+
+STREAM_BATCH_SIZE = 500
+
+
+async def fetch_films_page(
+    session: AsyncSession,
+    stmt: Select[tuple[FilmORM, datetime.datetime]],
+    added_at: InstrumentedAttribute[datetime.datetime],
+    film_id: InstrumentedAttribute[uuid.UUID],
+    limit: int | None,
+    cursor: ItemCursor | None,
+) -> FilmsPage:
+    # Keyset pagination over (added_at, film_id) desc, served by the (parent_id, added_at, film_id) index.
+    stmt = stmt.order_by(added_at.desc(), film_id.desc())
+    if cursor is not None:
+        stmt = stmt.where(tuple_(added_at, film_id) < tuple_(cursor.added_at, cursor.film_id))
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+
+    result = await session.stream(stmt, execution_options={"yield_per": STREAM_BATCH_SIZE})
+    rows = [(orm_to_film(orm_film), item_added_at) async for orm_film, item_added_at in result]
+
+    if limit is None or len(rows) <= limit:
+        return FilmsPage(films=[film for film, _ in rows])
+
+    rows = rows[:limit]
+    last_film, last_added_at = rows[-1]
+    return FilmsPage(
+        films=[film for film, _ in rows],
+        next_cursor=ItemCursor(added_at=last_added_at, film_id=last_film.id),
+    )
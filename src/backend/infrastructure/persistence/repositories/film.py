@@ -1,5 +1,10 @@
+import datetime
+from collections.abc import Sequence
+
 from advanced_alchemy.exceptions import NotFoundError
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from sqlalchemy import case, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.application.errors import FilmNotFoundError, GenreNotFoundError
@@ -12,6 +17,8 @@ from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.film_genre import FilmGenre
 from backend.infrastructure.persistence.models.genre import GenreORM
 
+CYRILLIC_PATTERN = "[А-Яа-яЁё]"
+
 
 class _Repository(SQLAlchemyAsyncRepository[FilmORM]):
     model_type = FilmORM
@@ -34,6 +41,79 @@ class SQLAlchemyFilmRepository(FilmRepository):
             raise FilmNotFoundError from exc
         return orm_to_film(orm_film)
 
+    async def get_by_ids(self, films_ids: Sequence[FilmId]) -> list[Film]:
+        if not films_ids:
+            return []
+        result = await self._session.execute(select(FilmORM).where(FilmORM.id.in_(films_ids)))
+        films_by_id = {orm_film.id: orm_film for orm_film in result.scalars()}
+        return [orm_to_film(films_by_id[film_id]) for film_id in films_ids if film_id in films_by_id]
+
+    async def get_catalog_changes(
+        self, after: tuple[datetime.datetime, FilmId] | None, limit: int
+    ) -> list[tuple[Film, datetime.datetime]]:
+        stmt = select(FilmORM).where(FilmORM.owner_id.is_(None))
+        if after is not None:
+            stmt = stmt.where(tuple_(FilmORM.updated_at, FilmORM.id) > tuple_(*after))
+        result = await self._session.scalars(stmt.order_by(FilmORM.updated_at, FilmORM.id).limit(limit))
+        return [(orm_to_film(orm_film), orm_film.updated_at) for orm_film in result]
+
+    async def upsert_many(self, films: Sequence[Film], update_existing: bool = True) -> list[Film]:
+        films_by_tmdb_id: dict[int, Film] = {}
+        for film in films:
+            if film.tmdb_id is not None:
+                films_by_tmdb_id.setdefault(film.tmdb_id, film)
+        if not films_by_tmdb_id:
+            return []
+
+        stmt = insert(FilmORM).values([
+            {
+                "id": film.id,
+                "title": film.title,
+                "description": film.description,
+                "country": film.country,
+                "release_year": film.release_year,
+                "poster_url": film.poster_url,
+                "tmdb_id": film.tmdb_id,
+                "owner_id": None,
+            }
+            for film in films_by_tmdb_id.values()
+        ])
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[FilmORM.tmdb_id],
+                set_={
+                    # A localized title that is already stored wins over whatever the provider returned this time.
+                    "title": case(
+                        (FilmORM.title.regexp_match(CYRILLIC_PATTERN), FilmORM.title), else_=stmt.excluded.title
+                    ),
+                    "description": func.coalesce(stmt.excluded.description, FilmORM.description),
+                    "country": func.coalesce(stmt.excluded.country, FilmORM.country),
+                    "release_year": func.coalesce(stmt.excluded.release_year, FilmORM.release_year),
+                    "poster_url": func.coalesce(stmt.excluded.poster_url, FilmORM.poster_url),
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[FilmORM.tmdb_id])
+        result = await self._session.execute(
+            stmt.returning(FilmORM), execution_options={"populate_existing": True}
+        )
+        stored_by_tmdb_id = {orm_film.tmdb_id: orm_film for orm_film in result.scalars()}
+
+        skipped = [film for tmdb_id, film in films_by_tmdb_id.items() if tmdb_id not in stored_by_tmdb_id]
+        if skipped:
+            # Without an update the conflicting row is only reused when it is evidently the same film.
+            existing = await self._session.scalars(
+                select(FilmORM).where(FilmORM.tmdb_id.in_([film.tmdb_id for film in skipped]))
+            )
+            titles = {film.tmdb_id: film.title for film in skipped}
+            stored_by_tmdb_id.update(
+                (orm_film.tmdb_id, orm_film) for orm_film in existing if orm_film.title == titles[orm_film.tmdb_id]
+            )
+        return [
+            orm_to_film(stored_by_tmdb_id[tmdb_id]) for tmdb_id in films_by_tmdb_id if tmdb_id in stored_by_tmdb_id
+        ]
+
     async def update(self, updated_film: Film) -> Film:
         orm_film = film_to_orm(updated_film)
         try:
@@ -52,3 +132,27 @@ class SQLAlchemyFilmRepository(FilmRepository):
             if film_genre is None:
                 film_genres.append(FilmGenre(film_id=film_id, genre_id=genre_id))
         self._session.add_all(film_genres)
+
+    async def search(self, query: str, limit: int, offset: int = 0) -> Sequence[Film]:
+        query = query.strip()
+        if not query:
+            return []
+        pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        ts_query = func.websearch_to_tsquery("russian", query).op("||")(func.websearch_to_tsquery("simple", query))
+        rank = func.ts_rank(FilmORM.search_vector, ts_query) + func.similarity(FilmORM.title, query)
+        stmt = (
+            select(FilmORM)
+            .where(FilmORM.owner_id.is_(None))
+            .where(
+                or_(
+                    FilmORM.search_vector.op("@@")(ts_query),
+                    FilmORM.title.op("%")(query),
+                    FilmORM.title.ilike(f"%{pattern}%", escape="\\"),
+                )
+            )
+            .order_by(rank.desc(), FilmORM.release_year.desc().nulls_last(), FilmORM.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [orm_to_film(orm_film) for orm_film in result.scalars()]
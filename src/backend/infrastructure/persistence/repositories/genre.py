@@ -8,6 +8,7 @@ from backend.application.repositories.genre import GenreRepository
 from backend.domain.genre import Genre
 from backend.domain.genre_id import GenreId
 from backend.domain.mood_id import MoodId
+from backend.infrastructure.persistence.genre_mood_catalog import GenreMoodCatalog
 from backend.infrastructure.persistence.mappers.genre import orm_to_genre
 from backend.infrastructure.persistence.models.genre import GenreORM
 from backend.infrastructure.persistence.models.genre_mood import GenreMoodORM
@@ -18,11 +19,15 @@ class _Repository(SQLAlchemyAsyncRepository[GenreORM]):
 
 
 class SQLAlchemyGenreRepository(GenreRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, catalog: GenreMoodCatalog | None = None) -> None:
         self._session = session
         self._repo = _Repository(session=session)
+        self._catalog = catalog
 
     async def list_all(self, moods_ids: list[MoodId] | None = None) -> list[Genre]:
+        if self._catalog is not None:
+            return self._catalog.list_genres(moods_ids)
+
         if moods_ids:
             stmt = (
                 select(GenreORM)
@@ -38,6 +43,12 @@ class SQLAlchemyGenreRepository(GenreRepository):
         return [orm_to_genre(genre) for genre in orm_genres]
 
     async def get_by_id(self, genre_id: GenreId) -> Genre:
+        if self._catalog is not None:
+            genre = self._catalog.get_genre(genre_id)
+            if genre is None:
+                raise GenreNotFoundError
+            return genre
+
         try:
             orm_genre = await self._repo.get(genre_id)
         except NotFoundError as exc:
@@ -0,0 +1,58 @@
+import datetime
+from collections.abc import Sequence
+
+from sqlalchemy import or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.repositories.gpt_suggestion import GPTSuggestionRepository
+from backend.domain.cached_suggestions import CachedSuggestions
+from backend.infrastructure.persistence.models.gpt_suggestion import GPTSuggestionORM
+
+
+class SQLAlchemyGPTSuggestionRepository(GPTSuggestionRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def find_candidates(
+        self, fingerprint: str, band_keys: Sequence[int], created_after: datetime.datetime, limit: int
+    ) -> list[CachedSuggestions]:
+        stmt = (
+            select(GPTSuggestionORM)
+            .where(
+                or_(
+                    GPTSuggestionORM.fingerprint == fingerprint,
+                    GPTSuggestionORM.band_keys.overlap(list(band_keys)),
+                )
+            )
+            .where(GPTSuggestionORM.created_at > created_after)
+            .limit(limit)
+        )
+        result = await self._session.execute(stmt)
+        return [_to_entry(orm_entry) for orm_entry in result.scalars()]
+
+    async def save(self, entry: CachedSuggestions) -> None:
+        stmt = insert(GPTSuggestionORM).values(
+            fingerprint=entry.fingerprint,
+            signature=entry.signature,
+            band_keys=entry.band_keys,
+            suggestions=[
+                {"media_name": media_name, "confidence": confidence} for media_name, confidence in entry.suggestions
+            ],
+            created_at=entry.created_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[GPTSuggestionORM.fingerprint],
+            set_={"suggestions": stmt.excluded.suggestions, "created_at": stmt.excluded.created_at},
+        )
+        await self._session.execute(stmt)
+
+
+def _to_entry(orm_entry: GPTSuggestionORM) -> CachedSuggestions:
+    return CachedSuggestions(
+        fingerprint=orm_entry.fingerprint,
+        signature=list(orm_entry.signature),
+        band_keys=list(orm_entry.band_keys),
+        suggestions=[(item["media_name"], float(item["confidence"])) for item in orm_entry.suggestions],
+        created_at=orm_entry.created_at,
+    )
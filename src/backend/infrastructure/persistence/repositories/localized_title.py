@@ -0,0 +1,36 @@
+import datetime
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.application.repositories.localized_title import LocalizedTitleRepository
+from backend.infrastructure.persistence.models.localized_title import LocalizedTitleORM
+
+
+class SQLAlchemyLocalizedTitleRepository(LocalizedTitleRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_many(self, tmdb_ids: Sequence[int]) -> Mapping[int, str]:
+        if not tmdb_ids:
+            return {}
+        stmt = select(LocalizedTitleORM.tmdb_id, LocalizedTitleORM.title).where(
+            LocalizedTitleORM.tmdb_id.in_(tmdb_ids)
+        )
+        result = await self._session.execute(stmt)
+        return dict(result.tuples().all())
+
+    async def save_many(self, titles: Mapping[int, str]) -> None:
+        if not titles:
+            return
+        resolved_at = datetime.datetime.now(datetime.UTC)
+        stmt = insert(LocalizedTitleORM).values(
+            [{"tmdb_id": tmdb_id, "title": title, "resolved_at": resolved_at} for tmdb_id, title in titles.items()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LocalizedTitleORM.tmdb_id],
+            set_={"title": stmt.excluded.title, "resolved_at": stmt.excluded.resolved_at},
+        )
+        await self._session.execute(stmt)
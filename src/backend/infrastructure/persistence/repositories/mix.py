@@ -3,18 +3,23 @@ from collections.abc import Sequence
 from advanced_alchemy.exceptions import NotFoundError
 from advanced_alchemy.filters import OrderBy
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.application.errors import MixNotFoundError
 from backend.application.repositories.mix import MixRepository
 from backend.domain.film_id import FilmId
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
 from backend.domain.mix import Mix
 from backend.domain.mix_id import MixId
 from backend.domain.mix_item import MixItem
 from backend.infrastructure.persistence.mappers.mix import orm_to_mix
 from backend.infrastructure.persistence.mappers.mix_item import mix_item_to_orm, orm_to_mix_item
+from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.mix import MixORM
 from backend.infrastructure.persistence.models.mix_item import MixItemORM
+from backend.infrastructure.persistence.pagination import fetch_films_page
 
 
 class _Repository(SQLAlchemyAsyncRepository[MixORM]):
@@ -50,6 +55,20 @@ class SQLAlchemyMixRepository(MixRepository):
             raise MixNotFoundError from exc
         return [orm_to_mix_item(item) for item in orm_items]
 
+    async def get_films_for_mix(
+        self, mix_id: MixId, limit: int | None = None, cursor: ItemCursor | None = None
+    ) -> FilmsPage:
+        try:
+            await self._repo.get(mix_id)
+        except NotFoundError as exc:
+            raise MixNotFoundError from exc
+        stmt = (
+            select(FilmORM, MixItemORM.added_at)
+            .join(MixItemORM, MixItemORM.film_id == FilmORM.id)
+            .where(MixItemORM.mix_id == mix_id)
+        )
+        return await fetch_films_page(self._session, stmt, MixItemORM.added_at, MixItemORM.film_id, limit, cursor)
+
     async def add_item(self, item: MixItem) -> None:
         orm_item = mix_item_to_orm(item)
         await self._item_repo.add(orm_item)
@@ -8,6 +8,7 @@ from backend.application.errors import MoodNotFoundError
 from backend.application.repositories.mood import MoodRepository
 from backend.domain.mood import Mood
 from backend.domain.mood_id import MoodId
+from backend.infrastructure.persistence.genre_mood_catalog import GenreMoodCatalog
 from backend.infrastructure.persistence.mappers.mood import orm_to_mood
 from backend.infrastructure.persistence.models.mood import MoodORM
 
@@ -17,15 +18,25 @@ class _Repository(SQLAlchemyAsyncRepository[MoodORM]):
 
 
 class SQLAlchemyMoodRepository(MoodRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, catalog: GenreMoodCatalog | None = None) -> None:
         self._session = session
         self._repo = _Repository(session=session)
+        self._catalog = catalog
 
     async def list_all(self) -> Sequence[Mood]:
+        if self._catalog is not None:
+            return self._catalog.list_moods()
+
         orm_moods = await self._repo.list()
         return [orm_to_mood(mood) for mood in orm_moods]
 
     async def get_by_id(self, mood_id: MoodId) -> Mood:
+        if self._catalog is not None:
+            mood = self._catalog.get_mood(mood_id)
+            if mood is None:
+                raise MoodNotFoundError(f"Mood with id {mood_id} not found")
+            return mood
+
         try:
             orm_mood = await self._repo.get(mood_id)
         except NotFoundError as exc:
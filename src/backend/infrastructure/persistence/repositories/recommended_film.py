@@ -2,7 +2,7 @@ import datetime
 from collections.abc import Sequence
 
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.application.repositories.recommended_film import RecommendedFilmRepository
@@ -12,6 +12,7 @@ from backend.infrastructure.persistence.mappers.recommended_film import (
     orm_to_recommended_film,
     recommended_film_to_orm,
 )
+from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.recommended_film import RecommendedFilmORM
 
 
@@ -38,3 +39,19 @@ class SQLAlchemyRecommendedFilmRepository(RecommendedFilmRepository):
         result = await self._session.execute(stmt)
         orm_recommendations = result.scalars().all()
         return [orm_to_recommended_film(orm) for orm in orm_recommendations]
+
+    async def get_recent_tmdb_ids(
+        self, user_id: UserId, time_threshold: datetime.datetime, limit: int
+    ) -> Sequence[int]:
+        stmt = (
+            select(FilmORM.tmdb_id)
+            .join(RecommendedFilmORM, RecommendedFilmORM.film_id == FilmORM.id)
+            .where(RecommendedFilmORM.user_id == user_id)
+            .where(RecommendedFilmORM.recommended_at >= time_threshold)
+            .where(FilmORM.tmdb_id.is_not(None))
+            .group_by(FilmORM.tmdb_id)
+            .order_by(func.max(RecommendedFilmORM.recommended_at).desc())
+            .limit(limit)
+        )
+        result = await self._session.scalars(stmt)
+        return list(result)
@@ -1,25 +1,40 @@
+import datetime
+import random
 import uuid
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 from typing import cast
 
 from advanced_alchemy.exceptions import NotFoundError
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
 from advanced_alchemy.filters import OrderBy
-from sqlalchemy import select
+from sqlalchemy import event, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from backend.application.errors import WatchlistNotFoundError
 from backend.application.repositories.watchlist import WatchlistRepository
+from backend.domain.film import Film
 from backend.domain.film_id import FilmId
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
 from backend.domain.user_id import UserId
 from backend.domain.watchlist import Watchlist
 from backend.domain.watchlist_id import WatchlistId
 from backend.domain.watchlist_item import WatchlistItem
 from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.persistence.library_cache import LibraryCache
+from backend.infrastructure.persistence.mappers.film import orm_to_film
 from backend.infrastructure.persistence.mappers.watchlist import orm_to_watchlist, watchlist_to_orm
 from backend.infrastructure.persistence.mappers.watchlist_item import orm_to_watchlist_item, watchlist_item_to_orm
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.recommended_film import RecommendedFilmORM
 from backend.infrastructure.persistence.models.watchlist import WatchlistORM
 from backend.infrastructure.persistence.models.watchlist_item import WatchlistItemORM
+from backend.infrastructure.persistence.pagination import fetch_films_page
+
+
+COMMON_WATCHLIST_TYPES = (WatchlistType.liked, WatchlistType.watched, WatchlistType.wish)
 
 
 class _Repository(SQLAlchemyAsyncRepository[WatchlistORM]):
@@ -31,10 +46,17 @@ class _ItemRepository(SQLAlchemyAsyncRepository[WatchlistItemORM]):
 
 
 class SQLAlchemyWatchlistRepository(WatchlistRepository):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession, library_cache: LibraryCache | None = None) -> None:
         self._session = session
         self._repo = _Repository(session=session)
         self._item_repo = _ItemRepository(session=session)
+        self._library_cache = library_cache
+        self._library_changes: list[tuple[UserId, WatchlistType, FilmId, bool]] = []
+        if library_cache is not None:
+            # The cache only learns about a change once it is committed, so a concurrent load can never read
+            # the database before the change is visible and then cache the library after it.
+            event.listen(session.sync_session, "after_commit", self._apply_library_changes)
+            event.listen(session.sync_session, "after_rollback", self._discard_library_changes)
 
     async def create_watchlist(self, watchlist: Watchlist) -> Watchlist:
         orm_watchlist = watchlist_to_orm(watchlist)
@@ -59,17 +81,50 @@ class SQLAlchemyWatchlistRepository(WatchlistRepository):
             raise WatchlistNotFoundError from exc
         return [orm_to_watchlist_item(e) for e in orm_items]
 
+    async def get_films_for_watchlist(
+        self, watchlist_id: WatchlistId, limit: int | None = None, cursor: ItemCursor | None = None
+    ) -> FilmsPage:
+        stmt = (
+            select(FilmORM, WatchlistItemORM.added_at)
+            .join(WatchlistItemORM, WatchlistItemORM.film_id == FilmORM.id)
+            .where(WatchlistItemORM.watchlist_id == watchlist_id)
+        )
+        return await fetch_films_page(
+            self._session, stmt, WatchlistItemORM.added_at, WatchlistItemORM.film_id, limit, cursor
+        )
+
     async def add_item(self, item: WatchlistItem) -> None:
         orm_item = await self._session.get(WatchlistItemORM, (item.watchlist_id, item.film_id))
         if orm_item is None:
             orm_item = watchlist_item_to_orm(item)
             await self._item_repo.add(orm_item)
+            await self._sync_library_cache(item.watchlist_id, item.film_id, added=True)
 
     async def delete_item(self, watchlist_id: WatchlistId, film_id: FilmId) -> None:
         try:
             await self._item_repo.delete_where(watchlist_id=watchlist_id, film_id=film_id)
         except NotFoundError as exc:
             raise WatchlistNotFoundError from exc
+        await self._sync_library_cache(watchlist_id, film_id, added=False)
+
+    async def _sync_library_cache(self, watchlist_id: WatchlistId, film_id: FilmId, *, added: bool) -> None:
+        if self._library_cache is None:
+            return
+        orm_watchlist = await self._session.get(WatchlistORM, watchlist_id)
+        if orm_watchlist is None or orm_watchlist.type not in COMMON_WATCHLIST_TYPES:
+            return
+        self._library_changes.append((UserId(orm_watchlist.user_id), orm_watchlist.type, film_id, added))
+
+    def _apply_library_changes(self, _: Session) -> None:
+        changes, self._library_changes = self._library_changes, []
+        for user_id, watchlist_type, film_id, added in changes:
+            if added:
+                self._library_cache.add(user_id, watchlist_type, film_id)
+            else:
+                self._library_cache.discard(user_id, watchlist_type, film_id)
+
+    def _discard_library_changes(self, _: Session) -> None:
+        self._library_changes.clear()
 
     async def create_common_watchlist_for_user(self, user_id: UserId) -> None:
         watchlists = (
@@ -104,7 +159,7 @@ class SQLAlchemyWatchlistRepository(WatchlistRepository):
         self._session.add_all(watchlists)
 
     async def get_common_watchlist_for_user(self, watchlist_type: WatchlistType, user_id: UserId) -> Watchlist:
-        if watchlist_type not in (WatchlistType.liked, WatchlistType.watched, WatchlistType.wish):
+        if watchlist_type not in COMMON_WATCHLIST_TYPES:
             raise ValueError("type is not common")
         orm_watchlist = await self._session.scalar(
             select(WatchlistORM).where(WatchlistORM.user_id == user_id).where(WatchlistORM.type == watchlist_type)
@@ -150,5 +205,72 @@ class SQLAlchemyWatchlistRepository(WatchlistRepository):
         watchlists_orm = await self._repo.list(user_id=user_id)
         return [orm_to_watchlist(i) for i in watchlists_orm]
 
+    async def get_random_film_not_recommended_since(
+        self, watchlist_type: WatchlistType, user_id: UserId, since: datetime.datetime
+    ) -> Film | None:
+        watchlist_id = (
+            select(WatchlistORM.id)
+            .where(WatchlistORM.user_id == user_id)
+            .where(WatchlistORM.type == watchlist_type)
+            .limit(1)
+            .scalar_subquery()
+        )
+        recently_recommended = exists().where(
+            RecommendedFilmORM.user_id == user_id,
+            RecommendedFilmORM.film_id == WatchlistItemORM.film_id,
+            RecommendedFilmORM.recommended_at >= since,
+        )
+        stmt = (
+            select(FilmORM)
+            .join(WatchlistItemORM, WatchlistItemORM.film_id == FilmORM.id)
+            .where(WatchlistItemORM.watchlist_id == watchlist_id)
+            .where(~recently_recommended)
+            .order_by(WatchlistItemORM.sort_key)
+            .limit(1)
+        )
+
+        # Walk the (watchlist_id, sort_key) index from a random point and wrap around once,
+        # so picking a film does not depend on the size of the watchlist.
+        pivot = random.random()
+        orm_film = await self._session.scalar(stmt.where(WatchlistItemORM.sort_key >= pivot))
+        if orm_film is None:
+            orm_film = await self._session.scalar(stmt.where(WatchlistItemORM.sort_key < pivot))
+        return orm_to_film(orm_film) if orm_film is not None else None
+
+    async def get_common_types_for_films(
+        self, user_id: UserId, films_ids: Sequence[FilmId]
+    ) -> Mapping[FilmId, set[WatchlistType]]:
+        if not films_ids:
+            return {}
+
+        stmt = (
+            select(WatchlistItemORM.film_id, WatchlistORM.type)
+            .join(WatchlistORM, WatchlistORM.id == WatchlistItemORM.watchlist_id)
+            .where(WatchlistORM.user_id == user_id)
+            .where(WatchlistORM.type.in_(COMMON_WATCHLIST_TYPES))
+        )
+
+        types_by_film: defaultdict[FilmId, set[WatchlistType]] = defaultdict(set)
+        if self._library_cache is not None:
+            cached = self._library_cache.get_types_for_films(user_id, films_ids)
+            if cached is not None:
+                return cached
+            # Load the whole library once so later lookups for this user skip the database.
+            generation = self._library_cache.generation()
+            rows = [(FilmId(film_id), watchlist_type) for film_id, watchlist_type in await self._session.execute(stmt)]
+            # Uncommitted changes of this request are visible here but must not reach the shared cache.
+            if not any(change[0] == user_id for change in self._library_changes):
+                self._library_cache.put(user_id, rows, generation)
+            requested = set(films_ids)
+            for film_id, watchlist_type in rows:
+                if film_id in requested:
+                    types_by_film[film_id].add(watchlist_type)
+            return types_by_film
+
+        stmt = stmt.where(WatchlistItemORM.film_id.in_(films_ids))
+        for film_id, watchlist_type in await self._session.execute(stmt):
+            types_by_film[FilmId(film_id)].add(watchlist_type)
+        return types_by_film
+
     async def delete_watchlist(self, watchlist_id: WatchlistId) -> None:
         await self._repo.delete(watchlist_id)
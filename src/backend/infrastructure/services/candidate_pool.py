@@ -0,0 +1,104 @@
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Collection
+from typing import Any
+
+Fetch = Callable[[list[str] | None, str | None, list[int]], Awaitable[dict[str, Any] | None]]
+_PoolKey = tuple[frozenset[str], str | None]
+
+
+class CandidatePool:
+    def __init__(
+        self,
+        fetch: Fetch,
+        capacity: int = 20,
+        low_water: int = 5,
+        refill_concurrency: int = 4,
+        max_pools: int = 256,
+    ) -> None:
+        self._fetch = fetch
+        self._capacity = capacity
+        self._low_water = low_water
+        self._refill_concurrency = refill_concurrency
+        self._max_pools = max_pools
+        self._pools: OrderedDict[_PoolKey, deque[dict[str, Any]]] = OrderedDict()
+        self._refills: dict[_PoolKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def take(
+        self, genres: list[str] | None, movie_type: str | None, excluded_ids: Collection[int] = ()
+    ) -> dict[str, Any] | None:
+        key = self._key(genres, movie_type)
+        pool = self._get_pool(key)
+
+        candidate = None
+        for _ in range(len(pool)):
+            item = pool.popleft()
+            if item.get("tmdb_id") not in excluded_ids:
+                candidate = item
+                break
+            # Excluded for this user only, so keep it for others.
+            pool.append(item)
+
+        if len(pool) < self._low_water:
+            self._schedule_refill(key, genres, movie_type)
+
+        if candidate is not None:
+            self.hits += 1
+            return candidate
+        self.misses += 1
+        return await self._fetch(genres or None, movie_type, list(excluded_ids))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pools": len(self._pools),
+            "candidates": sum(len(pool) for pool in self._pools.values()),
+            "refilling": len(self._refills),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def close(self) -> None:
+        tasks = list(self._refills.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _key(self, genres: list[str] | None, movie_type: str | None) -> _PoolKey:
+        return frozenset(genre.lower() for genre in genres or ()), movie_type.lower() if movie_type else None
+
+    def _get_pool(self, key: _PoolKey) -> deque[dict[str, Any]]:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = deque(maxlen=self._capacity)
+            while len(self._pools) > self._max_pools:
+                self._pools.popitem(last=False)
+        self._pools.move_to_end(key)
+        return pool
+
+    def _schedule_refill(self, key: _PoolKey, genres: list[str] | None, movie_type: str | None) -> None:
+        if key in self._refills:
+            return
+        task = asyncio.create_task(self._refill(key, genres, movie_type))
+        self._refills[key] = task
+        task.add_done_callback(lambda _: self._refills.pop(key, None))
+
+    async def _refill(self, key: _PoolKey, genres: list[str] | None, movie_type: str | None) -> None:
+        pool = self._pools.get(key)
+        attempts = 0
+        while pool is not None and len(pool) < self._capacity and attempts < self._capacity * 2:
+            batch_size = min(self._refill_concurrency, self._capacity - len(pool))
+            attempts += batch_size
+            results = await asyncio.gather(
+                *(self._fetch(genres or None, movie_type, []) for _ in range(batch_size)), return_exceptions=True
+            )
+            # The pool may have been evicted while fetching; filling the orphaned deque would only waste the results.
+            pool = self._pools.get(key)
+            if pool is None:
+                return
+            seen_ids = {item.get("tmdb_id") for item in pool}
+            for result in results:
+                if isinstance(result, dict) and result.get("tmdb_id") not in seen_ids:
+                    pool.append(result)
+                    seen_ids.add(result.get("tmdb_id"))
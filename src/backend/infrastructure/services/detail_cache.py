@@ -0,0 +1,80 @@
+import asyncio
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from backend.infrastructure.cache import TTLCache
+
+
+class DiskStore:
+    def __init__(self, path: str | Path) -> None:
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = asyncio.Lock()
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS detail (key TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    async def get(self, key: str) -> tuple[float, dict[str, Any]] | None:
+        async with self._lock:
+            row = await asyncio.to_thread(self._select, key)
+        if row is None:
+            return None
+        expires_at, payload = row
+        return expires_at, json.loads(payload)
+
+    async def set(self, key: str, expires_at: float, value: dict[str, Any]) -> None:
+        payload = json.dumps(value, ensure_ascii=False)
+        async with self._lock:
+            await asyncio.to_thread(self._upsert, key, expires_at, payload)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _select(self, key: str) -> tuple[float, str] | None:
+        return self._connection.execute(
+            "SELECT expires_at, payload FROM detail WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+
+    def _upsert(self, key: str, expires_at: float, payload: str) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO detail (key, expires_at, payload) VALUES (?, ?, ?)", (key, expires_at, payload)
+        )
+        self._connection.commit()
+
+
+class DetailCache:
+    def __init__(self, maxsize: int = 5_000, ttl: float = 86_400.0, disk_store: DiskStore | None = None) -> None:
+        self.ttl = ttl
+        self._memory: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._disk_store = disk_store
+        self.disk_hits = 0
+
+    async def get(self, provider: str, item_id: int) -> dict[str, Any] | None:
+        key = f"{provider}:{item_id}"
+        value = self._memory.get(key)
+        if value is not None or self._disk_store is None:
+            return value
+
+        stored = await self._disk_store.get(key)
+        if stored is None:
+            return None
+        expires_at, value = stored
+        self.disk_hits += 1
+        self._memory.set(key, value, ttl=expires_at - time.time())
+        return value
+
+    async def set(self, provider: str, item_id: int, value: dict[str, Any]) -> None:
+        key = f"{provider}:{item_id}"
+        self._memory.set(key, value)
+        if self._disk_store is not None:
+            await self._disk_store.set(key, time.time() + self.ttl, value)
+
+    def stats(self) -> dict[str, int]:
+        return {**self._memory.stats(), "disk_hits": self.disk_hits}
+
+    def close(self) -> None:
+        if self._disk_store is not None:
+            self._disk_store.close()
@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+import datetime
+import os
+import threading
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.domain.film import Film
+from backend.domain.film_id import FilmId
+from backend.infrastructure.persistence.repositories.film import SQLAlchemyFilmRepository
+from backend.infrastructure.text_index import TextIndex
+
+
+class FilmIndex:
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        path: str | None = None,
+        refresh_interval: float = 60.0,
+        batch_size: int = 1_000,
+        min_score: float = 0.2,
+        confident_score: float = 0.45,
+        overlap: float = 60.0,
+    ) -> None:
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.batch_size = batch_size
+        self.min_score = min_score
+        self.confident_score = confident_score
+        self.overlap = datetime.timedelta(seconds=overlap)
+        self._sessionmaker = sessionmaker
+        self._index = TextIndex()
+        # Searches run in worker threads while refreshes modify the index, so both go through this lock.
+        self._lock = threading.Lock()
+        self._cursor: tuple[datetime.datetime, FilmId] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def search(self, description: str, limit: int) -> list[tuple[FilmId, float]]:
+        # Scoring walks whole posting lists, so it runs off the event loop.
+        return await asyncio.to_thread(self._search, description, limit)
+
+    def is_confident(self, results: list[tuple[FilmId, float]]) -> bool:
+        return bool(results) and results[0][1] >= self.confident_score
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def refresh(self) -> int:
+        # Changes are read in (updated_at, id) order starting a little before the last one seen: now() is taken
+        # when a transaction starts, so a transaction that commits late can add rows behind the cursor.
+        since = self._cursor[0] if self._cursor else None
+        after = (since - self.overlap, FilmId(uuid.UUID(int=0))) if since else None
+        indexed = 0
+        async with self._sessionmaker() as session:
+            repo = SQLAlchemyFilmRepository(session=session)
+            while True:
+                changes = await repo.get_catalog_changes(after, self.batch_size)
+                if not changes:
+                    break
+                # Rows inside the overlap that are already indexed were seen by the previous refresh.
+                films = [
+                    film
+                    for film, updated_at in changes
+                    if film.id not in self._index or (since is not None and updated_at > since)
+                ]
+                if films:
+                    await asyncio.to_thread(self._replace, films)
+                indexed += len(films)
+                after = (changes[-1][1], changes[-1][0].id)
+                if self._cursor is None or after > self._cursor:
+                    self._cursor = after
+                if len(changes) < self.batch_size:
+                    break
+        return indexed
+
+    def stats(self) -> dict[str, int]:
+        return {"films": len(self._index)}
+
+    def _search(self, description: str, limit: int) -> list[tuple[FilmId, float]]:
+        with self._lock:
+            return self._index.search(description, limit, min_score=self.min_score)
+
+    def _replace(self, films: list[Film]) -> None:
+        with self._lock:
+            for film in films:
+                self._index.replace(film.id, f"{film.title} {film.description or ''}")
+
+    def _load(self, path: str) -> None:
+        index = TextIndex.load(path)
+        cursor = None
+        if os.path.isfile(f"{path}.cursor"):
+            with open(f"{path}.cursor", encoding="utf-8") as f:
+                updated_at, film_id = f.read().split()
+            cursor = datetime.datetime.fromisoformat(updated_at), FilmId(uuid.UUID(film_id))
+        with self._lock:
+            self._index, self._cursor = index, cursor
+
+    def _save(self, path: str, cursor: tuple[datetime.datetime, FilmId] | None) -> None:
+        with self._lock:
+            self._index.save(path)
+        if cursor is not None:
+            tmp_path = f"{path}.cursor.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(f"{cursor[0].isoformat()} {cursor[1]}")
+            os.replace(tmp_path, f"{path}.cursor")
+
+    async def _run(self) -> None:
+        if self.path and os.path.isfile(self.path):
+            try:
+                await asyncio.to_thread(self._load, self.path)
+            except Exception as e:
+                print(f"Error loading film index: {e}")
+
+        while True:
+            try:
+                if await self.refresh() and self.path:
+                    await asyncio.to_thread(self._save, self.path, self._cursor)
+            except Exception as e:
+                print(f"Error refreshing film index: {e}")
+            await asyncio.sleep(self.refresh_interval)
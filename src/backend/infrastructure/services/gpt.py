@@ -1,10 +1,14 @@
 import json
 import re
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 
+import httpx
 from openai import AsyncClient
 
 from backend.config.settings import Settings
+from backend.infrastructure.palette import is_hex_color
+from backend.infrastructure.services.suggestion_cache import SuggestionCache
 
 
 @dataclass
@@ -23,29 +27,44 @@ class ChatGPTMediaResult:
     not_found: bool = False
 
 
-class GPTService:
-    def __init__(self, api_key: str = Settings().GPT_API_KEY, base_url: str = Settings().GPT_BASE):
-        self.client = AsyncClient(api_key=api_key, base_url=f"{base_url}/v1")
+# Returns every JSON object together with its nesting depth as soon as its closing brace arrives,
+# so the items of "suggestions" are available before the model finishes the whole answer.
+class JSONObjectScanner:
+    def __init__(self) -> None:
+        self._text = ""
+        self._position = 0
+        self._starts: list[int] = []
 
-    def _find_json_objects(self, text: str) -> list[str]:
+    def feed(self, chunk: str) -> list[tuple[int, str]]:
+        self._text += chunk
         objects = []
-        brace_level = 0
-        start_index = None
 
-        for i, ch in enumerate(text):
+        for i in range(self._position, len(self._text)):
+            ch = self._text[i]
             if ch == "{":
-                if brace_level == 0:
-                    start_index = i
-                brace_level += 1
-            elif ch == "}":
-                brace_level -= 1
-                if brace_level == 0 and start_index is not None:
-                    obj_str = text[start_index : i + 1]
-                    objects.append(obj_str)
-                    start_index = None
+                self._starts.append(i)
+            elif ch == "}" and self._starts:
+                start_index = self._starts.pop()
+                objects.append((len(self._starts), self._text[start_index : i + 1]))
 
+        self._position = len(self._text)
         return objects
 
+
+class GPTService:
+    def __init__(
+        self,
+        api_key: str = Settings().GPT_API_KEY,
+        base_url: str = Settings().GPT_BASE,
+        http_client: httpx.AsyncClient | None = None,
+        suggestion_cache: SuggestionCache | None = None,
+    ):
+        self.client = AsyncClient(api_key=api_key, base_url=f"{base_url}/v1", http_client=http_client)
+        self.suggestion_cache = suggestion_cache
+
+    def _find_json_objects(self, text: str) -> list[str]:
+        return [obj_str for depth, obj_str in JSONObjectScanner().feed(text) if depth == 0]
+
     def _extract_json_to_dict(self, text: str) -> dict | None:
         print("Полный текст ответа от GPT:\n", text)
 
@@ -120,8 +139,8 @@ class GPTService:
 
         return fixed
 
-    async def identify_multiple_media(self, description: str, limit: int = 10) -> ChatGPTMediaResult:
-        prompt = (
+    def _media_prompt(self, description: str, limit: int) -> str:
+        return (
             f"На основе данного описания: '{description}', определи до {limit} различных медиа произведений, "
             "которые могут соответствовать этому описанию.\n\n"
             "Рассмотри все типы медиа контента:\n"
@@ -146,9 +165,55 @@ class GPTService:
             "В ОТВЕТЕ ВСЕГДА <important>ТОЛЬКО JSON</important>."
         )
 
+    def _parse_suggestion(self, suggestion: object) -> MediaSuggestion | None:
+        if not isinstance(suggestion, dict) or "media_name" not in suggestion:
+            return None
+        # One bad object (e.g. confidence outside [0, 1]) is skipped instead of ending the whole answer.
+        try:
+            confidence = suggestion.get("confidence", 0.5)
+            if not isinstance(confidence, (int, float)):
+                confidence = float(confidence) if str(confidence).replace(".", "").isdigit() else 0.5
+            return MediaSuggestion(media_name=suggestion["media_name"], confidence=confidence)
+        except (TypeError, ValueError) as e:
+            print(f"Skipping GPT suggestion {suggestion}: {e!s}")
+            return None
+
+    def _parse_object(self, obj_str: str) -> dict | None:
+        try:
+            return json.loads(obj_str)
+        except json.JSONDecodeError:
+            try:
+                return json.loads(self._fix_common_json_errors(obj_str))
+            except json.JSONDecodeError:
+                return None
+
+    async def _cached_suggestions(self, description: str, limit: int) -> list[MediaSuggestion] | None:
+        if self.suggestion_cache is None:
+            return None
+        cached = await self.suggestion_cache.get(description)
+        if cached is None:
+            return None
+        return [
+            MediaSuggestion(media_name=media_name, confidence=confidence) for media_name, confidence in cached[:limit]
+        ]
+
+    async def _cache_suggestions(self, description: str, suggestions: list[MediaSuggestion]) -> None:
+        # Only answers with suggestions are cached: an empty answer cannot be told apart from a failed one.
+        if suggestions and self.suggestion_cache is not None:
+            await self.suggestion_cache.set(
+                description, [(suggestion.media_name, suggestion.confidence) for suggestion in suggestions]
+            )
+
+    async def identify_multiple_media(self, description: str, limit: int = 10) -> ChatGPTMediaResult:
+        cached = await self._cached_suggestions(description, limit)
+        if cached is not None:
+            return ChatGPTMediaResult(suggestions=cached)
+
         try:
             response = await self.client.chat.completions.create(
-                model="claude-3-sonnet-20240229", messages=[{"role": "user", "content": prompt}], temperature=1
+                model="claude-3-sonnet-20240229",
+                messages=[{"role": "user", "content": self._media_prompt(description, limit)}],
+                temperature=1,
             )
             response_text = response.choices[0].message.content
             print(response_text)
@@ -158,13 +223,12 @@ class GPTService:
             if not json_data or not isinstance(json_data.get("suggestions"), list):
                 return ChatGPTMediaResult(not_found=True)
 
-            suggestions = []
-            for suggestion in json_data.get("suggestions", []):
-                if isinstance(suggestion, dict) and "media_name" in suggestion:
-                    confidence = suggestion.get("confidence", 0.5)
-                    if not isinstance(confidence, (int, float)):
-                        confidence = float(confidence) if str(confidence).replace(".", "").isdigit() else 0.5
-                    suggestions.append(MediaSuggestion(media_name=suggestion["media_name"], confidence=confidence))
+            suggestions = [
+                suggestion
+                for raw_suggestion in json_data.get("suggestions", [])
+                if (suggestion := self._parse_suggestion(raw_suggestion)) is not None
+            ]
+            await self._cache_suggestions(description, suggestions)
 
             return ChatGPTMediaResult(
                 suggestions=suggestions, not_found=json_data.get("not_found", len(suggestions) == 0)
@@ -173,7 +237,53 @@ class GPTService:
             print(f"GPT Error: {e!s}")
             return ChatGPTMediaResult(not_found=True)
 
-    async def generate_gradient_colors(self, title: str) -> tuple[str, str]:
+    async def stream_multiple_media(self, description: str, limit: int = 10) -> AsyncIterator[MediaSuggestion]:
+        cached = await self._cached_suggestions(description, limit)
+        if cached is not None:
+            for suggestion in cached:
+                yield suggestion
+            return
+
+        suggestions: list[MediaSuggestion] = []
+        scanner = JSONObjectScanner()
+        response_text = ""
+        try:
+            stream = await self.client.chat.completions.create(
+                model="claude-3-sonnet-20240229",
+                messages=[{"role": "user", "content": self._media_prompt(description, limit)}],
+                temperature=1,
+                stream=True,
+            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                response_text += delta
+                # Nested objects close first, so every suggestion is parsed before the outer answer is complete.
+                for depth, obj_str in scanner.feed(delta):
+                    if depth == 0 or len(suggestions) >= limit:
+                        continue
+                    suggestion = self._parse_suggestion(self._parse_object(obj_str))
+                    if suggestion is not None:
+                        suggestions.append(suggestion)
+                        yield suggestion
+        except Exception as e:
+            print(f"GPT Stream Error: {e!s}")
+            return
+
+        if not suggestions:
+            # The model did not follow the expected format, so fall back to parsing the whole answer.
+            json_data = self._extract_json_to_dict(response_text)
+            if json_data and isinstance(json_data.get("suggestions"), list):
+                for raw_suggestion in json_data["suggestions"][:limit]:
+                    suggestion = self._parse_suggestion(raw_suggestion)
+                    if suggestion is not None:
+                        suggestions.append(suggestion)
+                        yield suggestion
+
+        await self._cache_suggestions(description, suggestions)
+
+    async def generate_gradient_colors(self, title: str) -> tuple[str, str] | None:
         prompt = (
             f"Предложи два цвета градиента (в формате HEX, например #FF5733) для темы '{title}', "
             "которые символически подходят к этой теме. Цвета должны быть не пёстрые и не тусклые."
@@ -191,9 +301,9 @@ class GPTService:
             )
             response_text = response.choices[0].message.content
             json_data = self._extract_json_to_dict(response_text)
-            if json_data and "color1" in json_data and "color2" in json_data:
-                return json_data["color1"], json_data["color2"]
-            return "#FFFFFF", "#000000"  # noqa: TRY300
+            if json_data and is_hex_color(json_data.get("color1")) and is_hex_color(json_data.get("color2")):
+                return json_data["color1"].upper(), json_data["color2"].upper()
+            return None  # noqa: TRY300
         except Exception as e:
             print(f"GPT Color Generation Error: {e!s}")
-            return "#FFFFFF", "#000000"
+            return None
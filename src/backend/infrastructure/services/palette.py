@@ -0,0 +1,44 @@
+import asyncio
+
+from backend.infrastructure.cache import TTLCache
+from backend.infrastructure.palette import Gradient, normalize_title, pick_gradient
+from backend.infrastructure.services.gpt import GPTService
+
+
+class PaletteService:
+    def __init__(
+        self,
+        gpt_service: GPTService | None = None,
+        maxsize: int = 1_024,
+        ttl: float = 7 * 86_400.0,
+        timeout: float = 3.0,
+    ) -> None:
+        self.gpt_service = gpt_service
+        self.timeout = timeout
+        self._cache: TTLCache[str, Gradient] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def gradient(self, title: str) -> Gradient:
+        gradient = pick_gradient(title)
+        if self.gpt_service is None:
+            return gradient
+
+        key = normalize_title(title)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                colors = await self.gpt_service.generate_gradient_colors(title)
+        except TimeoutError:
+            print(f"GPT gradient for '{title}' timed out, using local palette")
+            return gradient
+        if colors is None:
+            return gradient
+
+        enriched = (colors[0], colors[1], gradient[2])
+        self._cache.set(key, enriched)
+        return enriched
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
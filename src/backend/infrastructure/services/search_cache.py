@@ -0,0 +1,40 @@
+from collections.abc import Sequence
+
+from backend.domain.film_id import FilmId
+from backend.infrastructure.cache import TTLCache
+
+_Key = tuple[str, str, int]
+
+
+def normalize_query(query: str | None) -> str:
+    if not query:
+        return ""
+    return " ".join(query.casefold().replace("ё", "е").split())
+
+
+class SearchCache:
+    def __init__(self, maxsize: int = 10_000, ttl: float = 600.0, negative_ttl: float = 60.0) -> None:
+        self.negative_ttl = negative_ttl
+        self._results: TTLCache[_Key, tuple[FilmId, ...]] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, title: str | None, description: str | None, limit: int) -> tuple[FilmId, ...] | None:
+        return self._results.get(self._key(title, description, limit))
+
+    def set(
+            self,
+            title: str | None,
+            description: str | None,
+            limit: int,
+            films_ids: Sequence[FilmId],
+            complete: bool = True,
+    ) -> None:
+        # Empty and incomplete results are cached too, but for a shorter time so that a temporarily failing
+        # or slow upstream does not hide a query for long.
+        ttl = None if films_ids and complete else self.negative_ttl
+        self._results.set(self._key(title, description, limit), tuple(films_ids), ttl=ttl)
+
+    def stats(self) -> dict[str, int]:
+        return self._results.stats()
+
+    def _key(self, title: str | None, description: str | None, limit: int) -> _Key:
+        return normalize_query(title), normalize_query(description), limit
@@ -0,0 +1,93 @@
+import datetime
+from collections.abc import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.domain.cached_suggestions import CachedSuggestions
+from backend.infrastructure.cache import TTLCache
+from backend.infrastructure.minhash import MinHasher, fingerprint
+from backend.infrastructure.persistence.repositories.gpt_suggestion import SQLAlchemyGPTSuggestionRepository
+
+Suggestions = tuple[tuple[str, float], ...]
+
+
+class SuggestionCache:
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        maxsize: int = 5_000,
+        ttl: float = 7 * 86_400.0,
+        min_similarity: float = 0.8,
+        max_candidates: int = 20,
+        hasher: MinHasher | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.min_similarity = min_similarity
+        self.max_candidates = max_candidates
+        self.near_hits = 0
+        self._sessionmaker = sessionmaker
+        self._hasher = hasher or MinHasher()
+        self._memory: TTLCache[str, Suggestions] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get(self, description: str) -> Suggestions | None:
+        key = fingerprint(description)
+        suggestions = self._memory.get(key)
+        if suggestions is not None:
+            return suggestions
+
+        signature = self._hasher.signature(description)
+        now = datetime.datetime.now(datetime.UTC)
+        try:
+            async with self._sessionmaker() as session:
+                candidates = await SQLAlchemyGPTSuggestionRepository(session=session).find_candidates(
+                    key,
+                    self._hasher.band_keys(signature),
+                    created_after=now - datetime.timedelta(seconds=self.ttl),
+                    limit=self.max_candidates,
+                )
+        except Exception as e:
+            print(f"Error reading GPT suggestion cache: {e}")
+            return None
+
+        best = self._best_candidate(key, signature, candidates)
+        if best is None:
+            return None
+        if best.fingerprint != key:
+            self.near_hits += 1
+        suggestions = tuple(best.suggestions)
+        remaining_ttl = self.ttl - (now - best.created_at).total_seconds()
+        self._memory.set(key, suggestions, ttl=remaining_ttl)
+        return suggestions
+
+    async def set(self, description: str, suggestions: Sequence[tuple[str, float]]) -> None:
+        key = fingerprint(description)
+        signature = self._hasher.signature(description)
+        self._memory.set(key, tuple(suggestions))
+        entry = CachedSuggestions(
+            fingerprint=key,
+            signature=signature,
+            band_keys=self._hasher.band_keys(signature),
+            suggestions=list(suggestions),
+            created_at=datetime.datetime.now(datetime.UTC),
+        )
+        try:
+            async with self._sessionmaker() as session:
+                await SQLAlchemyGPTSuggestionRepository(session=session).save(entry)
+                await session.commit()
+        except Exception as e:
+            print(f"Error writing GPT suggestion cache: {e}")
+
+    def stats(self) -> dict[str, int]:
+        return {**self._memory.stats(), "near_hits": self.near_hits}
+
+    def _best_candidate(
+        self, key: str, signature: list[int], candidates: Sequence[CachedSuggestions]
+    ) -> CachedSuggestions | None:
+        best, best_similarity = None, self.min_similarity
+        for candidate in candidates:
+            if candidate.fingerprint == key:
+                return candidate
+            similarity = self._hasher.similarity(signature, candidate.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = candidate, similarity
+        return best
@@ -0,0 +1,85 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.infrastructure.cache import TTLCache
+from backend.infrastructure.persistence.repositories.localized_title import SQLAlchemyLocalizedTitleRepository
+
+Resolve = Callable[[str], Awaitable[str | None]]
+
+
+class TitleLocalizer:
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        maxsize: int = 50_000,
+        ttl: float = 86_400.0,
+        batch_size: int = 20,
+        queue_size: int = 1_000,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._titles: TTLCache[int, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue(maxsize=queue_size)
+        self._pending: set[int] = set()
+        self._task: asyncio.Task | None = None
+
+    def get(self, tmdb_id: int) -> str | None:
+        return self._titles.get(tmdb_id)
+
+    def request(self, tmdb_id: int, title: str) -> None:
+        if tmdb_id in self._pending or self._task is None:
+            return
+        with contextlib.suppress(asyncio.QueueFull):
+            self._queue.put_nowait((tmdb_id, title))
+            self._pending.add(tmdb_id)
+
+    def start(self, resolve: Resolve) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(resolve))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def stats(self) -> dict[str, int]:
+        return {**self._titles.stats(), "queued": self._queue.qsize()}
+
+    async def _run(self, resolve: Resolve) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._process(dict(batch), resolve)
+            except Exception as e:
+                print(f"Error localizing titles: {e}")
+            finally:
+                self._pending.difference_update(tmdb_id for tmdb_id, _ in batch)
+
+    async def _process(self, titles: dict[int, str], resolve: Resolve) -> None:
+        async with self._sessionmaker() as session:
+            repo = SQLAlchemyLocalizedTitleRepository(session=session)
+            stored = await repo.get_many(list(titles))
+
+            resolved = {}
+            for tmdb_id, title in titles.items():
+                if tmdb_id in stored:
+                    continue
+                try:
+                    resolved[tmdb_id] = await resolve(title) or title
+                except Exception as e:
+                    # Transient upstream errors are not persisted, so the title is retried on its next request.
+                    print(f"Error localizing title {title!r}: {e}")
+
+            if resolved:
+                await repo.save_many(resolved)
+                await session.commit()
+
+        for tmdb_id, title in {**stored, **resolved}.items():
+            self._titles.set(tmdb_id, title)
@@ -1,11 +1,22 @@
 import asyncio
+import contextlib
 import random
+import time
+from collections.abc import Coroutine
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
 import httpx
 
 from backend.config.settings import Settings
+from backend.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from backend.infrastructure.services.detail_cache import DetailCache
+from backend.infrastructure.services.title_localizer import TitleLocalizer
+from backend.infrastructure.single_flight import SingleFlight
+
+T = TypeVar("T")
+
+KINOPOISK_SOURCE = "kinopoisk"
 
 COUNTRY_CODE_LOCALIZATION_DICT = {
     "AD": "Андорра",
@@ -299,21 +310,40 @@ class TMDBService:
     base_url: str = Settings().TMDB_BASE_URL
     client: httpx.AsyncClient = field(default_factory=httpx.AsyncClient)
     kinopoisk_unofficial_key: str = Settings().KINOPOISK_UNOFFICIAL_KEY
-    kinopoisk_unofficial_base_url: str = Settings().KINOPOISK_UNOFFICIAL_KEY
+    kinopoisk_unofficial_base_url: str = Settings().KINOPOISK_UNOFFICIAL_BASE_URL
+    kinopoisk_unofficial_client: httpx.AsyncClient = field(default_factory=httpx.AsyncClient)
     kinopoisk_dev_key: str = Settings().KINOPOISK_DEV_KEY
     kinopoisk_dev_base_url: str = Settings().KINOPOISK_DEV_BASE_URL
+    kinopoisk_dev_client: httpx.AsyncClient = field(default_factory=httpx.AsyncClient)
+    detail_cache: DetailCache = field(default_factory=DetailCache)
+    single_flight: SingleFlight = field(default_factory=SingleFlight)
+    genre_maps_refresh_interval: float = Settings().GENRE_MAPS_REFRESH_INTERVAL
+    kinopoisk_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    tmdb_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    search_hedge_delay: float | None = Settings().SEARCH_HEDGE_DELAY
+    title_localizer: TitleLocalizer | None = None
+    _genre_maps: dict[str, dict[str, int]] = field(default_factory=dict, init=False)
+    _genre_refresh_task: asyncio.Task | None = field(default=None, init=False)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "single_flight": self.single_flight.stats(),
+            "detail_cache": self.detail_cache.stats(),
+            "circuit_breakers": {"kinopoisk": self.kinopoisk_breaker.stats(), "tmdb": self.tmdb_breaker.stats()},
+            "title_localizer": self.title_localizer.stats() if self.title_localizer is not None else {},
+        }
 
     def contains_cyrillic(self, text: str) -> bool:
         return any("а" <= ch.lower() <= "я" for ch in text)
 
     async def format_movie_data(self, movie_details: dict[str, Any]) -> dict[str, Any]:
         title = movie_details.get("title", "")
-        if not self.contains_cyrillic(title):
-            kp_results = await self.search_kinopoisk_and_get_details(title, limit=1)
-            if kp_results and kp_results[0].get("title"):
-                kp_title = kp_results[0].get("title")
-                if self.contains_cyrillic(kp_title):
-                    title = kp_title
+        if not self.contains_cyrillic(title) and self.title_localizer is not None and movie_details.get("id"):
+            localized_title = self.title_localizer.get(movie_details["id"])
+            if localized_title is None:
+                self.title_localizer.request(movie_details["id"], title)
+            else:
+                title = localized_title
         genres = [{"id": g["id"], "name": g["name"]} for g in movie_details.get("genres", [])]
         return {
             "title": title,
@@ -330,27 +360,31 @@ class TMDBService:
         headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"query": query, "language": "ru-RU", "include_adult": "false", "page": 1}
 
-        response = await self.client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(self.client, url, params, headers)
 
     async def get_movie_details(self, movie_id: int) -> dict[str, Any]:
+        if cached := await self.detail_cache.get("tmdb_movie", movie_id):
+            return cached
+
         url = f"{self.base_url}/movie/{movie_id}"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"language": "ru-RU", "append_to_response": "credits,videos,images"}
 
-        response = await self.client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        details = await self._get_json(self.client, url, params, headers)
+        await self.detail_cache.set("tmdb_movie", movie_id, details)
+        return details
 
     async def get_tv_details(self, tv_id: int) -> dict[str, Any]:
+        if cached := await self.detail_cache.get("tmdb_tv", tv_id):
+            return cached
+
         url = f"{self.base_url}/tv/{tv_id}"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"language": "ru-RU", "append_to_response": "credits,videos,images"}
 
-        response = await self.client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        details = await self._get_json(self.client, url, params, headers)
+        await self.detail_cache.set("tmdb_tv", tv_id, details)
+        return details
 
     async def search_all_and_get_details(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         search_results = await self.search_multi(query, limit=limit * 2)
@@ -433,45 +467,116 @@ class TMDBService:
                 pass
         return None
 
+    async def _get_json(
+        self, client: httpx.AsyncClient, url: str, params: dict[str, Any] | None, headers: dict[str, str]
+    ) -> Any:
+        async def fetch() -> Any:
+            response = await client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response.json()
+
+        return await self.single_flight.do(str(httpx.URL(url, params=params)), fetch)
+
     async def close(self):
+        await self.stop_genre_maps_refresh()
         await self.client.aclose()
+        await self.kinopoisk_unofficial_client.aclose()
+        await self.kinopoisk_dev_client.aclose()
 
     async def search_kinopoisk_and_get_details(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        try:
+            return await self._search_kinopoisk(query, limit)
+        except Exception as e:
+            print(f"Error searching movies in Kinopoisk: {e}")
+            return []
+
+    async def _search_kinopoisk(self, query: str, limit: int) -> list[dict[str, Any]]:
         url = f"{self.kinopoisk_dev_base_url}/v1.4/movie/search"
         headers = {"X-API-KEY": self.kinopoisk_dev_key}
         params = {"query": query, "limit": limit, "page": 1}
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                kinopoisk_data = response.json()
-
-                if not kinopoisk_data or not kinopoisk_data.get("docs"):
-                    return []
-
-                results = []
-                for item in kinopoisk_data.get("docs", [])[:limit]:
-                    genres = []
-                    for genre in item.get("genres", []):
-                        if isinstance(genre, dict) and "name" in genre:
-                            genres.append({"id": len(genres) + 1, "name": genre["name"]})
-
-                    movie_data = {
-                        "title": item.get("name", ""),
-                        "description": item.get("description", "") or item.get("shortDescription", ""),
-                        "country": self._get_country_from_kinopoisk(item),
-                        "release_year": item.get("year"),
-                        "poster_url": self._get_poster_url_from_kinopoisk(item),
-                        "tmdb_id": item.get("id"),
-                        "genres": genres,
-                    }
-                    results.append(movie_data)
+        kinopoisk_data = await self._get_json(self.kinopoisk_dev_client, url, params, headers)
+
+        if not kinopoisk_data or not kinopoisk_data.get("docs"):
+            return []
+
+        results = []
+        for item in kinopoisk_data.get("docs", [])[:limit]:
+            genres = []
+            for genre in item.get("genres", []):
+                if isinstance(genre, dict) and "name" in genre:
+                    genres.append({"id": len(genres) + 1, "name": genre["name"]})
+
+            movie_data = {
+                "title": item.get("name", ""),
+                "description": item.get("description", "") or item.get("shortDescription", ""),
+                "country": self._get_country_from_kinopoisk(item),
+                "release_year": item.get("year"),
+                "poster_url": self._get_poster_url_from_kinopoisk(item),
+                "tmdb_id": item.get("id"),
+                "genres": genres,
+            }
+            results.append(movie_data)
 
+        return results
+
+    async def search_title(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        kinopoisk_task = asyncio.create_task(
+            self._call_with_breaker(self.kinopoisk_breaker, self._search_kinopoisk(query, limit))
+        )
+        tmdb_task = None
+        try:
+            await asyncio.wait({kinopoisk_task}, timeout=self.search_hedge_delay)
+            if kinopoisk_task.done() and (results := self._task_results(kinopoisk_task)):
                 return results
-        except Exception as e:
-            print(f"Error searching movies in Kinopoisk: {e}")
+
+            # Kinopoisk is slow, failing or empty: race it against TMDB and take the first non-empty answer.
+            tmdb_task = asyncio.create_task(
+                self._call_with_breaker(self.tmdb_breaker, self.search_all_and_get_details(query, limit))
+            )
+            pending = {tmdb_task} if kinopoisk_task.done() else {kinopoisk_task, tmdb_task}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if results := self._task_results(task):
+                        return results
+            return []
+        finally:
+            for task in (kinopoisk_task, tmdb_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _call_with_breaker(self, breaker: CircuitBreaker, coro: Coroutine[Any, Any, T]) -> T:
+        if not breaker.allow():
+            coro.close()
+            raise CircuitOpenError
+        started_at = time.monotonic()
+        try:
+            result = await coro
+        except asyncio.CancelledError:
+            # The hedge loser is cancelled before it answers: neither a success nor a latency sample.
+            breaker.release()
+            raise
+        except Exception:
+            breaker.record(success=False, latency=time.monotonic() - started_at)
+            raise
+        breaker.record(success=True, latency=time.monotonic() - started_at)
+        return result
+
+    def _task_results(self, task: asyncio.Task) -> list[dict[str, Any]]:
+        if task.cancelled():
+            return []
+        if exc := task.exception():
+            if not isinstance(exc, CircuitOpenError):
+                print(f"Error searching movies: {exc!r}")
             return []
+        return task.result()
+
+    async def resolve_localized_title(self, title: str) -> str | None:
+        kp_results = await self._search_kinopoisk(title, limit=1)
+        if kp_results and self.contains_cyrillic(kp_results[0].get("title") or ""):
+            return kp_results[0]["title"]
+        return None
 
     def _get_country_from_kinopoisk(self, item: dict) -> str | None:
         countries = item.get("countries", [])
@@ -542,6 +647,7 @@ class TMDBService:
                 "release_year": random_movie.get("year"),
                 "poster_url": random_movie.get("posterUrl"),
                 "tmdb_id": random_movie.get("kinopoiskId"),
+                "source": KINOPOISK_SOURCE,
                 "genres": [{"id": g.get("id", 0), "name": g.get("genre", "")} for g in random_movie.get("genres", [])],
             }
 
@@ -553,28 +659,15 @@ class TMDBService:
         if not genre_names:
             return []
 
+        genre_map = await self._get_genre_map("kinopoisk")
+        return [genre_id for name in genre_names if (genre_id := genre_map.get(name.lower()))]
+
+    async def _load_kinopoisk_genre_map(self) -> dict[str, int]:
         url = f"{self.kinopoisk_unofficial_base_url}/api/v2.2/films/filters"
         headers = {"X-API-KEY": self.kinopoisk_unofficial_key}
 
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                filters_data = response.json()
-
-                genre_mappings = {}
-                for genre in filters_data.get("genres", []):
-                    genre_mappings[genre.get("genre", "").lower()] = genre.get("id")
-
-                result = []
-                for name in genre_names:
-                    if genre_id := genre_mappings.get(name.lower()):
-                        result.append(genre_id)
-
-                return result
-        except Exception as e:
-            print(f"Error getting genre IDs: {e}")
-            return []
+        filters_data = await self._get_json(self.kinopoisk_unofficial_client, url, None, headers)
+        return {genre.get("genre", "").lower(): genre.get("id") for genre in filters_data.get("genres", [])}
 
     async def _get_total_pages(self, genre_id: Optional[int] = None, movie_type: Optional[str] = None) -> int:
         url = f"{self.kinopoisk_unofficial_base_url}/api/v2.2/films"
@@ -594,11 +687,8 @@ class TMDBService:
             params["genres"] = genre_id
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("totalPages", 0)
+            data = await self._get_json(self.kinopoisk_unofficial_client, url, params, headers)
+            return data.get("totalPages", 0)
         except Exception as e:
             print(f"Error getting total pages: {e}")
             return 0
@@ -622,11 +712,8 @@ class TMDBService:
             params["genres"] = genre_id
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("items", [])
+            data = await self._get_json(self.kinopoisk_unofficial_client, url, params, headers)
+            return data.get("items", [])
         except Exception as e:
             print(f"Error getting movies from page {page}: {e}")
             return []
@@ -636,30 +723,31 @@ class TMDBService:
         headers = {"X-API-KEY": self.kinopoisk_dev_key}
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-
-                tmdb_id = None
-                external_ids = data.get("externalId", {})
-                if isinstance(external_ids, dict):
-                    tmdb_id = external_ids.get("tmdb")
-
-                genres = []
-                for genre in data.get("genres", []):
-                    if isinstance(genre, dict) and "name" in genre:
-                        genres.append({"id": len(genres) + 1, "name": genre["name"]})
-
-                return {
-                    "title": data.get("name", ""),
-                    "description": data.get("description", "") or data.get("shortDescription", ""),
-                    "country": self._get_country_from_kinopoisk(data),
-                    "release_year": data.get("year"),
-                    "poster_url": self._get_poster_url_from_kinopoisk(data),
-                    "tmdb_id": tmdb_id or kinopoisk_id,
-                    "genres": genres,
-                }
+            data = await self.detail_cache.get("kinopoisk", kinopoisk_id)
+            if data is None:
+                data = await self._get_json(self.kinopoisk_dev_client, url, None, headers)
+                await self.detail_cache.set("kinopoisk", kinopoisk_id, data)
+
+            tmdb_id = None
+            external_ids = data.get("externalId", {})
+            if isinstance(external_ids, dict):
+                tmdb_id = external_ids.get("tmdb")
+
+            genres = []
+            for genre in data.get("genres", []):
+                if isinstance(genre, dict) and "name" in genre:
+                    genres.append({"id": len(genres) + 1, "name": genre["name"]})
+
+            return {
+                "title": data.get("name", ""),
+                "description": data.get("description", "") or data.get("shortDescription", ""),
+                "country": self._get_country_from_kinopoisk(data),
+                "release_year": data.get("year"),
+                "poster_url": self._get_poster_url_from_kinopoisk(data),
+                "tmdb_id": tmdb_id or kinopoisk_id,
+                "source": "tmdb" if tmdb_id else KINOPOISK_SOURCE,
+                "genres": genres,
+            }
         except Exception as e:
             print(f"Error getting movie details for ID {kinopoisk_id}: {e}")
             return None
@@ -697,9 +785,7 @@ class TMDBService:
             url = f"{self.base_url}/discover/movie"
             headers = {"Authorization": f"Bearer {self.api_key}"}
 
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(self.client, url, params, headers)
 
             total_pages = data.get("total_pages", 0)
 
@@ -709,9 +795,7 @@ class TMDBService:
             random_page = random.randint(1, min(total_pages, 20))
 
             params["page"] = random_page
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(self.client, url, params, headers)
 
             movies = data.get("results", [])
 
@@ -736,9 +820,7 @@ class TMDBService:
             url = f"{self.base_url}/discover/tv"
             headers = {"Authorization": f"Bearer {self.api_key}"}
 
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(self.client, url, params, headers)
 
             total_pages = data.get("total_pages", 0)
 
@@ -748,9 +830,7 @@ class TMDBService:
             random_page = random.randint(1, min(total_pages, 20))
 
             params["page"] = random_page
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._get_json(self.client, url, params, headers)
 
             tv_shows = data.get("results", [])
 
@@ -772,25 +852,44 @@ class TMDBService:
         if not genre_names:
             return []
 
+        genre_map = await self._get_genre_map("tmdb")
+        return [genre_id for name in genre_names if (genre_id := genre_map.get(name.lower()))]
+
+    async def _load_tmdb_genre_map(self) -> dict[str, int]:
         url = f"{self.base_url}/genre/movie/list"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         params = {"language": "ru-RU"}
 
-        try:
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            genres_data = response.json()
-
-            genre_mappings = {}
-            for genre in genres_data.get("genres", []):
-                genre_mappings[genre.get("name", "").lower()] = genre.get("id")
+        genres_data = await self._get_json(self.client, url, params, headers)
+        return {genre.get("name", "").lower(): genre.get("id") for genre in genres_data.get("genres", [])}
 
-            result = []
-            for name in genre_names:
-                if genre_id := genre_mappings.get(name.lower()):
-                    result.append(genre_id)
+    async def _get_genre_map(self, provider: str) -> dict[str, int]:
+        if provider not in self._genre_maps:
+            await self._refresh_genre_map(provider)
+        return self._genre_maps.get(provider, {})
 
-            return result
+    async def _refresh_genre_map(self, provider: str) -> None:
+        loaders = {"tmdb": self._load_tmdb_genre_map, "kinopoisk": self._load_kinopoisk_genre_map}
+        try:
+            self._genre_maps[provider] = await loaders[provider]()
         except Exception as e:
-            print(f"Error getting genre IDs from TMDB: {e}")
-            return []
+            print(f"Error loading {provider} genre map: {e}")
+
+    async def refresh_genre_maps(self) -> None:
+        await asyncio.gather(self._refresh_genre_map("tmdb"), self._refresh_genre_map("kinopoisk"))
+
+    def start_genre_maps_refresh(self) -> None:
+        if self._genre_refresh_task is None:
+            self._genre_refresh_task = asyncio.create_task(self._refresh_genre_maps_periodically())
+
+    async def stop_genre_maps_refresh(self) -> None:
+        if self._genre_refresh_task is not None:
+            self._genre_refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._genre_refresh_task
+            self._genre_refresh_task = None
+
+    async def _refresh_genre_maps_periodically(self) -> None:
+        while True:
+            await self.refresh_genre_maps()
+            await asyncio.sleep(self.genre_maps_refresh_interval)
@@ -0,0 +1,162 @@
+import heapq
+import math
+import os
+import struct
+import uuid
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from pathlib import Path
+
+from backend.domain.film_id import FilmId
+from backend.infrastructure.minhash import normalize_words
+
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"FTI1"
+
+
+class TextIndex:
+    def __init__(self, dims: int = 1 << 20, ngram: int = 4, max_df: float = 0.2) -> None:
+        self.dims = dims
+        self.ngram = ngram
+        self.max_df = max_df
+        self._films_ids: list[FilmId] = []
+        self._positions: dict[FilmId, int] = {}
+        self._postings: dict[int, tuple[array, array]] = {}
+        self._dead: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, film_id: FilmId) -> bool:
+        return film_id in self._positions
+
+    def features(self, text: str) -> Counter[int]:
+        features: Counter[int] = Counter()
+        for word in normalize_words(text):
+            padded = f" {word} "
+            if len(padded) <= self.ngram:
+                features[zlib.crc32(padded.encode()) % self.dims] += 1
+                continue
+            for i in range(len(padded) - self.ngram + 1):
+                features[zlib.crc32(padded[i : i + self.ngram].encode()) % self.dims] += 1
+        return features
+
+    def add(self, film_id: FilmId, text: str) -> None:
+        if film_id in self._positions:
+            return
+        self._append(film_id, text)
+
+    def replace(self, film_id: FilmId, text: str) -> None:
+        # Postings are append-only, so the previous version stays in place and is skipped by search
+        # until save() writes a compacted copy.
+        old_position = self._positions.get(film_id)
+        if old_position is not None:
+            self._dead.add(old_position)
+        self._append(film_id, text)
+
+    def _append(self, film_id: FilmId, text: str) -> None:
+        # Documents keep plain sublinear term frequencies and IDF is applied to the query only,
+        # so adding documents never requires re-weighting the ones already indexed.
+        weights = {feature: 1 + math.log(count) for feature, count in self.features(text).items()}
+        norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+
+        position = len(self._films_ids)
+        self._films_ids.append(film_id)
+        self._positions[film_id] = position
+        for feature, weight in weights.items():
+            self._add_posting(feature, position, weight / norm)
+
+    def search(self, query: str, limit: int, min_score: float = 0.0) -> list[tuple[FilmId, float]]:
+        (results,) = self.search_many([query], limit, min_score)
+        return results
+
+    def search_many(
+        self, queries: Sequence[str], limit: int, min_score: float = 0.0
+    ) -> list[list[tuple[FilmId, float]]]:
+        total = len(self._positions)
+        max_postings = max(1, int(total * self.max_df))
+        idf_cache: dict[int, float] = {}
+
+        results = []
+        for query in queries:
+            weights = {}
+            for feature, count in self.features(query).items():
+                postings = self._postings.get(feature)
+                # Very common n-grams carry almost no signal but dominate the cost of a query.
+                if postings is None or len(postings[0]) > max_postings:
+                    continue
+                idf = idf_cache.get(feature)
+                if idf is None:
+                    idf = idf_cache[feature] = math.log((total + 1) / (len(postings[0]) + 1)) + 1
+                weights[feature] = (1 + math.log(count)) * idf
+            norm = math.sqrt(sum(weight * weight for weight in weights.values())) or 1.0
+
+            scores: dict[int, float] = {}
+            for feature, weight in weights.items():
+                positions, doc_weights = self._postings[feature]
+                query_weight = weight / norm
+                for position, doc_weight in zip(positions, doc_weights):
+                    scores[position] = scores.get(position, 0.0) + query_weight * doc_weight
+            for position in self._dead.intersection(scores):
+                del scores[position]
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            results.append([(self._films_ids[position], score) for position, score in top if score >= min_score])
+        return results
+
+    def save(self, path: str | Path) -> None:
+        films_ids = self._films_ids
+        features, positions, weights = array("I"), array("I"), array("f")
+        if not self._dead:
+            for feature, (feature_positions, feature_weights) in self._postings.items():
+                features.extend([feature] * len(feature_positions))
+                positions.extend(feature_positions)
+                weights.extend(feature_weights)
+        else:
+            # Replaced documents are dropped and the remaining ones renumbered.
+            films_ids = [film_id for position, film_id in enumerate(self._films_ids) if position not in self._dead]
+            new_positions = {self._positions[film_id]: position for position, film_id in enumerate(films_ids)}
+            for feature, (feature_positions, feature_weights) in self._postings.items():
+                for position, weight in zip(feature_positions, feature_weights):
+                    new_position = new_positions.get(position)
+                    if new_position is not None:
+                        features.append(feature)
+                        positions.append(new_position)
+                        weights.append(weight)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, self.dims, len(films_ids), len(features)))
+            f.write(b"".join(film_id.bytes for film_id in films_ids))
+            features.tofile(f)
+            positions.tofile(f)
+            weights.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, ngram: int = 4, max_df: float = 0.2) -> "TextIndex":
+        with open(path, "rb") as f:
+            magic, dims, films_count, postings_count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path} is not a text index file")
+            index = cls(dims=dims, ngram=ngram, max_df=max_df)
+            raw_ids = f.read(16 * films_count)
+            features, positions, weights = array("I"), array("I"), array("f")
+            features.fromfile(f, postings_count)
+            positions.fromfile(f, postings_count)
+            weights.fromfile(f, postings_count)
+
+        index._films_ids = [FilmId(uuid.UUID(bytes=raw_ids[i : i + 16])) for i in range(0, len(raw_ids), 16)]
+        index._positions = {film_id: position for position, film_id in enumerate(index._films_ids)}
+        for feature, position, weight in zip(features, positions, weights):
+            index._add_posting(feature, position, weight)
+        return index
+
+    def _add_posting(self, feature: int, position: int, weight: float) -> None:
+        postings = self._postings.get(feature)
+        if postings is None:
+            postings = self._postings[feature] = (array("I"), array("f"))
+        postings[0].append(position)
+        postings[1].append(weight)
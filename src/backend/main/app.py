@@ -10,12 +10,14 @@ from backend.infrastructure.ioc import MainProvider
 from backend.presentation.controllers.auth import AuthController
 from backend.presentation.controllers.film import FilmController
 from backend.presentation.controllers.genre import GenresController
+from backend.presentation.controllers.health import HealthController
 from backend.presentation.controllers.me import MeController
 from backend.presentation.controllers.mix import MixController
 from backend.presentation.controllers.mood import MoodController
 from backend.presentation.controllers.recommend import RecommendController
 from backend.presentation.controllers.telegram_auth import TelegramAuthController
 from backend.presentation.jwt import jwt_auth
+from backend.presentation.pagination import NEXT_CURSOR_HEADER
 
 
 def create_app() -> Litestar:
@@ -30,6 +32,7 @@ def create_app() -> Litestar:
             AuthController,
             TelegramAuthController,
             RecommendController,
+            HealthController,
         ),
     )
     app = Litestar(
@@ -43,6 +46,7 @@ def create_app() -> Litestar:
             allow_methods=["*"],
             allow_headers=["*"],
             allow_credentials=True,
+            expose_headers=[NEXT_CURSOR_HEADER],
         ),
         openapi_config=OpenAPIConfig(
             title="Film Hub",
@@ -1,6 +1,9 @@
 import asyncio
+import contextlib
 import os
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from dataclasses import dataclass
 from typing import Annotated, Any
 
 from dishka.integrations.litestar import FromDishka, inject
@@ -9,81 +12,87 @@ from litestar.datastructures import UploadFile
 from litestar.enums import RequestEncodingType
 from litestar.exceptions import ClientException, HTTPException, NotFoundException, PermissionDeniedException
 from litestar.params import Body
+from litestar.response import Stream
 from litestar.status_codes import HTTP_400_BAD_REQUEST
-from sqlalchemy import select
 
 from backend.application.committer import Committer
-from backend.application.errors import FilmNotFoundError, GenreNotFoundError, WatchlistNotFoundError
+from backend.application.errors import FilmNotFoundError, GenreNotFoundError
 from backend.application.repositories.film import FilmRepository
-from backend.application.repositories.watchlist import WatchlistRepository
+from backend.config.settings import Settings
 from backend.domain.film import Film
 from backend.domain.film_id import FilmId
 from backend.domain.user import User
 from backend.domain.user_id import UserId
-from backend.domain.watchlist_type import WatchlistType
-from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.services.film_index import FilmIndex
 from backend.infrastructure.services.gpt import GPTService
 from backend.infrastructure.services.s3 import S3Service
-from backend.infrastructure.services.tmdb import TMDBService
+from backend.infrastructure.services.search_cache import SearchCache
+from backend.infrastructure.services.tmdb import KINOPOISK_SOURCE, TMDBService
 from backend.presentation import schemas
+from backend.presentation.film_enricher import FilmEnricher
+from backend.presentation.streaming import films_stream_response
 
+SearchTier = Callable[[Callable[[list[dict]], None]], Awaitable[None]]
 
-class FilmController(Controller):
-    path = "/films"
-    tags = ("films",)
 
-    async def _get_film_by_tmdb_id(self, tmdb_id: int, film_repo: FilmRepository) -> Film | None:
-        async with film_repo._session as session:
-            stmt = select(FilmORM).where(FilmORM.tmdb_id == tmdb_id)
-            result = await session.execute(stmt)
-            existing_film = result.scalars().first()
+@dataclass
+class SearchProgress:
+    timed_out: bool = False
 
-        if existing_film:
-            return await film_repo.get_by_id(FilmId(existing_film.id))
-        return None
 
-    async def _create_film_from_tmdb_data(self, item: dict, film_repo: FilmRepository, committer: Committer) -> Film:
-        film = Film(
-            id=FilmId(uuid.uuid4()),
-            title=item["title"],
-            description=item["description"],
-            country=item["country"],
-            release_year=item["release_year"],
-            poster_url=item["poster_url"],
-            tmdb_id=item["tmdb_id"],
-            owner_id=None,
-        )
-        film = await film_repo.create(film)
-        await committer.commit()
-        return film
+class FilmController(Controller):
+    path = "/films"
+    tags = ("films",)
+    search_deadline = Settings().SEARCH_DEADLINE
 
-    async def _process_tmdb_result(
+    async def _save_tmdb_results(
             self,
-            item: dict,
-            user_id: UserId | None,
+            items: list[dict],
             film_repo: FilmRepository,
-            watchlist_repo: WatchlistRepository,
             committer: Committer,
             seen_tmdb_ids: set,
-    ) -> schemas.FilmResponse | None:
-        tmdb_id = item.get("tmdb_id")
-        if not tmdb_id:
-            return None
-
-        if tmdb_id in seen_tmdb_ids:
-            return None
-
-        film = await self._get_film_by_tmdb_id(tmdb_id, film_repo)
-
-        if not film:
-            try:
-                film = await self._create_film_from_tmdb_data(item, film_repo, committer)
-            except Exception:
-                return None
-
-        film_response = await self._get_film_response(film, user_id, watchlist_repo)
-        seen_tmdb_ids.add(tmdb_id)
-        return film_response
+    ) -> list[Film]:
+        try:
+            new_films, kinopoisk_tmdb_ids = [], set()
+            for item in items:
+                tmdb_id = item.get("tmdb_id")
+                if not tmdb_id or tmdb_id in seen_tmdb_ids:
+                    continue
+                new_films.append(Film(
+                    id=FilmId(uuid.uuid4()),
+                    title=item["title"],
+                    description=item["description"],
+                    country=item["country"],
+                    release_year=item["release_year"],
+                    poster_url=item["poster_url"],
+                    tmdb_id=tmdb_id,
+                    owner_id=None,
+                ))
+                # Kinopoisk ids live in tmdb_id too and may collide with a real TMDB film, so never overwrite on them.
+                if item.get("source") == KINOPOISK_SOURCE:
+                    kinopoisk_tmdb_ids.add(tmdb_id)
+            if not new_films:
+                return []
+
+            stored = await film_repo.upsert_many([f for f in new_films if f.tmdb_id not in kinopoisk_tmdb_ids])
+            stored += await film_repo.upsert_many(
+                [f for f in new_films if f.tmdb_id in kinopoisk_tmdb_ids], update_existing=False
+            )
+            await committer.commit()
+        except Exception as e:
+            print(f"Error saving search results: {e}")
+            # Leave the session usable for the next tier and for enriching the results.
+            await committer.rollback()
+            return []
+
+        stored_by_tmdb_id = {film.tmdb_id: film for film in stored}
+        films = [
+            stored_by_tmdb_id[film.tmdb_id]
+            for film in new_films
+            if film.tmdb_id in stored_by_tmdb_id
+        ]
+        seen_tmdb_ids.update(stored_by_tmdb_id)
+        return films
 
     async def _search_by_title(
         self,
@@ -92,88 +101,26 @@ class FilmController(Controller):
         user_id: UserId | None,
         tmdb_service: TMDBService,
         film_repo: FilmRepository,
-        watchlist_repo: WatchlistRepository,
+        film_enricher: FilmEnricher,
         committer: Committer,
     ) -> list[schemas.FilmResponse]:
-        results = []
-        seen_tmdb_ids = set()
-        total_results_limit = 20
-
-        try:
-            kinopoisk_results = await tmdb_service.search_kinopoisk_and_get_details(title, limit=total_results_limit)
-        except Exception:
-            kinopoisk_results = await tmdb_service.search_all_and_get_details(title, limit=total_results_limit)
+        films = list(await film_repo.search(title, limit))
+        if len(films) >= limit:
+            return await film_enricher.enrich(films, user_id)
 
-        for item in kinopoisk_results:
-            film_response = await self._process_tmdb_result(
-                item, user_id, film_repo, watchlist_repo, committer, seen_tmdb_ids
-            )
-            if film_response:
-                results.append(film_response)
+        # A few fuzzy local hits must not hide the exact match TMDB would return.
+        seen_tmdb_ids = {film.tmdb_id for film in films if film.tmdb_id is not None}
+        total_results_limit = 20
 
-        return results[:limit]
+        search_results = await tmdb_service.search_title(title, limit=total_results_limit)
+        films.extend(await self._save_tmdb_results(search_results, film_repo, committer, seen_tmdb_ids))
 
-    async def _distribute_slots(self, suggestions, total_slots: int) -> list[int]:
-        max_suggestions = min(len(suggestions), 10)
-        total_confidence = sum(s.confidence for s in suggestions[:max_suggestions])
+        return await film_enricher.enrich(films[:limit], user_id)
 
+    def _suggestion_slots(self, confidence: float) -> int:
         min_slots = 1
         max_slots_per_title = 5
-        slots = []
-        remaining_slots = total_slots - (min_slots * max_suggestions)
-        freed_slots = 0
-
-        for s in suggestions[:max_suggestions]:
-            additional_slots = int((s.confidence / total_confidence) * remaining_slots) if total_confidence > 0 else 0
-            total_slots_for_item = min(min_slots + additional_slots, max_slots_per_title)
-            original_slots = min_slots + additional_slots
-            if original_slots > max_slots_per_title:
-                freed_slots += original_slots - max_slots_per_title
-            slots.append(total_slots_for_item)
-
-        if freed_slots > 0:
-            eligible_indices = [i for i, slot in enumerate(slots) if slot < max_slots_per_title]
-            eligible_indices.sort(key=lambda i: suggestions[i].confidence, reverse=True)
-            for i in eligible_indices:
-                if freed_slots <= 0:
-                    break
-                available_slots = max_slots_per_title - slots[i]
-                to_add = min(available_slots, freed_slots)
-                slots[i] += to_add
-                freed_slots -= to_add
-
-        while sum(slots) < total_slots:
-            eligible_indices = [i for i, slot in enumerate(slots) if slot < max_slots_per_title]
-            if not eligible_indices:
-                break
-            max_confidence_index = max(eligible_indices, key=lambda i: suggestions[i].confidence)
-            slots[max_confidence_index] += 1
-
-        return slots
-
-    async def _fetch_search_results(self, suggestions: list, slots: list[int], tmdb_service: TMDBService) -> list[dict]:
-        tasks = []
-
-        async def kinopoisk_or_tmdb(q: str, s: int) -> list[dict[str, Any]]:
-            try:
-                return await tmdb_service.search_kinopoisk_and_get_details(q, limit=s)
-            except Exception:
-                return await tmdb_service.search_all_and_get_details(q, limit=s)
-
-        for i, suggestion in enumerate(suggestions):
-            if i >= len(slots) or slots[i] <= 0:
-                continue
-            tasks.append(kinopoisk_or_tmdb(suggestion.media_name, slots[i]))
-
-        tmdb_results_list = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_results = []
-        for item_or_exc in tmdb_results_list:
-            if isinstance(item_or_exc, Exception):
-                continue
-            all_results.extend(item_or_exc)
-
-        return all_results
+        return max(min_slots, min(max_slots_per_title, round(confidence * max_slots_per_title)))
 
     async def _search_by_description(
             self,
@@ -184,107 +131,149 @@ class FilmController(Controller):
             gpt_service: GPTService,
             tmdb_service: TMDBService,
             film_repo: FilmRepository,
-            watchlist_repo: WatchlistRepository,
+            film_enricher: FilmEnricher,
+            film_index: FilmIndex,
             committer: Committer,
+            progress: SearchProgress | None = None,
     ) -> list[schemas.FilmResponse]:
-        results = []
-        seen_tmdb_ids = set()
-        total_results_limit = 20
+        local_films, tiers, fallback = await self._plan_description_search(
+            description, title, limit, gpt_service, tmdb_service, film_repo, film_index
+        )
+        films = [
+            film
+            async for film in self._search_tiers(
+                local_films, tiers, fallback, limit, film_repo, committer, progress
+            )
+        ]
+        return await film_enricher.enrich(films, user_id)
 
+    async def _plan_description_search(
+            self,
+            description: str,
+            title: str | None,
+            limit: int,
+            gpt_service: GPTService,
+            tmdb_service: TMDBService,
+            film_repo: FilmRepository,
+            film_index: FilmIndex,
+    ) -> tuple[Sequence[Film], list[SearchTier], SearchTier | None]:
+        matches = await film_index.search(description, limit)
+        local_films = await film_repo.get_by_ids([film_id for film_id, _ in matches]) if matches else []
+        # A confident match on a film we already have is good enough to skip GPT and every upstream call.
+        if film_index.is_confident(matches):
+            return local_films, [], None
+        tiers = self._description_tiers(description, gpt_service, tmdb_service)
+        fallback = self._title_tier(title, tmdb_service) if title else None
+        return local_films, tiers, fallback
+
+    async def _run_tier(self, tier: SearchTier, results: asyncio.Queue[list[dict] | None]) -> None:
         try:
-            kinopoisk_direct_results = await tmdb_service.search_kinopoisk_and_get_details(description, limit=2)
+            await tier(results.put_nowait)
+        except Exception as e:
+            print(f"Error in search tier: {e}")
+        finally:
+            results.put_nowait(None)
 
-            for item in kinopoisk_direct_results:
-                film_response = await self._process_tmdb_result(
-                    item, user_id, film_repo, watchlist_repo, committer, seen_tmdb_ids
-                )
-                if film_response:
-                    results.append(film_response)
-        except Exception:
-            pass
+    async def _search_tiers(
+            self,
+            local_films: Sequence[Film],
+            tiers: list[SearchTier],
+            fallback: SearchTier | None,
+            limit: int,
+            film_repo: FilmRepository,
+            committer: Committer,
+            progress: SearchProgress | None = None,
+    ) -> AsyncIterator[Film]:
+        # Upstream tiers run concurrently and hand their results over through queues, while every
+        # database write stays in this generator because the request session cannot be shared between tasks.
+        # The fallback is started right away too, but its results are only used once the other tiers are done.
+        deadline = asyncio.get_running_loop().time() + self.search_deadline
+        results: asyncio.Queue[list[dict] | None] = asyncio.Queue()
+        fallback_results: asyncio.Queue[list[dict] | None] = asyncio.Queue()
+        seen_tmdb_ids = {film.tmdb_id for film in local_films if film.tmdb_id}
+        sent = 0
+
+        for film in local_films[:limit]:
+            yield film
+            sent += 1
+        if sent >= limit:
+            return
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(self._run_tier(tier, results)) for tier in tiers]
+            if fallback is not None:
+                tasks.append(task_group.create_task(self._run_tier(fallback, fallback_results)))
+            try:
+                pending = len(tiers)
+                while pending and sent < limit:
+                    try:
+                        async with asyncio.timeout_at(deadline):
+                            items = await results.get()
+                    except TimeoutError:
+                        if progress is not None:
+                            progress.timed_out = True
+                        break
+
+                    if items is None:
+                        pending -= 1
+                        if not pending and fallback is not None:
+                            results, pending, fallback = fallback_results, 1, None
+                        continue
+
+                    films = await self._save_tmdb_results(items, film_repo, committer, seen_tmdb_ids)
+                    for film in films[: limit - sent]:
+                        yield film
+                        sent += 1
+            except GeneratorExit:
+                # The consumer stopped early; the task group would otherwise report this as a failure.
+                pass
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    async def _enrich_each(
+            self, films: AsyncIterator[Film], user_id: UserId | None, film_enricher: FilmEnricher
+    ) -> AsyncIterator[schemas.FilmResponse]:
+        async with contextlib.aclosing(films):
+            async for film in films:
+                yield await film_enricher.enrich_one(film, user_id)
+
+    def _description_tiers(
+            self, description: str, gpt_service: GPTService, tmdb_service: TMDBService
+    ) -> list[SearchTier]:
+        total_results_limit = 20
+        max_suggestions = 10
 
-        gpt_result = await gpt_service.identify_multiple_media(description, limit=10)
-        if gpt_result.not_found or not gpt_result.suggestions:
-            return results
+        async def kinopoisk_direct(emit: Callable[[list[dict]], None]) -> None:
+            emit(await tmdb_service.search_kinopoisk_and_get_details(description, limit=2))
 
-        suggestions = sorted(gpt_result.suggestions, key=lambda x: x.confidence, reverse=True)
+        async def gpt_suggestions(emit: Callable[[list[dict]], None]) -> None:
+            remaining_slots = total_results_limit
 
-        slots = await self._distribute_slots(suggestions, total_results_limit)
+            async def search_suggestion(media_name: str, slot: int) -> None:
+                try:
+                    emit(await tmdb_service.search_title(media_name, limit=slot))
+                except Exception as e:
+                    print(f"Error searching GPT suggestion {media_name}: {e}")
 
-        tmdb_results = await self._fetch_search_results(suggestions[: len(slots)], slots, tmdb_service)
+            # Suggestions are streamed, so each lookup starts while the model is still writing the next one.
+            async with asyncio.TaskGroup() as task_group, contextlib.aclosing(
+                gpt_service.stream_multiple_media(description, limit=max_suggestions)
+            ) as suggestions:
+                async for suggestion in suggestions:
+                    slot = min(remaining_slots, self._suggestion_slots(suggestion.confidence))
+                    if slot <= 0:
+                        break
+                    remaining_slots -= slot
+                    task_group.create_task(search_suggestion(suggestion.media_name, slot))
 
-        for item in tmdb_results:
-            film_response = await self._process_tmdb_result(
-                item, user_id, film_repo, watchlist_repo, committer, seen_tmdb_ids
-            )
-            if film_response:
-                results.append(film_response)
-
-        if len(results) < limit and title:
-            remaining_search_limit = total_results_limit - len(results)
-            if remaining_search_limit > 0:
-                additional_results = await self._get_additional_results_by_title(
-                    title, remaining_search_limit, tmdb_service
-                )
-
-                for item in additional_results:
-                    film_response = await self._process_tmdb_result(
-                        item, user_id, film_repo, watchlist_repo, committer, seen_tmdb_ids
-                    )
-                    if film_response:
-                        results.append(film_response)
-
-        return results[:limit]
-
-    async def _get_additional_results_by_title(self, title: str, limit: int, tmdb_service: TMDBService) -> list[dict]:
-        """Get additional results by title as fallback"""
-        try:
-            return await tmdb_service.search_kinopoisk_and_get_details(title, limit=limit)
-        except Exception:
-            return await tmdb_service.search_all_and_get_details(title, limit=limit)
+        return [kinopoisk_direct, gpt_suggestions]
 
-    async def _get_film_response(
-        self, film: Film, user_id: UserId | None, watchlist_repo: WatchlistRepository
-    ) -> schemas.FilmResponse:
-        if not user_id:
-            return schemas.FilmResponse(
-                id=film.id,
-                title=film.title,
-                description=film.description,
-                country=film.country,
-                release_year=film.release_year,
-                poster_url=film.poster_url,
-                tmdb_id=film.tmdb_id,
-                owner_id=film.owner_id,
-                is_liked=False,
-                is_wish=False,
-                is_watched=False,
-            )
+    def _title_tier(self, title: str, tmdb_service: TMDBService) -> SearchTier:
+        async def search_title(emit: Callable[[list[dict]], None]) -> None:
+            emit(await tmdb_service.search_title(title, limit=20))
 
-        try:
-            liked_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.liked, user_id)
-            wish_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.wish, user_id)
-            watched_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.watched, user_id)
-
-            liked_items = await watchlist_repo.get_items_for_watchlist(liked_list.id)
-            wish_items = await watchlist_repo.get_items_for_watchlist(wish_list.id)
-            watched_items = await watchlist_repo.get_items_for_watchlist(watched_list.id)
-        except WatchlistNotFoundError:
-            liked_items = wish_items = watched_items = []
-
-        return schemas.FilmResponse(
-            id=film.id,
-            title=film.title,
-            description=film.description,
-            country=film.country,
-            release_year=film.release_year,
-            poster_url=film.poster_url,
-            tmdb_id=film.tmdb_id,
-            owner_id=film.owner_id,
-            is_liked=any(item.film_id == film.id for item in liked_items),
-            is_wish=any(item.film_id == film.id for item in wish_items),
-            is_watched=any(item.film_id == film.id for item in watched_items),
-        )
+        return search_title
 
     @post()
     @inject
@@ -293,7 +282,7 @@ class FilmController(Controller):
         data: schemas.FilmCreate,
         request: Request[User, Any, Any],
         film_repo: FromDishka[FilmRepository],
-        watchlist_repo: FromDishka[WatchlistRepository],
+        film_enricher: FromDishka[FilmEnricher],
         committer: FromDishka[Committer],
     ) -> schemas.FilmResponse:
         film = Film(
@@ -312,7 +301,7 @@ class FilmController(Controller):
         except GenreNotFoundError as exc:
             raise ClientException(detail="Genre not found") from exc
         await committer.commit()
-        return await self._get_film_response(film, request.user.id, watchlist_repo)
+        return await film_enricher.enrich_one(film, request.user.id)
 
     @put("/{film_id:uuid}/poster", status_code=status_codes.HTTP_204_NO_CONTENT)
     @inject
@@ -385,11 +374,11 @@ class FilmController(Controller):
         film_id: FilmId,
         request: Request[User, Any, Any],
         film_repo: FromDishka[FilmRepository],
-        watchlist_repo: FromDishka[WatchlistRepository],
+        film_enricher: FromDishka[FilmEnricher],
     ) -> schemas.FilmResponse:
         try:
             film = await film_repo.get_by_id(film_id)
-            return await self._get_film_response(film, request.user.id if request.user else None, watchlist_repo)
+            return await film_enricher.enrich_one(film, request.user.id if request.user else None)
         except FilmNotFoundError as exc:
             raise NotFoundException from exc
 
@@ -401,7 +390,7 @@ class FilmController(Controller):
         film_id: FilmId,
         request: Request[User, Any, Any],
         film_repo: FromDishka[FilmRepository],
-        watchlist_repo: FromDishka[WatchlistRepository],
+        film_enricher: FromDishka[FilmEnricher],
         committer: FromDishka[Committer],
     ) -> schemas.FilmResponse:
         try:
@@ -420,7 +409,7 @@ class FilmController(Controller):
         except GenreNotFoundError as exc:
             raise ClientException(detail="Genre not found") from exc
         await committer.commit()
-        return await self._get_film_response(film, request.user.id, watchlist_repo)
+        return await film_enricher.enrich_one(film, request.user.id)
 
     @get("/search")
     @inject
@@ -430,22 +419,75 @@ class FilmController(Controller):
         gpt_service: FromDishka[GPTService],
         tmdb_service: FromDishka[TMDBService],
         film_repo: FromDishka[FilmRepository],
-        watchlist_repo: FromDishka[WatchlistRepository],
+        film_enricher: FromDishka[FilmEnricher],
+        film_index: FromDishka[FilmIndex],
         committer: FromDishka[Committer],
+        search_cache: FromDishka[SearchCache],
         title: str | None = None,
         description: str | None = None,
         limit: int = 10,
     ) -> list[schemas.FilmResponse]:
         user_id = request.user.id if request.user else None
 
-        if title and not description:
-            return await self._search_by_title(
-                title, limit, user_id, tmdb_service, film_repo, watchlist_repo, committer
-            )
+        if not title and not description:
+            return []
 
+        cached_films_ids = search_cache.get(title, description, limit)
+        if cached_films_ids is not None:
+            films = await film_repo.get_by_ids(cached_films_ids)
+            return await film_enricher.enrich(films, user_id)
+
+        progress = SearchProgress()
         if description:
-            return await self._search_by_description(
-                description, title, limit, user_id, gpt_service, tmdb_service, film_repo, watchlist_repo, committer
+            films = await self._search_by_description(
+                description,
+                title,
+                limit,
+                user_id,
+                gpt_service,
+                tmdb_service,
+                film_repo,
+                film_enricher,
+                film_index,
+                committer,
+                progress,
+            )
+        else:
+            films = await self._search_by_title(
+                title, limit, user_id, tmdb_service, film_repo, film_enricher, committer
             )
 
-        return []
+        # Tiers cut short by the deadline may have more to give next time.
+        search_cache.set(title, description, limit, [film.id for film in films], complete=not progress.timed_out)
+        return films
+
+    @get("/search/stream")
+    @inject
+    async def search_film_stream(
+        self,
+        request: Request[User, Any, Any],
+        gpt_service: FromDishka[GPTService],
+        tmdb_service: FromDishka[TMDBService],
+        film_repo: FromDishka[FilmRepository],
+        film_enricher: FromDishka[FilmEnricher],
+        film_index: FromDishka[FilmIndex],
+        committer: FromDishka[Committer],
+        title: str | None = None,
+        description: str | None = None,
+        limit: int = 10,
+    ) -> Stream:
+        user_id = request.user.id if request.user else None
+
+        if description:
+            local_films, tiers, fallback = await self._plan_description_search(
+                description, title, limit, gpt_service, tmdb_service, film_repo, film_index
+            )
+        elif title:
+            local_films = await film_repo.search(title, limit)
+            tiers = [self._title_tier(title, tmdb_service)]
+            fallback = None
+        else:
+            raise ClientException(detail="Either title or description is required")
+
+        films = self._search_tiers(local_films, tiers, fallback, limit, film_repo, committer)
+        return films_stream_response(request, self._enrich_each(films, user_id, film_enricher))
@@ -0,0 +1,46 @@
+from typing import Any
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Controller, get
+
+from backend.infrastructure.http_clients import HTTPClients
+from backend.infrastructure.persistence.genre_mood_catalog import GenreMoodCatalog
+from backend.infrastructure.persistence.library_cache import LibraryCache
+from backend.infrastructure.services.candidate_pool import CandidatePool
+from backend.infrastructure.services.film_index import FilmIndex
+from backend.infrastructure.services.palette import PaletteService
+from backend.infrastructure.services.search_cache import SearchCache
+from backend.infrastructure.services.suggestion_cache import SuggestionCache
+from backend.infrastructure.services.tmdb import TMDBService
+
+
+class HealthController(Controller):
+    path = "/health"
+    tags = ("health",)
+
+    @get(exclude_from_auth=True)
+    @inject
+    async def health(
+        self,
+        http_clients: FromDishka[HTTPClients],
+        tmdb_service: FromDishka[TMDBService],
+        candidate_pool: FromDishka[CandidatePool],
+        search_cache: FromDishka[SearchCache],
+        suggestion_cache: FromDishka[SuggestionCache],
+        film_index: FromDishka[FilmIndex],
+        palette_service: FromDishka[PaletteService],
+        library_cache: FromDishka[LibraryCache],
+        catalog: FromDishka[GenreMoodCatalog],
+    ) -> dict[str, Any]:
+        return {
+            "status": "ok",
+            "upstreams": http_clients.stats(),
+            "tmdb": tmdb_service.stats(),
+            "candidate_pool": candidate_pool.stats(),
+            "search_cache": search_cache.stats(),
+            "suggestion_cache": suggestion_cache.stats(),
+            "film_index": film_index.stats(),
+            "palette": palette_service.stats(),
+            "library_cache": library_cache.stats(),
+            "catalog": catalog.stats(),
+        }
@@ -1,26 +1,26 @@
 import datetime
-import random
 import uuid
-from typing import Any
+from typing import Annotated, Any
 
 from dishka import FromDishka
 from dishka.integrations.litestar import inject
-from litestar import Controller, Request, delete, get, post, put, status_codes
+from litestar import Controller, Request, Response, delete, get, post, put, status_codes
 from litestar.exceptions import NotFoundException, PermissionDeniedException
+from litestar.params import Parameter
 
 from backend.application.committer import Committer
 from backend.application.errors import FilmNotFoundError, WatchlistNotFoundError
 from backend.application.repositories.film import FilmRepository
 from backend.application.repositories.watchlist import WatchlistRepository
-from backend.constant import GRADIENTS
-from backend.domain.film import Film
 from backend.domain.film_id import FilmId
 from backend.domain.user import User
-from backend.domain.user_id import UserId
 from backend.domain.watchlist import Watchlist
 from backend.domain.watchlist_id import WatchlistId
 from backend.domain.watchlist_item import WatchlistItem
 from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.services.palette import PaletteService
+from backend.presentation.film_enricher import FilmEnricher
+from backend.presentation.pagination import MAX_PAGE_SIZE, decode_cursor, films_page_response
 from backend.presentation.schemas import FilmResponse, WatchlistAdd, WatchlistCreate
 
 
@@ -28,31 +28,6 @@ class MeController(Controller):
     path = "/me"
     tags = ("me",)
 
-    async def _get_film_response(
-        self, film: Film, user_id: UserId, watchlist_repo: WatchlistRepository
-    ) -> FilmResponse:
-        liked_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.liked, user_id)
-        wish_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.wish, user_id)
-        watched_list = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.watched, user_id)
-
-        liked_items = await watchlist_repo.get_items_for_watchlist(liked_list.id)
-        wish_items = await watchlist_repo.get_items_for_watchlist(wish_list.id)
-        watched_items = await watchlist_repo.get_items_for_watchlist(watched_list.id)
-
-        return FilmResponse(
-            id=film.id,
-            title=film.title,
-            description=film.description,
-            country=film.country,
-            release_year=film.release_year,
-            poster_url=film.poster_url,
-            tmdb_id=film.tmdb_id,
-            owner_id=film.owner_id,
-            is_liked=any(item.film_id == film.id for item in liked_items),
-            is_wish=any(item.film_id == film.id for item in wish_items),
-            is_watched=any(item.film_id == film.id for item in watched_items),
-        )
-
     @get()
     async def get_me(self, request: Request[User, Any, Any]) -> User:
         return request.user
@@ -72,9 +47,10 @@ class MeController(Controller):
         data: WatchlistCreate,
         request: Request[User, Any, Any],
         watchlist_repo: FromDishka[WatchlistRepository],
+        palette_service: FromDishka[PaletteService],
         committer: FromDishka[Committer],
     ) -> Watchlist:
-        gradient = random.choice(GRADIENTS)
+        gradient = await palette_service.gradient(data.title)
         watchlist = Watchlist(
             id=WatchlistId(uuid.uuid4()),
             user_id=request.user.id,
@@ -126,8 +102,10 @@ class MeController(Controller):
         watchlist_id: WatchlistId,
         request: Request[User, Any, Any],
         watchlist_repo: FromDishka[WatchlistRepository],
-        film_repo: FromDishka[FilmRepository],
-    ) -> list[FilmResponse]:
+        film_enricher: FromDishka[FilmEnricher],
+        limit: Annotated[int | None, Parameter(ge=1, le=MAX_PAGE_SIZE)] = None,
+        cursor: str | None = None,
+    ) -> Response[list[FilmResponse]]:
         try:
             watchlist = await watchlist_repo.get_by_id(watchlist_id)
         except WatchlistNotFoundError as exc:
@@ -136,15 +114,9 @@ class MeController(Controller):
         if request.user.id != watchlist.user_id:
             raise PermissionDeniedException("Watchlist is not yours")
 
-        items = await watchlist_repo.get_items_for_watchlist(watchlist_id)
-
-        result: list[FilmResponse] = []
-        for item in items:
-            film = await film_repo.get_by_id(item.film_id)
-            film_response = await self._get_film_response(film, request.user.id, watchlist_repo)
-            result.append(film_response)
-
-        return result
+        page = await watchlist_repo.get_films_for_watchlist(watchlist_id, limit, decode_cursor(cursor))
+        films = await film_enricher.enrich(page.films, request.user.id)
+        return films_page_response(films, page)
 
     @put(
         "/watchlists/{watchlist_id:uuid}/items/add",
@@ -221,17 +193,14 @@ class MeController(Controller):
         self,
         request: Request[User, Any, Any],
         watchlist_repo: FromDishka[WatchlistRepository],
-        film_repo: FromDishka[FilmRepository],
-    ) -> list[FilmResponse]:
+        film_enricher: FromDishka[FilmEnricher],
+        limit: Annotated[int | None, Parameter(ge=1, le=MAX_PAGE_SIZE)] = None,
+        cursor: str | None = None,
+    ) -> Response[list[FilmResponse]]:
         liked_watchlist = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.liked, request.user.id)
-        items = await watchlist_repo.get_items_for_watchlist(liked_watchlist.id)
-        result: list[FilmResponse] = []
-        for item in items:
-            film = await film_repo.get_by_id(item.film_id)
-            film_response = await self._get_film_response(film, request.user.id, watchlist_repo)
-            result.append(film_response)
-
-        return result
+        page = await watchlist_repo.get_films_for_watchlist(liked_watchlist.id, limit, decode_cursor(cursor))
+        films = await film_enricher.enrich(page.films, request.user.id)
+        return films_page_response(films, page)
 
     @put("/watchlists/liked/items/add", status_code=status_codes.HTTP_204_NO_CONTENT, tags=("liked",))
     @inject
@@ -290,16 +259,14 @@ class MeController(Controller):
         self,
         request: Request[User, Any, Any],
         watchlist_repo: FromDishka[WatchlistRepository],
-        film_repo: FromDishka[FilmRepository],
-    ) -> list[FilmResponse]:
+        film_enricher: FromDishka[FilmEnricher],
+        limit: Annotated[int | None, Parameter(ge=1, le=MAX_PAGE_SIZE)] = None,
+        cursor: str | None = None,
+    ) -> Response[list[FilmResponse]]:
         watched_watchlist = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.watched, request.user.id)
-        items = await watchlist_repo.get_items_for_watchlist(watched_watchlist.id)
-        result: list[FilmResponse] = []
-        for item in items:
-            film = await film_repo.get_by_id(item.film_id)
-            film_response = await self._get_film_response(film, request.user.id, watchlist_repo)
-            result.append(film_response)
-        return result
+        page = await watchlist_repo.get_films_for_watchlist(watched_watchlist.id, limit, decode_cursor(cursor))
+        films = await film_enricher.enrich(page.films, request.user.id)
+        return films_page_response(films, page)
 
     @put("/watchlists/watched/items/add", status_code=status_codes.HTTP_204_NO_CONTENT, tags=("watched",))
     @inject
@@ -357,17 +324,14 @@ class MeController(Controller):
         self,
         request: Request[User, Any, Any],
         watchlist_repo: FromDishka[WatchlistRepository],
-        film_repo: FromDishka[FilmRepository],
-    ) -> list[FilmResponse]:
+        film_enricher: FromDishka[FilmEnricher],
+        limit: Annotated[int | None, Parameter(ge=1, le=MAX_PAGE_SIZE)] = None,
+        cursor: str | None = None,
+    ) -> Response[list[FilmResponse]]:
         wish_watchlist = await watchlist_repo.get_common_watchlist_for_user(WatchlistType.wish, request.user.id)
-        items = await watchlist_repo.get_items_for_watchlist(wish_watchlist.id)
-        result: list[FilmResponse] = []
-        for item in items:
-            film = await film_repo.get_by_id(item.film_id)
-            film_response = await self._get_film_response(film, request.user.id, watchlist_repo)
-            result.append(film_response)
-
-        return result
+        page = await watchlist_repo.get_films_for_watchlist(wish_watchlist.id, limit, decode_cursor(cursor))
+        films = await film_enricher.enrich(page.films, request.user.id)
+        return films_page_response(films, page)
 
     @put("/watchlists/wish/items/add", status_code=status_codes.HTTP_204_NO_CONTENT, tags=("wish",))
     @inject
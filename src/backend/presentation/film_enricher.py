@@ -0,0 +1,38 @@
+from collections.abc import Sequence
+
+from backend.application.repositories.watchlist import WatchlistRepository
+from backend.domain.film import Film
+from backend.domain.user_id import UserId
+from backend.domain.watchlist_type import WatchlistType
+from backend.presentation import schemas
+
+
+class FilmEnricher:
+    def __init__(self, watchlist_repo: WatchlistRepository) -> None:
+        self._watchlist_repo = watchlist_repo
+
+    async def enrich(self, films: Sequence[Film], user_id: UserId | None) -> list[schemas.FilmResponse]:
+        if user_id is None or not films:
+            return [self._to_response(film, set()) for film in films]
+
+        types_by_film = await self._watchlist_repo.get_common_types_for_films(user_id, [film.id for film in films])
+        return [self._to_response(film, types_by_film.get(film.id, set())) for film in films]
+
+    async def enrich_one(self, film: Film, user_id: UserId | None) -> schemas.FilmResponse:
+        (film_response,) = await self.enrich([film], user_id)
+        return film_response
+
+    def _to_response(self, film: Film, watchlist_types: set[WatchlistType]) -> schemas.FilmResponse:
+        return schemas.FilmResponse(
+            id=film.id,
+            title=film.title,
+            description=film.description,
+            country=film.country,
+            release_year=film.release_year,
+            poster_url=film.poster_url,
+            tmdb_id=film.tmdb_id,
+            owner_id=film.owner_id,
+            is_liked=WatchlistType.liked in watchlist_types,
+            is_wish=WatchlistType.wish in watchlist_types,
+            is_watched=WatchlistType.watched in watchlist_types,
+        )
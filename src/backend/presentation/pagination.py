@@ -0,0 +1,42 @@
+import base64
+import binascii
+import datetime
+import uuid
+
+from litestar import Response
+from litestar.exceptions import ClientException
+
+from backend.domain.film_id import FilmId
+from backend.domain.films_page import FilmsPage
+from backend.domain.item_cursor import ItemCursor
+from backend.presentation import schemas
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(cursor: ItemCursor) -> str:
+    raw = f"{cursor.added_at.isoformat()}|{cursor.film_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str | None) -> ItemCursor | None:
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        added_at, film_id = raw.split("|")
+        cursor = ItemCursor(added_at=datetime.datetime.fromisoformat(added_at), film_id=FilmId(uuid.UUID(film_id)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ClientException(detail="Invalid cursor") from exc
+    # added_at is compared with a timezone-aware column, so a naive timestamp would fail in the database.
+    if cursor.added_at.tzinfo is None:
+        raise ClientException(detail="Invalid cursor")
+    return cursor
+
+
+def films_page_response(
+    films: list[schemas.FilmResponse], page: FilmsPage
+) -> Response[list[schemas.FilmResponse]]:
+    headers = {NEXT_CURSOR_HEADER: encode_cursor(page.next_cursor)} if page.next_cursor else {}
+    return Response(films, headers=headers)
@@ -0,0 +1,27 @@
+from collections.abc import AsyncIterator
+
+from litestar import Request
+from litestar.response import ServerSentEvent, Stream
+from litestar.response.sse import ServerSentEventMessage
+from litestar.serialization import encode_json
+
+from backend.presentation import schemas
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EVENT_STREAM_MEDIA_TYPE = "text/event-stream"
+
+
+def films_stream_response(request: Request, films: AsyncIterator[schemas.FilmResponse]) -> Stream:
+    if EVENT_STREAM_MEDIA_TYPE in request.headers.get("accept", ""):
+        return ServerSentEvent(_events(films))
+    return Stream(_lines(films), media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _lines(films: AsyncIterator[schemas.FilmResponse]) -> AsyncIterator[bytes]:
+    async for film in films:
+        yield encode_json(film) + b"\n"
+
+
+async def _events(films: AsyncIterator[schemas.FilmResponse]) -> AsyncIterator[ServerSentEventMessage]:
+    async for film in films:
+        yield ServerSentEventMessage(data=encode_json(film).decode(), event="film")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Скрипт для оценки локального поиска фильмов по описанию (TextIndex) без обращения к GPT.
+Индекс строится по названиям и описаниям фильмов из movies_by_genre.json, а в качестве запросов
+используются искажённые фрагменты описаний: случайное окно из половины слов с выброшенными словами.
+Для каждого запроса известен правильный фильм, поэтому считаются recall@1 и recall@10, а также p50/p95 времени поиска.
+"""
+
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+# Добавляем корневую директорию проекта в путь для импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.domain.film_id import FilmId
+from backend.infrastructure.text_index import TextIndex
+
+DEFAULT_JSON_PATH = os.path.join(os.path.dirname(__file__), "movies_by_genre.json")
+MIN_DESCRIPTION_WORDS = 12
+
+
+def load_films(json_file_path: str) -> dict[FilmId, dict]:
+    with open(json_file_path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    films = {}
+    seen_titles = set()
+    for genre_data in data.values():
+        for film in genre_data.get("films", []):
+            # Один и тот же фильм встречается в нескольких жанрах
+            if film["title"] in seen_titles:
+                continue
+            seen_titles.add(film["title"])
+            films[FilmId(uuid.uuid4())] = film
+    return films
+
+
+def make_query(description: str, rng: random.Random) -> str | None:
+    words = description.split()
+    if len(words) < MIN_DESCRIPTION_WORDS:
+        return None
+    window = len(words) // 2
+    start = rng.randrange(len(words) - window + 1)
+    return " ".join(word for word in words[start : start + window] if rng.random() > 0.2)
+
+
+def benchmark(json_file_path: str = DEFAULT_JSON_PATH) -> None:
+    films = load_films(json_file_path)
+
+    started_at = time.perf_counter()
+    index = TextIndex()
+    for film_id, film in films.items():
+        index.add(film_id, f"{film['title']} {film.get('description') or ''}")
+    print(f"Проиндексировано {len(index)} фильмов за {time.perf_counter() - started_at:.2f}с")
+
+    rng = random.Random(42)
+    queries = [
+        (film_id, query)
+        for film_id, film in films.items()
+        if (query := make_query(film.get("description") or "", rng)) is not None
+    ]
+
+    timings = []
+    hits_at_1 = hits_at_10 = 0
+    for film_id, query in queries:
+        started_at = time.perf_counter()
+        results = index.search(query, limit=10)
+        timings.append((time.perf_counter() - started_at) * 1000)
+        found = [result_id for result_id, _ in results]
+        hits_at_1 += found[:1] == [film_id]
+        hits_at_10 += film_id in found
+
+    started_at = time.perf_counter()
+    index.search_many([query for _, query in queries], limit=10)
+    batch_time = (time.perf_counter() - started_at) * 1000
+
+    timings.sort()
+    print(f"Запросов: {len(queries)}")
+    print(f"recall@1={hits_at_1 / len(queries):.3f} recall@10={hits_at_10 / len(queries):.3f}")
+    print(f"p50={statistics.median(timings):.2f}мс p95={timings[int(0.95 * (len(timings) - 1))]:.2f}мс")
+    print(f"Пакетный поиск: {batch_time:.1f}мс на {len(queries)} запросов")
+
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_JSON_PATH)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+Скрипт для сравнения поиска фильмов по LIKE и по полнотекстовому/триграммному индексу.
+В таблицу film вставляется синтетический каталог (по умолчанию 1 000 000 фильмов), после чего
+для набора запросов замеряются p50/p95. Все изменения выполняются в одной транзакции,
+которая в конце откатывается, поэтому скрипт можно запускать на базе с реальными данными.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# Добавляем корневую директорию проекта в путь для импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.repositories.film import SQLAlchemyFilmRepository
+
+DEFAULT_ROWS = 1_000_000
+REPEATS = 20
+LIMIT = 20
+QUERIES = ["матрица", "Звёздные войны", "ночь", "star", "хроники нарнии", "ьатрица"]
+
+INSERT_FILMS = text(
+    """
+    INSERT INTO film (id, title, description, release_year, owner_id)
+    SELECT
+        gen_random_uuid(),
+        (ARRAY['Матрица', 'Звёздные', 'Ночь', 'Хроники', 'Star', 'Последний', 'Тёмный', 'Город'])[1 + i % 8]
+            || ' ' || (ARRAY['войны', 'Нарнии', 'рыцарь', 'дозор', 'Trek', 'герой', 'океан'])[1 + i / 8 % 7]
+            || ' ' || i,
+        'Синтетическое описание фильма номер ' || i
+            || (ARRAY[' о любви', ' о войне', ' о космосе', ' о детстве', ' о мести'])[1 + i % 5],
+        1950 + i % 75,
+        NULL
+    FROM generate_series(1, :rows) AS i
+    """
+)
+
+
+async def measure(run) -> tuple[float, float]:
+    timings = []
+    for _ in range(REPEATS):
+        started_at = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(0.95 * (len(timings) - 1))]
+
+
+async def benchmark(rows: int = DEFAULT_ROWS) -> None:
+    db_url = os.environ.get("POSTGRES_DSN")
+    if not db_url:
+        print("Ошибка: Не найдена переменная окружения POSTGRES_DSN")
+        return
+
+    engine = create_async_engine(db_url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection)
+            try:
+                print(f"Вставляем {rows} синтетических фильмов...")
+                await session.execute(INSERT_FILMS, {"rows": rows})
+                await session.execute(text("ANALYZE film"))
+
+                repo = SQLAlchemyFilmRepository(session=session)
+                for query in QUERIES:
+                    like_stmt = (
+                        select(FilmORM.id)
+                        .where(FilmORM.owner_id.is_(None))
+                        .where(func.lower(FilmORM.title).like(f"%{query.lower()}%"))
+                        .order_by(FilmORM.release_year.desc())
+                        .limit(LIMIT)
+                    )
+
+                    async def run_like(stmt=like_stmt) -> None:
+                        await session.execute(stmt)
+
+                    async def run_search(query=query) -> None:
+                        await repo.search(query, limit=LIMIT)
+
+                    like_p50, like_p95 = await measure(run_like)
+                    search_p50, search_p95 = await measure(run_search)
+                    print(
+                        f"{query!r}: LIKE p50={like_p50:.1f}мс p95={like_p95:.1f}мс | "
+                        f"search p50={search_p50:.1f}мс p95={search_p95:.1f}мс"
+                    )
+            finally:
+                await session.close()
+                await transaction.rollback()
+    except Exception as e:
+        print(f"Произошла ошибка: {e}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # Регистрируем все модели ORM
+    from backend.infrastructure.persistence.models.base import register_orm
+
+    register_orm()
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    asyncio.run(benchmark(rows))
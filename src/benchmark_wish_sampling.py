@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+Скрипт для сравнения выбора случайного фильма из списка «Хочу посмотреть».
+Для синтетического пользователя создаются списки разного размера (по умолчанию до 50 000 фильмов),
+и для каждого замеряются p50/p95 старого запроса с ORDER BY random() и выборки по индексу sort_key.
+Все изменения выполняются в одной транзакции, которая в конце откатывается.
+"""
+
+import asyncio
+import datetime
+import os
+import statistics
+import sys
+import time
+import uuid
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# Добавляем корневую директорию проекта в путь для импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.domain.user_id import UserId
+from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.recommended_film import RecommendedFilmORM
+from backend.infrastructure.persistence.models.watchlist import WatchlistORM
+from backend.infrastructure.persistence.models.watchlist_item import WatchlistItemORM
+from backend.infrastructure.persistence.repositories.watchlist import SQLAlchemyWatchlistRepository
+
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+REPEATS = 50
+
+INSERT_USER = text("""INSERT INTO "user" (id, username) VALUES (:user_id, 'benchmark')""")
+INSERT_WATCHLIST = text(
+    """
+    INSERT INTO watchlist (id, user_id, title, type, color1, color2, color3)
+    VALUES (:watchlist_id, :user_id, 'Хочу посмотреть', 'wish', '', '', '')
+    """
+)
+INSERT_ITEMS = text(
+    """
+    WITH films AS (
+        INSERT INTO film (id, title, owner_id)
+        SELECT gen_random_uuid(), 'Синтетический фильм ' || i, NULL
+        FROM generate_series(1, :rows) AS i
+        RETURNING id
+    )
+    INSERT INTO watchlist_item (watchlist_id, film_id, added_at)
+    SELECT :watchlist_id, id, now() FROM films
+    """
+)
+# Часть фильмов уже рекомендовалась за последние сутки и должна пропускаться
+INSERT_RECOMMENDATIONS = text(
+    """
+    INSERT INTO recommended_film (id, user_id, film_id, recommended_at)
+    SELECT gen_random_uuid(), :user_id, film_id, now()
+    FROM watchlist_item
+    WHERE watchlist_id = :watchlist_id
+    ORDER BY random()
+    LIMIT :rows / 20
+    """
+)
+
+
+async def measure(run) -> tuple[float, float]:
+    timings = []
+    for _ in range(REPEATS):
+        started_at = time.perf_counter()
+        await run()
+        timings.append((time.perf_counter() - started_at) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(0.95 * (len(timings) - 1))]
+
+
+def order_by_random_stmt(user_id: UserId, time_threshold: datetime.datetime):
+    # Прежний запрос: сортировка всего списка по random() ради одной строки
+    return (
+        select(FilmORM)
+        .join(WatchlistItemORM, WatchlistItemORM.film_id == FilmORM.id)
+        .join(WatchlistORM, WatchlistORM.id == WatchlistItemORM.watchlist_id)
+        .outerjoin(
+            RecommendedFilmORM,
+            (RecommendedFilmORM.film_id == FilmORM.id)
+            & (RecommendedFilmORM.user_id == user_id)
+            & (RecommendedFilmORM.recommended_at >= time_threshold),
+        )
+        .where(WatchlistORM.user_id == user_id)
+        .where(WatchlistORM.type == WatchlistType.wish)
+        .where(RecommendedFilmORM.film_id.is_(None))
+        .order_by(func.random())
+        .limit(1)
+    )
+
+
+async def benchmark(sizes: tuple[int, ...] = DEFAULT_SIZES) -> None:
+    db_url = os.environ.get("POSTGRES_DSN")
+    if not db_url:
+        print("Ошибка: Не найдена переменная окружения POSTGRES_DSN")
+        return
+
+    engine = create_async_engine(db_url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection)
+            try:
+                repo = SQLAlchemyWatchlistRepository(session=session)
+                time_threshold = datetime.datetime.now(datetime.UTC) - datetime.timedelta(hours=24)
+
+                for rows in sizes:
+                    user_id = UserId(uuid.uuid4())
+                    watchlist_id = uuid.uuid4()
+                    print(f"Создаём список из {rows} фильмов...")
+                    await session.execute(INSERT_USER, {"user_id": user_id})
+                    await session.execute(INSERT_WATCHLIST, {"watchlist_id": watchlist_id, "user_id": user_id})
+                    await session.execute(INSERT_ITEMS, {"rows": rows, "watchlist_id": watchlist_id})
+                    await session.execute(
+                        INSERT_RECOMMENDATIONS, {"rows": rows, "user_id": user_id, "watchlist_id": watchlist_id}
+                    )
+                    await session.execute(text("ANALYZE film, watchlist_item, recommended_film"))
+
+                    old_stmt = order_by_random_stmt(user_id, time_threshold)
+
+                    async def run_old(stmt=old_stmt) -> None:
+                        await session.scalar(stmt)
+
+                    async def run_new(user_id=user_id) -> None:
+                        await repo.get_random_film_not_recommended_since(WatchlistType.wish, user_id, time_threshold)
+
+                    old_p50, old_p95 = await measure(run_old)
+                    new_p50, new_p95 = await measure(run_new)
+                    print(
+                        f"{rows}: ORDER BY random() p50={old_p50:.1f}мс p95={old_p95:.1f}мс | "
+                        f"sort_key p50={new_p50:.1f}мс p95={new_p95:.1f}мс"
+                    )
+            finally:
+                await session.close()
+                await transaction.rollback()
+    except Exception as e:
+        print(f"Произошла ошибка: {e}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # Регистрируем все модели ORM
+    from backend.infrastructure.persistence.models.base import register_orm
+
+    register_orm()
+
+    sizes = tuple(int(size) for size in sys.argv[1:]) or DEFAULT_SIZES
+    asyncio.run(benchmark(sizes))
@@ -164,3 +164,6 @@ class BotCommitter:
 
     async def commit(self) -> None:
         await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
@@ -8,7 +8,6 @@ import asyncio
 import datetime
 import json
 import os
-import random
 import sys
 import uuid
 from typing import Dict, List, Any
@@ -19,12 +18,12 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 # Добавляем корневую директорию проекта в путь для импорта
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-# Импортируем модели и константы
+# Импортируем модели и подбор градиентов
 from backend.infrastructure.persistence.models.base import BaseORM
 from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.mix import MixORM
 from backend.infrastructure.persistence.models.mix_item import MixItemORM
-from backend.constant import GRADIENTS
+from backend.infrastructure.palette import pick_gradient
 
 
 async def get_or_create_film(session: AsyncSession, film_data: Dict[str, Any]) -> FilmORM:
@@ -72,14 +71,13 @@ async def create_mix_from_data(session: AsyncSession, genre_name: str, mix_data:
     # Создаем новый микс
     mix_id = uuid.uuid4()
 
-    # Используем градиенты из данных или случайный градиент
+    # Используем градиенты из данных или подбираем градиент по названию микса
     color1 = mix_data.get("color1")
     color2 = mix_data.get("color2")
     color3 = mix_data.get("color3")
 
     if not (color1 and color2 and color3):
-        gradient = random.choice(GRADIENTS)
-        color1, color2, color3 = gradient
+        color1, color2, color3 = pick_gradient(mix_data["title"])
 
     mix = MixORM(
         id=mix_id,
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Скрипт для загрузки локального каталога фильмов из JSON-lines выгрузки TMDB/Kinopoisk.
+Каждая строка файла - фильм в формате TMDBService (title, description, country, release_year,
+poster_url, tmdb_id, genres). Загрузка идёт пачками, фильмы с уже существующим tmdb_id пропускаются,
+а прогресс сохраняется в файл <путь>.offset, поэтому прерванную загрузку можно продолжить.
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Добавляем корневую директорию проекта в путь для импорта
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.infrastructure.persistence.catalog_ingest import ingest_films, load_genre_ids
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def read_offset(checkpoint_path: str) -> int:
+    if not os.path.isfile(checkpoint_path):
+        return 0
+    with open(checkpoint_path, encoding="utf-8") as f:
+        return int(f.read().strip() or 0)
+
+
+def write_offset(checkpoint_path: str, offset: int) -> None:
+    tmp_path = f"{checkpoint_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(str(offset))
+    os.replace(tmp_path, checkpoint_path)
+
+
+async def ingest_file(jsonl_file_path: str, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """
+    Основная функция загрузки: читает файл построчно и сохраняет фильмы пачками по batch_size.
+    """
+    if not os.path.isfile(jsonl_file_path):
+        print(f"Ошибка: Файл {jsonl_file_path} не найден")
+        return
+
+    db_url = os.environ.get("POSTGRES_DSN")
+    if not db_url:
+        print("Ошибка: Не найдена переменная окружения POSTGRES_DSN")
+        return
+
+    checkpoint_path = f"{jsonl_file_path}.offset"
+    offset = read_offset(checkpoint_path)
+    if offset:
+        print(f"Продолжаем загрузку с позиции {offset}")
+
+    engine = create_async_engine(db_url)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    total_inserted = 0
+    try:
+        async with async_session() as session:
+            genre_ids = await load_genre_ids(session)
+
+        with open(jsonl_file_path, "rb") as f:
+            f.seek(offset)
+            batch = []
+            while True:
+                line = f.readline()
+                if line.strip():
+                    try:
+                        batch.append(json.loads(line))
+                    except json.JSONDecodeError as e:
+                        print(f"Пропускаем некорректную строку: {e}")
+
+                if batch and (len(batch) >= batch_size or not line):
+                    # Позиция сохраняется только после коммита: если упасть между ними,
+                    # пачка при повторном запуске загрузится заново, и её фильмы будут пропущены по tmdb_id
+                    async with async_session() as session:
+                        total_inserted += await ingest_films(session, batch, genre_ids)
+                        await session.commit()
+                    write_offset(checkpoint_path, f.tell())
+                    print(f"Загружено новых фильмов: {total_inserted}")
+                    batch = []
+
+                if not line:
+                    break
+
+        if os.path.isfile(checkpoint_path):
+            os.remove(checkpoint_path)
+        print(f"Загрузка завершена, добавлено {total_inserted} фильмов")
+    except Exception as e:
+        print(f"Произошла ошибка: {e}")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    # Регистрируем все модели ORM
+    from backend.infrastructure.persistence.models.base import register_orm
+
+    register_orm()
+
+    if len(sys.argv) < 2:
+        print("Использование: python ingest_films_from_jsonl.py <файл.jsonl> [размер_пачки]")
+        sys.exit(1)
+
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_BATCH_SIZE
+    asyncio.run(ingest_file(sys.argv[1], batch_size))
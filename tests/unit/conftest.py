@@ -3,6 +3,7 @@
 import os
 import pytest
 import pytest_asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker, AsyncSession
 from backend.infrastructure.persistence.models.base import BaseORM
 
@@ -12,6 +13,8 @@ async def engine() -> AsyncEngine:
     engine = create_async_engine(dsn, echo=False)
 
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(BaseORM.metadata.create_all)
 
     yield engine
@@ -0,0 +1,102 @@
+import asyncio
+import itertools
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.services.candidate_pool import CandidatePool
+
+
+def make_fetch():
+    counter = itertools.count(1)
+
+    async def fetch(genres, movie_type, excluded_ids):
+        return {"tmdb_id": next(counter), "genres": genres, "movie_type": movie_type}
+
+    return AsyncMock(side_effect=fetch)
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestCandidatePool:
+    @pytest.mark.asyncio
+    async def test_cold_pool_fetches_directly_and_refills(self):
+        fetch = make_fetch()
+        pool = CandidatePool(fetch, capacity=4, low_water=2, refill_concurrency=2)
+
+        candidate = await pool.take(["Драма"], "movie", excluded_ids=[7])
+        await settle()
+
+        assert candidate["tmdb_id"] is not None
+        fetch.assert_any_await(["Драма"], "movie", [7])
+        assert pool.stats()["candidates"] == 4
+        assert pool.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_pool_serves_without_fetching(self):
+        fetch = make_fetch()
+        pool = CandidatePool(fetch, capacity=4, low_water=1)
+        await pool.take(["драма"], "movie")
+        await settle()
+        fetch.reset_mock()
+
+        candidate = await pool.take(["Драма"], "MOVIE")
+
+        assert candidate is not None
+        fetch.assert_not_awaited()
+        assert pool.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_excluded_candidates_are_skipped_but_kept(self):
+        fetch = make_fetch()
+        pool = CandidatePool(fetch, capacity=3, low_water=1)
+        await pool.take(None, None)
+        await settle()
+        fetch.reset_mock()
+        pooled_ids = [item["tmdb_id"] for item in pool._get_pool(pool._key(None, None))]
+
+        candidate = await pool.take(None, None, excluded_ids=pooled_ids[:1])
+
+        assert candidate["tmdb_id"] == pooled_ids[1]
+        assert pooled_ids[0] in [item["tmdb_id"] for item in pool._get_pool(pool._key(None, None))]
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_refills(self):
+        async def slow_fetch(genres, movie_type, excluded_ids):
+            await asyncio.sleep(10)
+
+        pool = CandidatePool(AsyncMock(side_effect=slow_fetch), capacity=2, low_water=1)
+        take = asyncio.create_task(pool.take(None, None))
+        await settle()
+
+        await pool.close()
+        take.cancel()
+
+        assert pool.stats()["refilling"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refill_stops_when_pool_is_evicted(self):
+        released = asyncio.Event()
+        counter = itertools.count(1)
+
+        async def fetch(genres, movie_type, excluded_ids):
+            if genres == ["Драма"] and not excluded_ids:
+                await released.wait()
+            return {"tmdb_id": next(counter), "genres": genres}
+
+        fetch_mock = AsyncMock(side_effect=fetch)
+        pool = CandidatePool(fetch_mock, capacity=4, low_water=2, refill_concurrency=2, max_pools=1)
+        await pool.take(["Драма"], None, excluded_ids=[0])
+        await settle()
+
+        await pool.take(["Комедия"], None, excluded_ids=[0])
+        released.set()
+        await settle()
+
+        drama_calls = [call for call in fetch_mock.await_args_list if call.args[0] == ["Драма"]]
+        assert len(drama_calls) == 3
+        assert pool.stats()["pools"] == 1
+        assert all(item["genres"] == ["Комедия"] for item in pool._get_pool(pool._key(["Комедия"], None)))
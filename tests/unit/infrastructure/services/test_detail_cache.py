@@ -0,0 +1,76 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.services.detail_cache import DetailCache, DiskStore
+from backend.infrastructure.services.tmdb import TMDBService
+
+
+class TestDetailCache:
+    @pytest.mark.asyncio
+    async def test_get_and_set(self):
+        cache = DetailCache(maxsize=10, ttl=60)
+
+        assert await cache.get("tmdb_movie", 1) is None
+        await cache.set("tmdb_movie", 1, {"id": 1})
+
+        assert await cache.get("tmdb_movie", 1) == {"id": 1}
+        assert await cache.get("tmdb_tv", 1) is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    async def test_memory_entry_expires(self):
+        cache = DetailCache(maxsize=10, ttl=0)
+        await cache.set("tmdb_movie", 1, {"id": 1})
+
+        assert await cache.get("tmdb_movie", 1) is None
+        assert cache.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        cache = DetailCache(maxsize=2, ttl=60)
+        await cache.set("tmdb_movie", 1, {"id": 1})
+        await cache.set("tmdb_movie", 2, {"id": 2})
+        await cache.get("tmdb_movie", 1)
+
+        await cache.set("tmdb_movie", 3, {"id": 3})
+
+        assert await cache.get("tmdb_movie", 1) == {"id": 1}
+        assert await cache.get("tmdb_movie", 2) is None
+        assert await cache.get("tmdb_movie", 3) == {"id": 3}
+
+    @pytest.mark.asyncio
+    async def test_service_keeps_providers_apart(self):
+        service = TMDBService(detail_cache=DetailCache(maxsize=10, ttl=60))
+        service._get_json = AsyncMock(side_effect=[{"id": 7, "title": "Фильм"}, {"id": 7, "name": "Сериал"}])
+
+        movie = await service.get_movie_details(7)
+        tv = await service.get_tv_details(7)
+
+        assert movie == {"id": 7, "title": "Фильм"}
+        assert tv == {"id": 7, "name": "Сериал"}
+        assert await service.get_movie_details(7) == movie
+        assert await service.get_tv_details(7) == tv
+        assert service._get_json.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_store_warms_new_cache(self, tmp_path):
+        path = tmp_path / "details.sqlite"
+        cache = DetailCache(maxsize=10, ttl=60, disk_store=DiskStore(path))
+        await cache.set("kinopoisk", 42, {"name": "Фильм"})
+        cache.close()
+
+        restarted_cache = DetailCache(maxsize=10, ttl=60, disk_store=DiskStore(path))
+
+        assert await restarted_cache.get("kinopoisk", 42) == {"name": "Фильм"}
+        assert restarted_cache.stats()["disk_hits"] == 1
+        restarted_cache.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_store_skips_expired_entries(self, tmp_path):
+        cache = DetailCache(maxsize=10, ttl=-1, disk_store=DiskStore(tmp_path / "details.sqlite"))
+        await cache.set("kinopoisk", 42, {"name": "Фильм"})
+
+        assert await cache.get("kinopoisk", 42) is None
+        cache.close()
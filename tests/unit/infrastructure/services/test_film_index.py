@@ -0,0 +1,92 @@
+import dataclasses
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.domain.film import Film
+from backend.domain.film_id import FilmId
+from backend.infrastructure.services.film_index import FilmIndex
+
+
+def make_film(title: str, description: str) -> Film:
+    return Film(
+        id=FilmId(uuid.uuid4()),
+        title=title,
+        description=description,
+        country=None,
+        release_year=None,
+        poster_url=None,
+        tmdb_id=None,
+        owner_id=None,
+    )
+
+
+FILMS = [
+    make_film("День сурка", "Телеведущий застревает во временной петле и каждый день просыпается в одно и то же утро"),
+    make_film("История игрушек", "Ковбой Вуди и другие игрушки оживают, когда в детской комнате никого нет"),
+    make_film("Матрица", "Хакер узнаёт, что привычный мир — компьютерная симуляция, созданная машинами"),
+]
+
+
+NOW = datetime.datetime(2026, 10, 19, tzinfo=datetime.UTC)
+
+
+class TestFilmIndex:
+    @pytest.fixture
+    def changes(self):
+        return [(film, NOW) for film in FILMS]
+
+    @pytest.fixture
+    def repo(self, changes):
+        def get_catalog_changes(after, limit):
+            ordered = sorted(changes, key=lambda change: (change[1], change[0].id))
+            return [change for change in ordered if after is None or (change[1], change[0].id) > after][:limit]
+
+        repo = AsyncMock()
+        repo.get_catalog_changes.side_effect = get_catalog_changes
+        repo_path = "backend.infrastructure.services.film_index.SQLAlchemyFilmRepository"
+        with patch(repo_path, return_value=repo):
+            yield repo
+
+    @pytest.fixture
+    def film_index(self):
+        sessionmaker = MagicMock()
+        sessionmaker.return_value.__aenter__.return_value = AsyncMock()
+        return FilmIndex(sessionmaker, batch_size=2)
+
+    @pytest.mark.asyncio
+    async def test_refresh_indexes_only_changed_films(self, film_index, repo):
+        assert await film_index.refresh() == len(FILMS)
+        assert repo.get_catalog_changes.await_count == 2
+
+        assert await film_index.refresh() == 0
+        assert film_index.stats() == {"films": len(FILMS)}
+
+    @pytest.mark.asyncio
+    async def test_refresh_reindexes_updated_films(self, film_index, repo, changes):
+        await film_index.refresh()
+        updated = dataclasses.replace(FILMS[2], description="Космический вестерн про охотника за головами")
+        changes[2] = (updated, NOW + datetime.timedelta(minutes=5))
+
+        assert await film_index.refresh() == 1
+
+        results = await film_index.search("вестерн про охотника за головами", limit=3)
+        assert results[0][0] == updated.id
+        assert await film_index.search("привычный мир — компьютерная симуляция", limit=3) == []
+        assert film_index.stats() == {"films": len(FILMS)}
+
+    @pytest.mark.asyncio
+    async def test_confident_match_for_description_fragment(self, film_index, repo):
+        await film_index.refresh()
+
+        results = await film_index.search("игрушки оживают, когда в детской комнате никого нет", limit=3)
+
+        assert results[0][0] == FILMS[1].id
+        assert film_index.is_confident(results)
+
+    @pytest.mark.asyncio
+    async def test_empty_results_are_not_confident(self, film_index):
+        assert await film_index.search("что-нибудь про космос", limit=3) == []
+        assert not film_index.is_confident([])
@@ -0,0 +1,162 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.services.gpt import GPTService, JSONObjectScanner, MediaSuggestion
+
+ANSWER = (
+    "```json\n"
+    + json.dumps(
+        {
+            "suggestions": [
+                {"media_name": "День сурка", "confidence": 0.9},
+                {"media_name": "Грань будущего", "confidence": 0.6},
+            ],
+            "not_found": False,
+        },
+        ensure_ascii=False,
+    )
+    + "\n```"
+)
+
+
+def split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def make_stream(chunks: list[str]):
+    async def stream():
+        for chunk in chunks:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+
+    return stream()
+
+
+class TestJSONObjectScanner:
+    def test_emits_nested_objects_as_they_close(self):
+        scanner = JSONObjectScanner()
+        emitted = []
+
+        for chunk in split(ANSWER, 7):
+            emitted.extend(scanner.feed(chunk))
+
+        assert [depth for depth, _ in emitted] == [1, 1, 0]
+        assert json.loads(emitted[0][1]) == {"media_name": "День сурка", "confidence": 0.9}
+        assert json.loads(emitted[2][1])["not_found"] is False
+
+    def test_result_does_not_depend_on_chunking(self):
+        whole = JSONObjectScanner().feed(ANSWER)
+
+        for size in range(1, len(ANSWER) + 1):
+            scanner = JSONObjectScanner()
+            assert [obj for chunk in split(ANSWER, size) for obj in scanner.feed(chunk)] == whole
+
+    def test_object_split_across_chunks_is_emitted_once_complete(self):
+        scanner = JSONObjectScanner()
+
+        assert scanner.feed('{"suggestions": [{"media_name": "Матр') == []
+        assert scanner.feed('ица", "confidence": 0.8}') == [(1, '{"media_name": "Матрица", "confidence": 0.8}')]
+        assert scanner.feed("]") == []
+        assert scanner.feed("}") == [(0, '{"suggestions": [{"media_name": "Матрица", "confidence": 0.8}]}')]
+
+    def test_malformed_input(self):
+        scanner = JSONObjectScanner()
+
+        assert scanner.feed("} текст без объекта }") == []
+        assert scanner.feed('{"media_name": "Матрица", confidence: }') == [
+            (0, '{"media_name": "Матрица", confidence: }')
+        ]
+        assert scanner.feed('{"media_name": "Без конца"') == []
+
+    def test_find_json_objects_returns_top_level_objects(self):
+        service = GPTService(api_key="test")
+
+        assert service._find_json_objects('текст {"a": {"b": 1}} ещё {"c": 2}') == ['{"a": {"b": 1}}', '{"c": 2}']
+
+
+class TestStreamMultipleMedia:
+    @pytest.fixture
+    def service(self):
+        service = GPTService(api_key="test")
+        service.client = AsyncMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_yields_suggestion_before_answer_is_complete(self, service):
+        chunks = split(ANSWER, 5)
+        first_closed = ANSWER.index("}") + 1
+        consumed = []
+
+        async def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=chunk))])
+
+        service.client.chat.completions.create.return_value = stream()
+        suggestions = service.stream_multiple_media("фильм про временную петлю")
+
+        first = await anext(suggestions)
+
+        assert first == MediaSuggestion(media_name="День сурка", confidence=0.9)
+        assert len("".join(consumed)) < len(ANSWER)
+        assert len("".join(consumed)) >= first_closed
+        assert [suggestion async for suggestion in suggestions] == [
+            MediaSuggestion(media_name="Грань будущего", confidence=0.6)
+        ]
+        assert service.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self, service):
+        service.client.chat.completions.create.return_value = make_stream(split(ANSWER, 5))
+
+        suggestions = [suggestion async for suggestion in service.stream_multiple_media("описание", limit=1)]
+
+        assert [suggestion.media_name for suggestion in suggestions] == ["День сурка"]
+
+    @pytest.mark.asyncio
+    async def test_uses_and_fills_suggestion_cache(self, service):
+        service.suggestion_cache = AsyncMock()
+        service.suggestion_cache.get.return_value = None
+        service.client.chat.completions.create.return_value = make_stream(split(ANSWER, 5))
+
+        suggestions = [suggestion async for suggestion in service.stream_multiple_media("описание")]
+
+        assert len(suggestions) == 2
+        service.suggestion_cache.set.assert_awaited_once_with(
+            "описание", [("День сурка", 0.9), ("Грань будущего", 0.6)]
+        )
+
+        service.suggestion_cache.get.return_value = [("Матрица", 0.8)]
+        service.client.chat.completions.create.reset_mock()
+
+        cached = [suggestion async for suggestion in service.stream_multiple_media("описание")]
+
+        assert cached == [MediaSuggestion(media_name="Матрица", confidence=0.8)]
+        service.client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_error_ends_iteration(self, service):
+        service.client.chat.completions.create.side_effect = RuntimeError("boom")
+
+        assert [suggestion async for suggestion in service.stream_multiple_media("описание")] == []
+
+    @pytest.mark.asyncio
+    async def test_skips_invalid_objects_and_keeps_streaming(self, service):
+        service.suggestion_cache = AsyncMock()
+        service.suggestion_cache.get.return_value = None
+        answer = (
+            '{"suggestions": ['
+            '{"media_name": "Слишком уверен", "confidence": 1.5}, '
+            '{"media_name": "Сломан", "confidence": }, '
+            '{"confidence": 0.7}, '
+            '{"media_name": "Матрица", "confidence": 0.8}'
+            "]}"
+        )
+        service.client.chat.completions.create.return_value = make_stream(split(answer, 4))
+
+        suggestions = [suggestion async for suggestion in service.stream_multiple_media("описание")]
+
+        assert suggestions == [MediaSuggestion(media_name="Матрица", confidence=0.8)]
+        service.suggestion_cache.set.assert_awaited_once_with("описание", [("Матрица", 0.8)])
@@ -0,0 +1,47 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.infrastructure.palette import pick_gradient
+from backend.infrastructure.services.palette import PaletteService
+
+
+class TestPaletteService:
+    @pytest.mark.asyncio
+    async def test_uses_local_palette_without_gpt(self):
+        service = PaletteService()
+
+        assert await service.gradient("Фильмы ужасов") == pick_gradient("Фильмы ужасов")
+
+    @pytest.mark.asyncio
+    async def test_gpt_colors_are_cached_per_normalized_title(self):
+        gpt_service = AsyncMock()
+        gpt_service.generate_gradient_colors.return_value = ("#112233", "#445566")
+        service = PaletteService(gpt_service=gpt_service)
+
+        first = await service.gradient("Фильмы ужасов")
+        second = await service.gradient("фильмы, УЖАСОВ")
+
+        assert first == second == ("#112233", "#445566", pick_gradient("Фильмы ужасов")[2])
+        gpt_service.generate_gradient_colors.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_palette_on_gpt_failure(self):
+        gpt_service = AsyncMock()
+        gpt_service.generate_gradient_colors.return_value = None
+        service = PaletteService(gpt_service=gpt_service)
+
+        assert await service.gradient("Моя подборка") == pick_gradient("Моя подборка")
+        assert service.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_palette_on_timeout(self):
+        async def slow(title):
+            await asyncio.sleep(1)
+
+        gpt_service = AsyncMock()
+        gpt_service.generate_gradient_colors.side_effect = slow
+        service = PaletteService(gpt_service=gpt_service, timeout=0.01)
+
+        assert await service.gradient("Моя подборка") == pick_gradient("Моя подборка")
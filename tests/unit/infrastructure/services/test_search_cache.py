@@ -0,0 +1,34 @@
+import uuid
+
+from backend.domain.film_id import FilmId
+from backend.infrastructure.services.search_cache import SearchCache, normalize_query
+
+
+class TestSearchCache:
+    def test_normalize_query(self):
+        assert normalize_query("  Ёлки   ПАЛКИ\n") == "елки палки"
+        assert normalize_query(None) == ""
+
+    def test_equivalent_queries_share_entry(self):
+        cache = SearchCache()
+        films_ids = [FilmId(uuid.uuid4()), FilmId(uuid.uuid4())]
+
+        cache.set("Ёлки", None, 10, films_ids)
+
+        assert cache.get("  елки ", None, 10) == tuple(films_ids)
+        assert cache.get("елки", None, 5) is None
+        assert cache.get(None, "елки", 10) is None
+
+    def test_empty_results_use_negative_ttl(self):
+        cache = SearchCache(ttl=600.0, negative_ttl=0.0)
+
+        cache.set("nothing", None, 10, [])
+
+        assert cache.get("nothing", None, 10) is None
+
+    def test_incomplete_results_use_negative_ttl(self):
+        cache = SearchCache(ttl=600.0, negative_ttl=0.0)
+
+        cache.set("slow", None, 10, [FilmId(uuid.uuid4())], complete=False)
+
+        assert cache.get("slow", None, 10) is None
@@ -0,0 +1,62 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.domain.cached_suggestions import CachedSuggestions
+from backend.infrastructure.minhash import MinHasher, fingerprint
+from backend.infrastructure.services.suggestion_cache import SuggestionCache
+
+DESCRIPTION = "фильм про парня который застрял во временной петле и каждый день просыпается в одно и то же утро"
+
+
+def make_entry(description: str, suggestions: list[tuple[str, float]]) -> CachedSuggestions:
+    hasher = MinHasher()
+    signature = hasher.signature(description)
+    return CachedSuggestions(
+        fingerprint=fingerprint(description),
+        signature=signature,
+        band_keys=hasher.band_keys(signature),
+        suggestions=suggestions,
+        created_at=datetime.datetime.now(datetime.UTC),
+    )
+
+
+class TestSuggestionCache:
+    @pytest.fixture
+    def repo(self):
+        repo = AsyncMock()
+        repo.find_candidates.return_value = []
+        repo_path = "backend.infrastructure.services.suggestion_cache.SQLAlchemyGPTSuggestionRepository"
+        with patch(repo_path, return_value=repo):
+            yield repo
+
+    @pytest.fixture
+    def cache(self):
+        sessionmaker = MagicMock()
+        sessionmaker.return_value.__aenter__.return_value = AsyncMock()
+        return SuggestionCache(sessionmaker)
+
+    @pytest.mark.asyncio
+    async def test_set_is_served_from_memory(self, cache, repo):
+        await cache.set(DESCRIPTION, [("День сурка", 0.9)])
+
+        assert await cache.get(DESCRIPTION.upper()) == (("День сурка", 0.9),)
+        repo.save.assert_awaited_once()
+        repo.find_candidates.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_is_found_in_table(self, cache, repo):
+        repo.find_candidates.return_value = [
+            make_entry("мультфильм про говорящих игрушек", [("История игрушек", 0.9)]),
+            make_entry(DESCRIPTION + " в маленьком городке", [("День сурка", 0.9)]),
+        ]
+
+        assert await cache.get(DESCRIPTION + " в маленьком городе") == (("День сурка", 0.9),)
+        assert cache.stats()["near_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_candidates_are_ignored(self, cache, repo):
+        repo.find_candidates.return_value = [make_entry("мультфильм про говорящих игрушек", [("История игрушек", 0.9)])]
+
+        assert await cache.get(DESCRIPTION) is None
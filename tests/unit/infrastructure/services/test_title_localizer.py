@@ -0,0 +1,63 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.infrastructure.services.title_localizer import TitleLocalizer
+
+
+class TestTitleLocalizer:
+    @pytest.fixture
+    def repo(self):
+        repo = AsyncMock()
+        repo.get_many.return_value = {604: "Матрица: Перезагрузка"}
+        repo_path = "backend.infrastructure.services.title_localizer.SQLAlchemyLocalizedTitleRepository"
+        with patch(repo_path, return_value=repo):
+            yield repo
+
+    @pytest.fixture
+    def localizer(self):
+        sessionmaker = MagicMock()
+        sessionmaker.return_value.__aenter__.return_value = AsyncMock()
+        return TitleLocalizer(sessionmaker)
+
+    @pytest.mark.asyncio
+    async def test_requested_titles_are_resolved_in_background(self, localizer, repo):
+        resolve = AsyncMock(return_value="Матрица")
+        localizer.start(resolve)
+
+        assert localizer.get(603) is None
+        localizer.request(603, "The Matrix")
+        localizer.request(604, "The Matrix Reloaded")
+        localizer.request(603, "The Matrix")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await localizer.stop()
+
+        assert localizer.get(603) == "Матрица"
+        assert localizer.get(604) == "Матрица: Перезагрузка"
+        resolve.assert_awaited_once_with("The Matrix")
+        repo.save_many.assert_awaited_once_with({603: "Матрица"})
+
+    @pytest.mark.asyncio
+    async def test_unresolved_title_is_kept_as_is(self, localizer, repo):
+        localizer.start(AsyncMock(return_value=None))
+
+        localizer.request(605, "Some Film")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await localizer.stop()
+
+        assert localizer.get(605) == "Some Film"
+
+    @pytest.mark.asyncio
+    async def test_failed_resolution_is_not_persisted(self, localizer, repo):
+        localizer.start(AsyncMock(side_effect=RuntimeError))
+
+        localizer.request(605, "Some Film")
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await localizer.stop()
+
+        assert localizer.get(605) is None
+        repo.save_many.assert_not_awaited()
@@ -1,9 +1,11 @@
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import httpx
 
+from backend.infrastructure.circuit_breaker import CircuitBreaker
 from backend.infrastructure.services.tmdb import TMDBService
 
 
@@ -54,6 +56,20 @@ class TestTMDBService:
         mock_client.get.assert_called_once()
         assert f"movie/{movie_id}" in str(mock_client.get.call_args)
 
+    @pytest.mark.asyncio
+    async def test_get_movie_details_is_cached(self, tmdb_service, mock_client):
+        movie_id = 12345
+        expected_result = {"id": movie_id, "title": "Test Movie"}
+        response_mock = MagicMock()
+        response_mock.json.return_value = expected_result
+        mock_client.get.return_value = response_mock
+
+        await tmdb_service.get_movie_details(movie_id)
+        result = await tmdb_service.get_movie_details(movie_id)
+
+        assert result == expected_result
+        mock_client.get.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_tv_details(self, tmdb_service, mock_client):
         
@@ -188,4 +204,127 @@ class TestTMDBService:
 
         
         assert tmdb_service.get_poster_url("/test_poster.jpg",
-                                           "original") == "https://image.tmdb.org/t/p/original/test_poster.jpg"
\ No newline at end of file
+                                           "original") == "https://image.tmdb.org/t/p/original/test_poster.jpg"
+    @pytest.mark.asyncio
+    async def test_genre_map_is_loaded_once(self, tmdb_service, mock_client):
+        response_mock = MagicMock()
+        response_mock.json.return_value = {"genres": [{"id": 28, "name": "Боевик"}, {"id": 35, "name": "Комедия"}]}
+        mock_client.get.return_value = response_mock
+
+        first = await tmdb_service._get_tmdb_genre_ids_by_names(["боевик"])
+        second = await tmdb_service._get_tmdb_genre_ids_by_names(["Комедия", "Драма"])
+
+        assert first == [28]
+        assert second == [35]
+        mock_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_genre_refresh_keeps_previous_map(self, tmdb_service, mock_client):
+        response_mock = MagicMock()
+        response_mock.json.return_value = {"genres": [{"id": 28, "name": "Боевик"}]}
+        mock_client.get.return_value = response_mock
+        await tmdb_service.refresh_genre_maps()
+
+        mock_client.get.side_effect = httpx.ConnectError("down")
+        await tmdb_service.refresh_genre_maps()
+
+        assert await tmdb_service._get_tmdb_genre_ids_by_names(["Боевик"]) == [28]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_share_one_request(self, tmdb_service, mock_client):
+        response_mock = MagicMock()
+        response_mock.json.return_value = {"results": []}
+
+        async def get(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return response_mock
+
+        mock_client.get.side_effect = get
+
+        await asyncio.gather(tmdb_service.search_multi("matrix"), tmdb_service.search_multi("matrix"))
+
+        mock_client.get.assert_called_once()
+        assert tmdb_service.single_flight.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_search_title_prefers_kinopoisk(self, tmdb_service):
+        with patch.object(tmdb_service, "_search_kinopoisk", AsyncMock(return_value=[{"tmdb_id": 1}])), \
+                patch.object(tmdb_service, "search_all_and_get_details", AsyncMock()) as mock_tmdb:
+            results = await tmdb_service.search_title("matrix")
+
+        assert results == [{"tmdb_id": 1}]
+        mock_tmdb.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_title_falls_back_on_kinopoisk_error(self, tmdb_service):
+        with patch.object(tmdb_service, "_search_kinopoisk", AsyncMock(side_effect=httpx.ConnectError("down"))), \
+                patch.object(tmdb_service, "search_all_and_get_details", AsyncMock(return_value=[{"tmdb_id": 2}])):
+            results = await tmdb_service.search_title("matrix")
+
+        assert results == [{"tmdb_id": 2}]
+        assert tmdb_service.kinopoisk_breaker.error_rate() == 1.0
+
+    @pytest.mark.asyncio
+    async def test_search_title_hedges_slow_kinopoisk(self, tmdb_service):
+        tmdb_service.search_hedge_delay = 0.01
+
+        async def slow_kinopoisk(*args):
+            await asyncio.sleep(10)
+            return [{"tmdb_id": 1}]
+
+        with patch.object(tmdb_service, "_search_kinopoisk", slow_kinopoisk), \
+                patch.object(tmdb_service, "search_all_and_get_details", AsyncMock(return_value=[{"tmdb_id": 2}])):
+            results = await asyncio.wait_for(tmdb_service.search_title("matrix"), timeout=1)
+
+        assert results == [{"tmdb_id": 2}]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_half_open_probe_does_not_close_circuit(self, tmdb_service):
+        tmdb_service.search_hedge_delay = 0.01
+        breaker = tmdb_service.kinopoisk_breaker = CircuitBreaker(min_calls=1, open_duration=0)
+        breaker.record(success=False, latency=0.1)
+
+        async def slow_kinopoisk(*args):
+            await asyncio.sleep(10)
+            return [{"tmdb_id": 1}]
+
+        with patch.object(tmdb_service, "_search_kinopoisk", slow_kinopoisk), \
+                patch.object(tmdb_service, "search_all_and_get_details", AsyncMock(return_value=[{"tmdb_id": 2}])):
+            results = await asyncio.wait_for(tmdb_service.search_title("matrix"), timeout=1)
+            await asyncio.sleep(0)
+
+        assert results == [{"tmdb_id": 2}]
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_search_title_skips_kinopoisk_when_circuit_is_open(self, tmdb_service):
+        tmdb_service.kinopoisk_breaker.allow = MagicMock(return_value=False)
+        mock_kinopoisk = AsyncMock()
+
+        with patch.object(tmdb_service, "_search_kinopoisk", mock_kinopoisk), \
+                patch.object(tmdb_service, "search_all_and_get_details", AsyncMock(return_value=[{"tmdb_id": 2}])):
+            results = await tmdb_service.search_title("matrix")
+
+        assert results == [{"tmdb_id": 2}]
+        mock_kinopoisk.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_format_movie_data_uses_localized_title(self, tmdb_service):
+        tmdb_service.title_localizer = MagicMock()
+        tmdb_service.title_localizer.get.side_effect = {603: "Матрица"}.get
+
+        localized = await tmdb_service.format_movie_data({"id": 603, "title": "The Matrix"})
+        not_localized = await tmdb_service.format_movie_data({"id": 604, "title": "The Matrix Reloaded"})
+
+        assert localized["title"] == "Матрица"
+        assert not_localized["title"] == "The Matrix Reloaded"
+        tmdb_service.title_localizer.request.assert_called_once_with(604, "The Matrix Reloaded")
+
+    def test_stats_include_coalescing_and_circuit_breakers(self, tmdb_service):
+        stats = tmdb_service.stats()
+
+        assert stats["single_flight"] == {"calls": 0, "coalesced": 0, "in_flight": 0}
+        assert stats["circuit_breakers"]["kinopoisk"]["state"] == "closed"
+        assert stats["circuit_breakers"]["tmdb"]["state"] == "closed"
+        assert "hits" in stats["detail_cache"]
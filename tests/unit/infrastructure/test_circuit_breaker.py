@@ -0,0 +1,78 @@
+from backend.infrastructure.circuit_breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    def test_opens_on_error_rate(self):
+        breaker = CircuitBreaker(min_calls=4, max_error_rate=0.5, clock=FakeClock())
+
+        for success in (True, False, False):
+            breaker.record(success=success, latency=0.1)
+        assert breaker.allow()
+        breaker.record(success=False, latency=0.1)
+
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+    def test_opens_on_p95_latency(self):
+        breaker = CircuitBreaker(min_calls=4, max_p95_latency=1.0, clock=FakeClock())
+
+        for _ in range(4):
+            breaker.record(success=True, latency=2.0)
+
+        assert breaker.state == "open"
+
+    def test_half_open_allows_single_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_duration=30, clock=clock)
+        breaker.record(success=False, latency=0.1)
+
+        clock.now = 31
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_successful_probe_closes(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_duration=30, clock=clock)
+        breaker.record(success=False, latency=0.1)
+        clock.now = 31
+        breaker.allow()
+
+        breaker.record(success=True, latency=0.1)
+
+        assert breaker.state == "closed"
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_duration=30, clock=clock)
+        breaker.record(success=False, latency=0.1)
+        clock.now = 31
+        breaker.allow()
+
+        breaker.record(success=False, latency=0.1)
+
+        assert breaker.state == "open"
+        assert breaker.stats()["opened"] == 2
+
+    def test_released_probe_lets_next_call_probe(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(min_calls=1, open_duration=30, clock=clock)
+        breaker.record(success=False, latency=0.1)
+        clock.now = 31
+        breaker.allow()
+
+        breaker.release()
+
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()
@@ -0,0 +1,42 @@
+import httpx
+import pytest
+import pytest_asyncio
+
+from backend.config.settings import Settings
+from backend.infrastructure.http_clients import HTTPClients
+
+
+class TestHTTPClients:
+    @pytest_asyncio.fixture
+    async def http_clients(self):
+        http_clients = HTTPClients.from_settings(Settings(HTTP_MAX_CONNECTIONS=7, HTTP_TIMEOUT=3.0))
+        yield http_clients
+        await http_clients.close()
+
+    @pytest.mark.asyncio
+    async def test_clients_are_configured_from_settings(self, http_clients):
+        assert http_clients.tmdb is not http_clients.kinopoisk_dev
+        assert http_clients.tmdb.timeout.read == 3.0
+        assert http_clients.tmdb._transport.transport._pool._max_connections == 7
+
+    @pytest.mark.asyncio
+    async def test_stats_count_requests_per_upstream(self, http_clients):
+        http_clients.tmdb._transport = httpx.MockTransport(lambda _: httpx.Response(404))
+
+        await http_clients.tmdb.get("https://tmdb.test/movie/1")
+
+        stats = http_clients.stats()
+        assert stats["tmdb"]["requests"] == 1
+        assert stats["tmdb"]["errors"] == 1
+        assert stats["kinopoisk_dev"]["requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_requests_go_through_provider_limiter(self, http_clients):
+        http_clients.kinopoisk_dev._transport.transport = httpx.MockTransport(lambda _: httpx.Response(200))
+
+        await http_clients.kinopoisk_dev.get("https://kinopoisk.test/movie/1")
+
+        stats = http_clients.stats()
+        assert stats["kinopoisk_dev"]["acquired"] == 1
+        assert stats["kinopoisk_dev"]["waiting"] == 0
+        assert stats["tmdb"]["acquired"] == 0
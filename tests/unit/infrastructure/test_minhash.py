@@ -0,0 +1,33 @@
+from backend.infrastructure.minhash import MinHasher, fingerprint
+
+
+class TestMinHasher:
+    def test_fingerprint_ignores_case_punctuation_and_yo(self):
+        assert fingerprint("Ёжик в тумане!") == fingerprint("  ежик, В ТУМАНЕ ")
+        assert fingerprint("Ёжик в тумане") != fingerprint("Ёжик в городе")
+
+    def test_signature_is_stable_across_instances(self):
+        text = "фильм про мальчика который попал в школу волшебства"
+
+        assert MinHasher().signature(text) == MinHasher().signature(text)
+
+    def test_reworded_text_is_similar(self):
+        hasher = MinHasher()
+        original = hasher.signature(
+            "фильм про парня который застрял во временной петле и каждый день просыпается в одно и то же утро"
+        )
+        reworded = hasher.signature(
+            "Фильм про парня, который застрял во временной петле и каждый день просыпается в одно и то же утро!"
+        )
+        different = hasher.signature("мультфильм про говорящих игрушек в детской комнате")
+
+        assert hasher.similarity(original, reworded) == 1.0
+        assert hasher.similarity(original, different) < 0.3
+
+    def test_similar_signatures_share_band_keys(self):
+        hasher = MinHasher()
+        first = hasher.signature("фильм про парня который застрял во временной петле в маленьком городке")
+        second = hasher.signature("фильм про парня который застрял во временной петле в маленьком городе")
+
+        assert set(hasher.band_keys(first)) & set(hasher.band_keys(second))
+        assert len(hasher.band_keys(first)) == hasher.bands
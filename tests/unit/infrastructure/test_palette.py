@@ -0,0 +1,36 @@
+import pytest
+
+from backend.constant import GRADIENTS, THEMED_GRADIENTS
+from backend.infrastructure.palette import _validate_gradients, detect_theme, is_hex_color, pick_gradient
+
+
+class TestPalette:
+    def test_all_palette_colors_are_valid(self):
+        gradients = [*GRADIENTS, *(gradient for themed in THEMED_GRADIENTS.values() for gradient in themed)]
+
+        assert all(is_hex_color(color) for gradient in gradients for color in gradient)
+
+    def test_malformed_hex_is_rejected(self):
+        assert not is_hex_color("#B577ECF")
+        assert not is_hex_color("B577EC")
+
+        with pytest.raises(ValueError, match="invalid gradient"):
+            _validate_gradients("test", [("#B2FEFA", "#0ED2F7", "#B577ECF")])
+
+    @pytest.mark.parametrize(
+        ("title", "theme"),
+        [
+            ("Фильмы ужасов на вечер", "horror"),
+            ("Лучшие КОМЕДИИ", "comedy"),
+            ("Про любовь", "romance"),
+            ("Новогоднее настроение", "holiday"),
+            ("Моя подборка", None),
+        ],
+    )
+    def test_detect_theme(self, title, theme):
+        assert detect_theme(title) == theme
+
+    def test_gradient_is_deterministic_and_themed(self):
+        assert pick_gradient("Фильмы ужасов!") == pick_gradient("  фильмы УЖАСОВ ")
+        assert pick_gradient("Фильмы ужасов") in THEMED_GRADIENTS["horror"]
+        assert pick_gradient("Моя подборка") in GRADIENTS
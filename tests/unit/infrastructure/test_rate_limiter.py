@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+import pytest
+
+from backend.infrastructure.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_is_not_delayed(self):
+        limiter = RateLimiter(rate=1, max_concurrency=10, burst=3)
+        started_at = time.monotonic()
+
+        for _ in range(3):
+            async with limiter.acquire():
+                pass
+
+        assert time.monotonic() - started_at < 0.1
+        assert limiter.stats()["acquired"] == 3
+
+    @pytest.mark.asyncio
+    async def test_requests_over_rate_are_queued(self):
+        limiter = RateLimiter(rate=50, max_concurrency=10, burst=1)
+        started_at = time.monotonic()
+
+        async def call():
+            async with limiter.acquire():
+                pass
+
+        await asyncio.gather(*(call() for _ in range(5)))
+
+        assert time.monotonic() - started_at >= 0.07
+        assert limiter.stats()["max_wait"] > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        limiter = RateLimiter(rate=1000, max_concurrency=2)
+        running = 0
+        max_running = 0
+
+        async def call():
+            nonlocal running, max_running
+            async with limiter.acquire():
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        tasks = [asyncio.create_task(call()) for _ in range(6)]
+        await asyncio.sleep(0.005)
+        assert limiter.stats()["waiting"] == 4
+        await asyncio.gather(*tasks)
+
+        assert max_running == 2
+        assert limiter.stats()["waiting"] == 0
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            RateLimiter(rate=0, max_concurrency=1)
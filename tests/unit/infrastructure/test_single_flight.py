@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from backend.infrastructure.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_coalesced(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(single_flight.do("key", fetch) for _ in range(5)))
+
+        assert results == [1] * 5
+        assert calls == 1
+        assert single_flight.stats() == {"calls": 5, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_coalesced(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            return 1
+
+        await single_flight.do("key", fetch)
+        await single_flight.do("key", fetch)
+
+        assert single_flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        results = await asyncio.gather(
+            single_flight.do("key", fetch), single_flight.do("key", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "result"
+
+        first = asyncio.create_task(single_flight.do("key", fetch))
+        second = asyncio.create_task(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_shared_call_is_cancelled_when_all_callers_are_gone(self):
+        single_flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.create_task(single_flight.do("key", fetch))
+        await started.wait()
+        caller.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert single_flight.stats()["in_flight"] == 0
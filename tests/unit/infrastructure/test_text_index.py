@@ -0,0 +1,79 @@
+import uuid
+
+from backend.domain.film_id import FilmId
+from backend.infrastructure.text_index import TextIndex
+
+FILMS = {
+    FilmId(uuid.uuid4()): "День сурка. Телеведущий застревает во временной петле и каждый день просыпается в одно и то же утро",
+    FilmId(uuid.uuid4()): "История игрушек. Ковбой Вуди и другие игрушки оживают, когда в детской комнате никого нет",
+    FilmId(uuid.uuid4()): "Матрица. Хакер узнаёт, что привычный мир — компьютерная симуляция, созданная машинами",
+    FilmId(uuid.uuid4()): "Титаник. Молодые влюблённые из разных сословий встречаются на борту обречённого лайнера",
+}
+
+
+def make_index() -> TextIndex:
+    index = TextIndex(max_df=1.0)
+    for film_id, text in FILMS.items():
+        index.add(film_id, text)
+    return index
+
+
+class TestTextIndex:
+    def test_finds_film_by_reworded_description(self):
+        index = make_index()
+        expected = next(film_id for film_id, text in FILMS.items() if text.startswith("День сурка"))
+
+        results = index.search("фильм про мужика который застрял во временной петле", limit=2)
+
+        assert results[0][0] == expected
+        assert results[0][1] > results[1][1]
+
+    def test_min_score_filters_unrelated_films(self):
+        index = make_index()
+
+        assert index.search("космический вестерн про охотника за головами", limit=4, min_score=0.2) == []
+
+    def test_add_is_idempotent(self):
+        index = make_index()
+        film_id = next(iter(FILMS))
+
+        index.add(film_id, "совсем другой текст")
+
+        assert len(index) == len(FILMS)
+        assert film_id in index
+
+    def test_replace_hides_previous_version(self, tmp_path):
+        index = make_index()
+        film_id = next(iter(FILMS))
+
+        index.replace(film_id, "Космический вестерн про охотника за головами")
+
+        assert len(index) == len(FILMS)
+        assert index.search("космический вестерн про охотника за головами", limit=4, min_score=0.2)[0][0] == film_id
+        assert film_id not in [found for found, _ in index.search("временная петля", limit=4)]
+
+        index.save(tmp_path / "films.idx")
+        loaded = TextIndex.load(tmp_path / "films.idx", max_df=1.0)
+
+        assert len(loaded) == len(FILMS)
+        assert loaded.search("космический вестерн", limit=1) == index.search("космический вестерн", limit=1)
+
+    def test_search_many_matches_search(self):
+        index = make_index()
+        queries = ["игрушки оживают в детской", "компьютерная симуляция"]
+
+        assert index.search_many(queries, limit=3) == [index.search(query, limit=3) for query in queries]
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        index = make_index()
+        path = tmp_path / "films.idx"
+
+        index.save(path)
+        loaded = TextIndex.load(path, max_df=1.0)
+
+        assert len(loaded) == len(index)
+        for query in ["влюблённые на лайнере", "временная петля"]:
+            expected = index.search(query, limit=4)
+            actual = loaded.search(query, limit=4)
+            assert [film_id for film_id, _ in actual] == [film_id for film_id, _ in expected]
+            assert [round(score, 5) for _, score in actual] == [round(score, 5) for _, score in expected]
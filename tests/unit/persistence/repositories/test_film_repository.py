@@ -13,9 +13,23 @@ from backend.domain.user_id import UserId
 from backend.infrastructure.persistence.mappers.film import film_to_orm
 from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.genre import GenreORM
+from backend.infrastructure.persistence.models.user import UserORM
 from backend.infrastructure.persistence.repositories.film import SQLAlchemyFilmRepository
 
 
+def make_film(tmdb_id: int, title: str, description: str | None = None) -> Film:
+    return Film(
+        id=FilmId(uuid.uuid4()),
+        title=title,
+        description=description,
+        country=None,
+        release_year=None,
+        poster_url=None,
+        tmdb_id=tmdb_id,
+        owner_id=None,
+    )
+
+
 class TestSQLAlchemyFilmRepository:
     @pytest.mark.asyncio
     async def test_create(self, db_session: AsyncSession):
@@ -161,4 +175,105 @@ class TestSQLAlchemyFilmRepository:
 
         
         with pytest.raises(FilmNotFoundError):
-            await repo.update(film)
\ No newline at end of file
+            await repo.update(film)
+    @pytest.mark.asyncio
+    async def test_search(self, db_session: AsyncSession):
+        user_id = UserId(uuid.uuid4())
+        db_session.add(UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None))
+        await db_session.flush()
+        for title, release_year, owner_id in [
+            ("Аниматрица", 2003, None),
+            ("Матрица: Перезагрузка", 2003, None),
+            ("Матрица", 1999, None),
+            ("Моя матрица", 2020, user_id),
+        ]:
+            db_session.add(
+                FilmORM(id=uuid.uuid4(), title=title, release_year=release_year, tmdb_id=None, owner_id=owner_id)
+            )
+        await db_session.commit()
+
+        repo = SQLAlchemyFilmRepository(session=db_session)
+
+        films = await repo.search("матрица", limit=10)
+
+        assert [film.title for film in films] == ["Матрица", "Матрица: Перезагрузка", "Аниматрица"]
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids(self, db_session: AsyncSession):
+        films_ids = [FilmId(uuid.uuid4()) for _ in range(3)]
+        for i, film_id in enumerate(films_ids):
+            db_session.add(FilmORM(id=film_id, title=f"Film {i}", tmdb_id=None, owner_id=None))
+        await db_session.commit()
+
+        repo = SQLAlchemyFilmRepository(session=db_session)
+
+        films = await repo.get_by_ids([films_ids[2], FilmId(uuid.uuid4()), films_ids[0]])
+
+        assert [film.id for film in films] == [films_ids[2], films_ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_upsert_many(self, db_session: AsyncSession):
+        repo = SQLAlchemyFilmRepository(session=db_session)
+
+        first = await repo.upsert_many([make_film(1, "Film", "Description"), make_film(1, "Duplicate", None)])
+        await db_session.commit()
+        second = await repo.upsert_many([make_film(2, "Other", None), make_film(1, "Film (updated)", None)])
+        await db_session.commit()
+
+        assert [film.tmdb_id for film in second] == [2, 1]
+        assert second[1].id == first[0].id
+        assert second[1].title == "Film (updated)"
+        assert second[1].description == "Description"
+        result = await db_session.execute(select(FilmORM).where(FilmORM.tmdb_id == 1))
+        assert len(result.scalars().all()) == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_keeps_localized_title(self, db_session: AsyncSession):
+        repo = SQLAlchemyFilmRepository(session=db_session)
+
+        await repo.upsert_many([make_film(1, "Матрица")])
+        await db_session.commit()
+        films = await repo.upsert_many([make_film(1, "The Matrix", "Description")])
+        await db_session.commit()
+
+        assert films[0].title == "Матрица"
+        assert films[0].description == "Description"
+
+    @pytest.mark.asyncio
+    async def test_upsert_many_without_update_keeps_other_film(self, db_session: AsyncSession):
+        repo = SQLAlchemyFilmRepository(session=db_session)
+
+        [stored] = await repo.upsert_many([make_film(1, "Film", "Description")])
+        await db_session.commit()
+        films = await repo.upsert_many(
+            [make_film(1, "Another film"), make_film(2, "New film")], update_existing=False
+        )
+        await db_session.commit()
+
+        assert [film.title for film in films] == ["New film"]
+        result = await db_session.execute(select(FilmORM).where(FilmORM.tmdb_id == 1))
+        orm = result.scalar_one()
+        assert orm.id == stored.id
+        assert orm.title == "Film"
+        assert orm.description == "Description"
+
+    @pytest.mark.asyncio
+    async def test_get_catalog_changes(self, db_session: AsyncSession):
+        repo = SQLAlchemyFilmRepository(session=db_session)
+        first = await repo.upsert_many([make_film(1, "Film"), make_film(2, "Other"), make_film(3, "Third")])
+        await db_session.commit()
+
+        page = await repo.get_catalog_changes(None, limit=2)
+        rest = await repo.get_catalog_changes((page[-1][1], page[-1][0].id), limit=2)
+
+        assert len(page) == 2
+        assert {film.id for film, _ in page + rest} == {film.id for film in first}
+
+        await repo.upsert_many([make_film(2, "Other (updated)")])
+        await db_session.commit()
+        last_updated_at, last_id = rest[-1][1], rest[-1][0].id
+
+        changes = await repo.get_catalog_changes((last_updated_at, last_id), limit=10)
+
+        assert [film.title for film, _ in changes] == ["Other (updated)"]
+        assert changes[0][1] > last_updated_at
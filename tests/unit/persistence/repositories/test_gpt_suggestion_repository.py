@@ -0,0 +1,36 @@
+import datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.domain.cached_suggestions import CachedSuggestions
+from backend.infrastructure.persistence.repositories.gpt_suggestion import SQLAlchemyGPTSuggestionRepository
+
+
+def make_entry(fingerprint: str, band_keys: list[int], created_at: datetime.datetime) -> CachedSuggestions:
+    return CachedSuggestions(
+        fingerprint=fingerprint,
+        signature=[1, 2, 3, 4],
+        band_keys=band_keys,
+        suggestions=[("День сурка", 0.9)],
+        created_at=created_at,
+    )
+
+
+class TestSQLAlchemyGPTSuggestionRepository:
+    @pytest.mark.asyncio
+    async def test_find_candidates_by_fingerprint_or_band_keys(self, db_session: AsyncSession):
+        repo = SQLAlchemyGPTSuggestionRepository(session=db_session)
+        now = datetime.datetime.now(datetime.UTC)
+
+        await repo.save(make_entry("exact", [1, 2], now))
+        await repo.save(make_entry("near", [3, 4], now))
+        await repo.save(make_entry("other", [5, 6], now))
+        await repo.save(make_entry("expired", [3], now - datetime.timedelta(days=30)))
+
+        candidates = await repo.find_candidates(
+            "exact", [4, 7], created_after=now - datetime.timedelta(days=7), limit=10
+        )
+
+        assert sorted(candidate.fingerprint for candidate in candidates) == ["exact", "near"]
+        assert candidates[0].suggestions == [("День сурка", 0.9)]
@@ -0,0 +1,24 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.persistence.repositories.localized_title import SQLAlchemyLocalizedTitleRepository
+
+
+class TestSQLAlchemyLocalizedTitleRepository:
+    @pytest.mark.asyncio
+    async def test_save_many_and_get_many(self, db_session: AsyncSession):
+        repo = SQLAlchemyLocalizedTitleRepository(session=db_session)
+
+        await repo.save_many({603: "Матрица", 604: "Матрица: Перезагрузка"})
+        titles = await repo.get_many([603, 604, 605])
+
+        assert titles == {603: "Матрица", 604: "Матрица: Перезагрузка"}
+
+    @pytest.mark.asyncio
+    async def test_save_many_overwrites_existing(self, db_session: AsyncSession):
+        repo = SQLAlchemyLocalizedTitleRepository(session=db_session)
+
+        await repo.save_many({603: "The Matrix"})
+        await repo.save_many({603: "Матрица"})
+
+        assert await repo.get_many([603]) == {603: "Матрица"}
@@ -11,6 +11,7 @@ from backend.domain.mix import Mix
 from backend.domain.mix_id import MixId
 from backend.domain.mix_item import MixItem
 from backend.infrastructure.persistence.mappers.mix import mix_to_orm
+from backend.infrastructure.persistence.models.film import FilmORM
 from backend.infrastructure.persistence.models.mix import MixORM
 from backend.infrastructure.persistence.models.mix_item import MixItemORM
 from backend.infrastructure.persistence.repositories.mix import SQLAlchemyMixRepository
@@ -208,3 +209,47 @@ class TestSQLAlchemyMixRepository:
         )
         db_item = result.scalars().first()
         assert db_item is None
+
+    @pytest.mark.asyncio
+    async def test_get_films_for_mix(self, db_session: AsyncSession):
+        mix_id = MixId(uuid.uuid4())
+        db_session.add(MixORM(id=mix_id, title="Action Movies", color1="", color2="", color3=""))
+
+        now = datetime.datetime.now(datetime.UTC)
+        films = [
+            FilmORM(
+                id=uuid.uuid4(),
+                title=f"Film {i}",
+                description=None,
+                country=None,
+                release_year=None,
+                poster_url=None,
+                tmdb_id=None,
+                owner_id=None,
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(films)
+        await db_session.flush()
+        db_session.add_all([
+            MixItemORM(mix_id=mix_id, film_id=film.id, added_at=now + datetime.timedelta(minutes=i))
+            for i, film in enumerate(films)
+        ])
+        await db_session.commit()
+
+        repo = SQLAlchemyMixRepository(session=db_session)
+
+        first_page = await repo.get_films_for_mix(mix_id, limit=2)
+        second_page = await repo.get_films_for_mix(mix_id, limit=2, cursor=first_page.next_cursor)
+
+        assert [film.title for film in first_page.films] == ["Film 2", "Film 1"]
+        assert first_page.next_cursor is not None
+        assert [film.title for film in second_page.films] == ["Film 0"]
+        assert second_page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_get_films_for_mix_not_found(self, db_session: AsyncSession):
+        repo = SQLAlchemyMixRepository(session=db_session)
+
+        with pytest.raises(MixNotFoundError):
+            await repo.get_films_for_mix(MixId(uuid.uuid4()))
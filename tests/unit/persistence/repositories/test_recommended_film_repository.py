@@ -0,0 +1,55 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.domain.film_id import FilmId
+from backend.domain.recommended_film import RecommendedFilm
+from backend.domain.user_id import UserId
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.user import UserORM
+from backend.infrastructure.persistence.repositories.recommended_film import SQLAlchemyRecommendedFilmRepository
+
+
+class TestSQLAlchemyRecommendedFilmRepository:
+    @pytest.mark.asyncio
+    async def test_get_recent_tmdb_ids(self, db_session: AsyncSession):
+        user_id = UserId(uuid.uuid4())
+        other_user_id = UserId(uuid.uuid4())
+        db_session.add_all([
+            UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None),
+            UserORM(id=other_user_id, username="other", email=None, hashed_password=None, telegram_id=None),
+        ])
+        films = {tmdb_id: FilmId(uuid.uuid4()) for tmdb_id in (101, 102, 103, 104)}
+        local_film_id = FilmId(uuid.uuid4())
+        db_session.add_all([
+            *(FilmORM(id=film_id, title="Film", tmdb_id=tmdb_id, owner_id=None) for tmdb_id, film_id in films.items()),
+            FilmORM(id=local_film_id, title="Local", tmdb_id=None, owner_id=None),
+        ])
+        await db_session.flush()
+
+        now = datetime.datetime.now(datetime.UTC)
+        repo = SQLAlchemyRecommendedFilmRepository(session=db_session)
+        for user, film_id, hours_ago in [
+            (user_id, films[101], 1),
+            (user_id, films[102], 3),
+            (user_id, films[101], 5),
+            (user_id, films[103], 48),
+            (user_id, local_film_id, 2),
+            (other_user_id, films[104], 1),
+        ]:
+            await repo.create(
+                RecommendedFilm(
+                    id=uuid.uuid4(),
+                    user_id=user,
+                    film_id=film_id,
+                    recommended_at=now - datetime.timedelta(hours=hours_ago),
+                )
+            )
+        await db_session.commit()
+
+        threshold = now - datetime.timedelta(hours=24)
+
+        assert await repo.get_recent_tmdb_ids(user_id, threshold, limit=10) == [101, 102]
+        assert await repo.get_recent_tmdb_ids(user_id, threshold, limit=1) == [101]
@@ -12,7 +12,11 @@ from backend.domain.watchlist import Watchlist
 from backend.domain.watchlist_id import WatchlistId
 from backend.domain.watchlist_item import WatchlistItem
 from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.persistence.library_cache import LibraryCache
 from backend.infrastructure.persistence.mappers.watchlist import watchlist_to_orm
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.recommended_film import RecommendedFilmORM
+from backend.infrastructure.persistence.models.user import UserORM
 from backend.infrastructure.persistence.models.watchlist import WatchlistORM
 from backend.infrastructure.persistence.models.watchlist_item import WatchlistItemORM
 from backend.infrastructure.persistence.repositories.watchlist import SQLAlchemyWatchlistRepository
@@ -238,4 +242,152 @@ class TestSQLAlchemyWatchlistRepository:
 
         assert result.id == watchlist_id
         assert result.type == WatchlistType.liked
-        assert result.user_id == user_id#.*$
\ No newline at end of file
+        assert result.user_id == user_id#.*$
+
+    @pytest.mark.asyncio
+    async def test_get_common_types_for_films(self, db_session: AsyncSession):
+        user_id = UserId(uuid.uuid4())
+        db_session.add(UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None))
+        film_id1 = FilmId(uuid.uuid4())
+        film_id2 = FilmId(uuid.uuid4())
+        film_id3 = FilmId(uuid.uuid4())
+
+        liked = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Liked", type=WatchlistType.liked, color1="", color2="", color3=""
+        )
+        wish = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Wish", type=WatchlistType.wish, color1="", color2="", color3=""
+        )
+        custom = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Custom", type=WatchlistType.custom, color1="", color2="", color3=""
+        )
+        db_session.add_all([liked, wish, custom])
+        db_session.add_all([
+            FilmORM(id=film_id, title="Film", tmdb_id=None, owner_id=None) for film_id in (film_id1, film_id2, film_id3)
+        ])
+
+        now = datetime.datetime.now(datetime.UTC)
+        db_session.add_all([
+            WatchlistItemORM(watchlist_id=liked.id, film_id=film_id1, added_at=now),
+            WatchlistItemORM(watchlist_id=wish.id, film_id=film_id1, added_at=now),
+            WatchlistItemORM(watchlist_id=custom.id, film_id=film_id2, added_at=now),
+        ])
+        await db_session.commit()
+
+        repo = SQLAlchemyWatchlistRepository(session=db_session)
+
+        types_by_film = await repo.get_common_types_for_films(user_id, [film_id1, film_id2, film_id3])
+
+        assert types_by_film.get(film_id1) == {WatchlistType.liked, WatchlistType.wish}
+        assert not types_by_film.get(film_id2)
+        assert not types_by_film.get(film_id3)
+
+    @pytest.mark.asyncio
+    async def test_library_cache_sees_items_after_commit(self, db_session: AsyncSession):
+        user_id = UserId(uuid.uuid4())
+        film_id = FilmId(uuid.uuid4())
+        db_session.add(UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None))
+        liked = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Liked", type=WatchlistType.liked, color1="", color2="", color3=""
+        )
+        db_session.add_all([liked, FilmORM(id=film_id, title="Film", tmdb_id=None, owner_id=None)])
+        await db_session.commit()
+
+        library_cache = LibraryCache()
+        repo = SQLAlchemyWatchlistRepository(session=db_session, library_cache=library_cache)
+        assert await repo.get_common_types_for_films(user_id, [film_id]) == {}
+
+        now = datetime.datetime.now(datetime.UTC)
+        await repo.add_item(WatchlistItem(watchlist_id=WatchlistId(liked.id), film_id=film_id, added_at=now))
+        assert library_cache.get_types_for_films(user_id, [film_id]) == {}
+
+        await db_session.commit()
+        assert library_cache.get_types_for_films(user_id, [film_id]) == {film_id: {WatchlistType.liked}}
+
+    @pytest.mark.asyncio
+    async def test_get_films_for_watchlist(self, db_session: AsyncSession):
+        watchlist_id = WatchlistId(uuid.uuid4())
+        user_id = UserId(uuid.uuid4())
+        db_session.add(UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None))
+        db_session.add(
+            WatchlistORM(
+                id=watchlist_id,
+                user_id=user_id,
+                title="Test Watchlist",
+                type=WatchlistType.watched,
+                color1="",
+                color2="",
+                color3="",
+            )
+        )
+
+        now = datetime.datetime.now(datetime.UTC)
+        films = [
+            FilmORM(
+                id=uuid.uuid4(),
+                title=f"Film {i}",
+                description=None,
+                country=None,
+                release_year=None,
+                poster_url=None,
+                tmdb_id=None,
+                owner_id=None,
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(films)
+        await db_session.flush()
+        db_session.add_all([
+            WatchlistItemORM(watchlist_id=watchlist_id, film_id=film.id, added_at=now + datetime.timedelta(minutes=i))
+            for i, film in enumerate(films)
+        ])
+        await db_session.commit()
+
+        repo = SQLAlchemyWatchlistRepository(session=db_session)
+
+        result = await repo.get_films_for_watchlist(watchlist_id)
+        first_page = await repo.get_films_for_watchlist(watchlist_id, limit=1)
+        second_page = await repo.get_films_for_watchlist(watchlist_id, limit=1, cursor=first_page.next_cursor)
+
+        assert [film.title for film in result.films] == ["Film 2", "Film 1", "Film 0"]
+        assert result.next_cursor is None
+        assert [film.title for film in first_page.films] == ["Film 2"]
+        assert [film.title for film in second_page.films] == ["Film 1"]
+
+    @pytest.mark.asyncio
+    async def test_get_random_film_not_recommended_since(self, db_session: AsyncSession):
+        user_id = UserId(uuid.uuid4())
+        db_session.add(UserORM(id=user_id, username="user", email=None, hashed_password=None, telegram_id=None))
+        wish = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Wish", type=WatchlistType.wish, color1="", color2="", color3=""
+        )
+        liked = WatchlistORM(
+            id=uuid.uuid4(), user_id=user_id, title="Liked", type=WatchlistType.liked, color1="", color2="", color3=""
+        )
+        films = [FilmORM(id=uuid.uuid4(), title=f"Film {i}", tmdb_id=None, owner_id=None) for i in range(4)]
+        db_session.add_all([wish, liked, *films])
+        await db_session.flush()
+
+        now = datetime.datetime.now(datetime.UTC)
+        db_session.add_all([
+            WatchlistItemORM(watchlist_id=wish.id, film_id=films[0].id, added_at=now),
+            WatchlistItemORM(watchlist_id=wish.id, film_id=films[1].id, added_at=now),
+            WatchlistItemORM(watchlist_id=wish.id, film_id=films[2].id, added_at=now),
+            WatchlistItemORM(watchlist_id=liked.id, film_id=films[3].id, added_at=now),
+            RecommendedFilmORM(id=uuid.uuid4(), user_id=user_id, film_id=films[0].id, recommended_at=now),
+            RecommendedFilmORM(
+                id=uuid.uuid4(), user_id=user_id, film_id=films[1].id, recommended_at=now - datetime.timedelta(days=2)
+            ),
+        ])
+        await db_session.commit()
+
+        repo = SQLAlchemyWatchlistRepository(session=db_session)
+        since = now - datetime.timedelta(hours=24)
+
+        picked = {
+            (await repo.get_random_film_not_recommended_since(WatchlistType.wish, user_id, since)).title
+            for _ in range(30)
+        }
+
+        assert picked == {"Film 1", "Film 2"}
+        assert await repo.get_random_film_not_recommended_since(WatchlistType.wish, UserId(uuid.uuid4()), since) is None
@@ -0,0 +1,54 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.infrastructure.persistence.catalog_ingest import ingest_films, load_genre_ids
+from backend.infrastructure.persistence.models.film import FilmORM
+from backend.infrastructure.persistence.models.film_genre import FilmGenre
+from backend.infrastructure.persistence.models.genre import GenreORM
+
+
+class TestCatalogIngest:
+    @pytest.mark.asyncio
+    async def test_ingest_films_is_idempotent(self, db_session: AsyncSession):
+        genre_id = uuid.uuid4()
+        db_session.add(GenreORM(id=genre_id, name="Фантастика"))
+        await db_session.commit()
+        genre_ids = await load_genre_ids(db_session)
+        items = [
+            {"title": "Матрица", "release_year": 1999, "tmdb_id": 603, "genres": [{"name": "фантастика"}]},
+            {"title": "Матрица", "release_year": 1999, "tmdb_id": 603, "genres": []},
+            {"title": "Без идентификатора", "tmdb_id": None},
+        ]
+
+        first = await ingest_films(db_session, items, genre_ids)
+        second = await ingest_films(db_session, items, genre_ids)
+
+        assert first == 1
+        assert second == 0
+        film = (await db_session.execute(select(FilmORM).where(FilmORM.tmdb_id == 603))).scalar_one()
+        film_genres = (await db_session.execute(select(FilmGenre).where(FilmGenre.film_id == film.id))).scalars().all()
+        assert [film_genre.genre_id for film_genre in film_genres] == [genre_id]
+
+    @pytest.mark.asyncio
+    async def test_ingest_skips_films_saved_elsewhere(self, db_session: AsyncSession):
+        genre_id = uuid.uuid4()
+        existing_id = uuid.uuid4()
+        db_session.add(GenreORM(id=genre_id, name="Драма"))
+        db_session.add(FilmORM(id=existing_id, title="Титаник", tmdb_id=597, owner_id=None))
+        await db_session.commit()
+        genre_ids = await load_genre_ids(db_session)
+        items = [
+            {"title": "Титаник", "tmdb_id": 597, "genres": [{"name": "драма"}]},
+            {"title": "Форрест Гамп", "tmdb_id": 13, "genres": [{"name": "драма"}]},
+        ]
+
+        inserted = await ingest_films(db_session, items, genre_ids)
+
+        assert inserted == 1
+        result = await db_session.execute(select(FilmGenre).where(FilmGenre.genre_id == genre_id))
+        film_genres = result.scalars().all()
+        assert existing_id not in [film_genre.film_id for film_genre in film_genres]
+        assert len(film_genres) == 1
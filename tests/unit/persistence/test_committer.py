@@ -15,4 +15,13 @@ class TestSQLAlchemyCommitter:
         await committer.commit()
 
         
-        mock_session.commit.assert_called_once()
\ No newline at end of file
+        mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rollback(self):
+        mock_session = AsyncMock()
+        committer = SQLAlchemyCommitter(session=mock_session)
+
+        await committer.rollback()
+
+        mock_session.rollback.assert_awaited_once()
\ No newline at end of file
@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from backend.application.errors import GenreNotFoundError
+from backend.domain.genre_id import GenreId
+from backend.domain.mood_id import MoodId
+from backend.infrastructure.persistence.genre_mood_catalog import GenreMoodCatalog
+from backend.infrastructure.persistence.models.catalog_version import CatalogVersionORM
+from backend.infrastructure.persistence.models.genre import GenreORM
+from backend.infrastructure.persistence.models.genre_mood import GenreMoodORM
+from backend.infrastructure.persistence.models.mood import MoodORM
+from backend.infrastructure.persistence.repositories.genre import SQLAlchemyGenreRepository
+
+
+class TestGenreMoodCatalog:
+    @pytest.mark.asyncio
+    async def test_loads_catalog_and_reloads_on_version_change(self, engine: AsyncEngine, db_session: AsyncSession):
+        action_id, drama_id = GenreId(uuid.uuid4()), GenreId(uuid.uuid4())
+        mood_id = MoodId(uuid.uuid4())
+        await db_session.execute(delete(CatalogVersionORM))
+        db_session.add_all([
+            CatalogVersionORM(id=1, version=1),
+            GenreORM(id=action_id, name="Боевик"),
+            GenreORM(id=drama_id, name="Драма"),
+            MoodORM(id=mood_id, name="Бодрое"),
+            GenreMoodORM(genre_id=action_id, mood_id=mood_id),
+        ])
+        await db_session.commit()
+
+        catalog = GenreMoodCatalog(async_sessionmaker(engine))
+
+        assert await catalog.refresh()
+        assert catalog.version == 1
+        assert catalog.expand_moods([mood_id]) == {action_id}
+        assert catalog.get_genre_id_by_name("БОЕВИК") == action_id
+        assert [genre.id for genre in catalog.list_genres([mood_id])] == [action_id]
+        assert catalog.get_mood(mood_id).name == "Бодрое"
+
+        db_session.add(GenreMoodORM(genre_id=drama_id, mood_id=mood_id))
+        await db_session.commit()
+
+        assert not await catalog.refresh()
+        assert catalog.expand_moods([mood_id]) == {action_id}
+
+        (await db_session.get(CatalogVersionORM, 1)).version = 2
+        await db_session.commit()
+
+        assert await catalog.refresh()
+        assert catalog.expand_moods([mood_id]) == {action_id, drama_id}
+
+    @pytest.mark.asyncio
+    async def test_genre_repository_reads_from_catalog(self, engine: AsyncEngine, db_session: AsyncSession):
+        genre_id = GenreId(uuid.uuid4())
+        db_session.add(GenreORM(id=genre_id, name="Мюзикл"))
+        await db_session.commit()
+        catalog = GenreMoodCatalog(async_sessionmaker(engine))
+        await catalog.refresh()
+
+        repo = SQLAlchemyGenreRepository(session=db_session, catalog=catalog)
+
+        assert (await repo.get_by_id(genre_id)).name == "Мюзикл"
+        with pytest.raises(GenreNotFoundError):
+            await repo.get_by_id(GenreId(uuid.uuid4()))
@@ -0,0 +1,78 @@
+import uuid
+
+from backend.domain.film_id import FilmId
+from backend.domain.user_id import UserId
+from backend.domain.watchlist_type import WatchlistType
+from backend.infrastructure.persistence.library_cache import LibraryCache
+
+
+class TestLibraryCache:
+    def test_miss_returns_none(self):
+        cache = LibraryCache()
+
+        assert cache.get_types_for_films(UserId(uuid.uuid4()), [FilmId(uuid.uuid4())]) is None
+
+    def test_put_and_lookup(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+        film_id1 = FilmId(uuid.uuid4())
+        film_id2 = FilmId(uuid.uuid4())
+        cache.put(user_id, [(film_id1, WatchlistType.liked), (film_id1, WatchlistType.watched)])
+
+        types_by_film = cache.get_types_for_films(user_id, [film_id1, film_id2])
+
+        assert types_by_film == {film_id1: {WatchlistType.liked, WatchlistType.watched}}
+
+    def test_write_through(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+        film_id = FilmId(uuid.uuid4())
+        cache.put(user_id, [])
+
+        cache.add(user_id, WatchlistType.wish, film_id)
+        assert cache.get_types_for_films(user_id, [film_id]) == {film_id: {WatchlistType.wish}}
+
+        cache.discard(user_id, WatchlistType.wish, film_id)
+        assert cache.get_types_for_films(user_id, [film_id]) == {}
+
+    def test_write_through_ignores_uncached_users(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+
+        cache.add(user_id, WatchlistType.wish, FilmId(uuid.uuid4()))
+
+        assert cache.get_types_for_films(user_id, []) is None
+
+    def test_invalidate(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+        cache.put(user_id, [])
+
+        cache.invalidate(user_id)
+
+        assert cache.get_types_for_films(user_id, []) is None
+
+    def test_put_loaded_before_write_is_dropped(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+        film_id = FilmId(uuid.uuid4())
+        cache.put(user_id, [])
+        generation = cache.generation()
+
+        cache.invalidate(user_id)
+        cache.add(user_id, WatchlistType.wish, film_id)
+        cache.put(user_id, [], generation)
+
+        assert cache.get_types_for_films(user_id, [film_id]) is None
+
+    def test_put_loaded_after_write_is_stored(self):
+        cache = LibraryCache()
+        user_id = UserId(uuid.uuid4())
+        film_id = FilmId(uuid.uuid4())
+        cache.add(user_id, WatchlistType.wish, film_id)
+        generation = cache.generation()
+
+        cache.add(UserId(uuid.uuid4()), WatchlistType.wish, film_id)
+        cache.put(user_id, [(film_id, WatchlistType.wish)], generation)
+
+        assert cache.get_types_for_films(user_id, [film_id]) == {film_id: {WatchlistType.wish}}
@@ -0,0 +1,68 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.domain.film import Film
+from backend.domain.film_id import FilmId
+from backend.domain.user_id import UserId
+from backend.domain.watchlist_type import WatchlistType
+from backend.presentation.film_enricher import FilmEnricher
+
+
+def make_film(title: str) -> Film:
+    return Film(
+        id=FilmId(uuid.uuid4()),
+        title=title,
+        description=None,
+        country=None,
+        release_year=None,
+        poster_url=None,
+        tmdb_id=None,
+        owner_id=None,
+    )
+
+
+class TestFilmEnricher:
+    @pytest.mark.asyncio
+    async def test_enrich_uses_single_lookup(self):
+        user_id = UserId(uuid.uuid4())
+        films = [make_film(f"Film {i}") for i in range(20)]
+        watchlist_repo = AsyncMock()
+        watchlist_repo.get_common_types_for_films.return_value = {
+            films[0].id: {WatchlistType.liked, WatchlistType.watched},
+            films[1].id: {WatchlistType.wish},
+        }
+        enricher = FilmEnricher(watchlist_repo)
+
+        responses = await enricher.enrich(films, user_id)
+
+        watchlist_repo.get_common_types_for_films.assert_awaited_once_with(user_id, [f.id for f in films])
+        assert [r.id for r in responses] == [f.id for f in films]
+        assert responses[0].is_liked
+        assert responses[0].is_watched
+        assert not responses[0].is_wish
+        assert responses[1].is_wish
+        assert not any(r.is_liked or r.is_wish or r.is_watched for r in responses[2:])
+
+    @pytest.mark.asyncio
+    async def test_enrich_anonymous_skips_lookup(self):
+        watchlist_repo = AsyncMock()
+        enricher = FilmEnricher(watchlist_repo)
+
+        responses = await enricher.enrich([make_film("Film")], None)
+
+        watchlist_repo.get_common_types_for_films.assert_not_awaited()
+        assert not responses[0].is_liked
+
+    @pytest.mark.asyncio
+    async def test_enrich_one(self):
+        film = make_film("Film")
+        watchlist_repo = AsyncMock()
+        watchlist_repo.get_common_types_for_films.return_value = {film.id: {WatchlistType.wish}}
+        enricher = FilmEnricher(watchlist_repo)
+
+        response = await enricher.enrich_one(film, UserId(uuid.uuid4()))
+
+        assert response.id == film.id
+        assert response.is_wish
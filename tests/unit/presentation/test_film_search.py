@@ -0,0 +1,113 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.domain.film import Film
+from backend.domain.film_id import FilmId
+from backend.presentation.controllers.film import FilmController, SearchProgress
+
+
+def make_item(tmdb_id: int) -> dict:
+    return {
+        "title": f"Film {tmdb_id}",
+        "description": "",
+        "country": None,
+        "release_year": None,
+        "poster_url": None,
+        "tmdb_id": tmdb_id,
+    }
+
+
+def make_tier(tmdb_ids: list[int], delay: float = 0.0):
+    async def tier(emit):
+        await asyncio.sleep(delay)
+        emit([make_item(tmdb_id) for tmdb_id in tmdb_ids])
+
+    return tier
+
+
+class TestSearchTiers:
+    @pytest.fixture
+    def controller(self):
+        return FilmController(owner=MagicMock())
+
+    @pytest.fixture
+    def film_repo(self):
+        film_repo = AsyncMock()
+        film_repo.upsert_many.side_effect = lambda films, update_existing=True: list(films)
+        return film_repo
+
+    async def collect(self, controller, tiers, fallback, film_repo, progress, local_films=(), limit=10):
+        films = controller._search_tiers(list(local_films), tiers, fallback, limit, film_repo, AsyncMock(), progress)
+        return [film.tmdb_id async for film in films]
+
+    @pytest.mark.asyncio
+    async def test_fallback_results_follow_other_tiers(self, controller, film_repo):
+        progress = SearchProgress()
+        local_film = Film(
+            id=FilmId(uuid.uuid4()),
+            title="Local",
+            description=None,
+            country=None,
+            release_year=None,
+            poster_url=None,
+            tmdb_id=1,
+            owner_id=None,
+        )
+
+        tmdb_ids = await self.collect(
+            controller,
+            [make_tier([2, 3], delay=0.02), make_tier([1, 4])],
+            make_tier([5, 2]),
+            film_repo,
+            progress,
+            local_films=[local_film],
+        )
+
+        assert tmdb_ids == [1, 4, 2, 3, 5]
+        assert progress.timed_out is False
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_waiting_for_slow_tiers(self, controller, film_repo):
+        controller.search_deadline = 0.05
+        progress = SearchProgress()
+
+        tmdb_ids = await asyncio.wait_for(
+            self.collect(controller, [make_tier([1]), make_tier([2], delay=5)], make_tier([3]), film_repo, progress),
+            timeout=1,
+        )
+
+        assert tmdb_ids == [1]
+        assert progress.timed_out is True
+
+    @pytest.mark.asyncio
+    async def test_failed_save_is_rolled_back_and_later_tiers_are_saved(self, controller, film_repo):
+        def upsert_many(films, update_existing=True):
+            if any(film.tmdb_id == 1 for film in films):
+                raise RuntimeError("bad row")
+            return list(films)
+
+        film_repo.upsert_many.side_effect = upsert_many
+        committer = AsyncMock()
+
+        films = controller._search_tiers(
+            [], [make_tier([1]), make_tier([2], delay=0.02)], None, 10, film_repo, committer
+        )
+        tmdb_ids = [film.tmdb_id async for film in films]
+
+        assert tmdb_ids == [2]
+        committer.rollback.assert_awaited_once()
+        committer.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_limit_reached_is_not_a_timeout(self, controller, film_repo):
+        progress = SearchProgress()
+
+        tmdb_ids = await self.collect(
+            controller, [make_tier([1, 2, 3])], None, film_repo, progress, limit=2
+        )
+
+        assert tmdb_ids == [1, 2]
+        assert progress.timed_out is False
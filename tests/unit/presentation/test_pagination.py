@@ -0,0 +1,39 @@
+import base64
+import datetime
+import uuid
+
+import pytest
+from litestar.exceptions import ClientException
+
+from backend.domain.film_id import FilmId
+from backend.domain.item_cursor import ItemCursor
+from backend.presentation.pagination import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = ItemCursor(
+            added_at=datetime.datetime(2025, 3, 4, 12, 30, 15, 123456, tzinfo=datetime.UTC),
+            film_id=FilmId(uuid.uuid4()),
+        )
+
+        token = encode_cursor(cursor)
+
+        assert "|" not in token
+        assert decode_cursor(token) == cursor
+
+    def test_empty_token(self):
+        assert decode_cursor(None) is None
+        assert decode_cursor("") is None
+
+    @pytest.mark.parametrize("token", ["not-a-cursor", "%%%", "MjAyNS0wMy0wNHxub3QtYS11dWlk"])
+    def test_invalid_token(self, token):
+        with pytest.raises(ClientException):
+            decode_cursor(token)
+
+    def test_naive_timestamp_is_rejected(self):
+        raw = f"2025-03-04T12:30:15|{uuid.uuid4()}"
+        token = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+        with pytest.raises(ClientException):
+            decode_cursor(token)
@@ -0,0 +1,42 @@
+import json
+import uuid
+from typing import Any
+
+from litestar import Request, get
+from litestar.response import Stream
+from litestar.testing import create_test_client
+
+from backend.domain.film_id import FilmId
+from backend.presentation import schemas
+from backend.presentation.streaming import NDJSON_MEDIA_TYPE, films_stream_response
+
+FILMS = [schemas.FilmResponse(id=FilmId(uuid.uuid4()), title=f"Film {i}", description="") for i in range(3)]
+
+
+async def produce_films():
+    for film in FILMS:
+        yield film
+
+
+@get("/films")
+async def stream_films(request: Request[Any, Any, Any]) -> Stream:
+    return films_stream_response(request, produce_films())
+
+
+class TestFilmsStreamResponse:
+    def test_streams_ndjson_by_default(self):
+        with create_test_client([stream_films]) as client:
+            response = client.get("/films")
+
+        assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+        lines = response.text.splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Film 0", "Film 1", "Film 2"]
+
+    def test_streams_server_sent_events(self):
+        with create_test_client([stream_films]) as client:
+            response = client.get("/films", headers={"Accept": "text/event-stream"})
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        data = [line.removeprefix("data: ") for line in response.text.splitlines() if line.startswith("data: ")]
+        assert [json.loads(item)["id"] for item in data] == [str(film.id) for film in FILMS]
+        assert response.text.count("event: film") == len(FILMS)